@@ -47,9 +47,13 @@ class Show(Asset):
     class_priority = 100
     pool_config_section = 'show_pools'
     asset_group_class = ShowPool
+    config_file_type = 'show'
 
     __slots__ = ["_autoplay_settings", "tokens", "token_values", "token_keys", "name", "total_steps", "show_steps",
-                 "loaded", "mode"]
+                 "loaded", "mode", "_step_tokens", "_resolved_steps"]
+
+    # maximum number of steps with resolved tokens which are cached per show
+    max_resolved_steps = 1000
 
     # pylint: disable-msg=too-many-arguments
     def __init__(self, machine, name, file=None, config=None, data=None):
@@ -63,6 +67,8 @@ class Show(Asset):
         self.tokens = set()
         self.token_values = dict()
         self.token_keys = dict()
+        self._step_tokens = dict()
+        self._resolved_steps = dict()
 
         self.name = name
         self.total_steps = None
@@ -114,6 +120,7 @@ class Show(Asset):
     def _do_load_show(self, data):
         # do not use machine or the logger here because it will block
         self.show_steps = list()
+        self._resolved_steps = dict()
 
         if not data and self.file:
             data = self.load_show_from_disk()
@@ -204,9 +211,112 @@ class Show(Asset):
 
     def _do_unload(self):
         self.show_steps = None
+        self._resolved_steps = dict()
 
     def _get_tokens(self):
         self._walk_show(self.show_steps)
+        self._compile_step_tokens()
+
+    def _compile_step_tokens(self):
+        """Group token paths by step.
+
+        Steps without tokens are shared by all running instances of this show. Only steps with tokens are copied
+        (once per set of show_tokens) when they are played.
+        """
+        self._step_tokens = dict()
+        for token, paths in self.token_values.items():
+            for path in paths:
+                token_values = self._step_tokens.setdefault(path[0], (dict(), dict()))[0]
+                token_values.setdefault(token, list()).append(path[1:])
+
+        for token, paths in self.token_keys.items():
+            for path in paths:
+                token_keys = self._step_tokens.setdefault(path[0], (dict(), dict()))[1]
+                token_keys.setdefault(token, list()).append(path[1:])
+
+    def get_show_step(self, step_index: int, show_tokens: dict = None) -> dict:
+        """Return a show step with all tokens replaced.
+
+        The returned step is shared and must not be modified.
+        """
+        step_tokens = self._step_tokens.get(step_index)
+        if not step_tokens or not show_tokens:
+            return self.show_steps[step_index]
+
+        try:
+            cache_key = (step_index, frozenset(show_tokens.items()))
+        except TypeError:
+            # tokens contain unhashable values. do not cache this step
+            return self._resolve_step(step_index, step_tokens, show_tokens)
+
+        try:
+            return self._resolved_steps[cache_key]
+        except KeyError:
+            pass
+
+        if len(self._resolved_steps) >= self.max_resolved_steps:
+            self._resolved_steps = dict()
+
+        step = self._resolve_step(step_index, step_tokens, show_tokens)
+        self._resolved_steps[cache_key] = step
+        return step
+
+    def _resolve_step(self, step_index, step_tokens, show_tokens) -> dict:
+        token_values, token_keys = step_tokens
+        step = self.get_show_steps(self.show_steps[step_index])
+        self._replace_token_values(step, token_values, show_tokens)
+        self._replace_token_keys(step, token_keys, show_tokens)
+        return step
+
+    @staticmethod
+    def _replace_token_values(step, token_values, show_tokens):
+        for token, replacement in show_tokens.items():
+            if token in token_values:
+                for token_path in token_values[token]:
+                    target = step
+                    for x in token_path[:-1]:
+                        target = target[x]
+
+                    if isinstance(target[token_path[-1]], RuntimeToken):
+                        target[token_path[-1]] = target[token_path[-1]].validator_function(replacement, None)
+                    elif target[token_path[-1]] == "(" + token + ")":
+                        target[token_path[-1]] = replacement
+                    else:
+                        target[token_path[-1]] = target[token_path[-1]].replace("(" + token + ")", replacement)
+
+    @staticmethod
+    def _replace_token_keys(step, token_keys, show_tokens):
+        keys_replaced = dict()
+        # pylint: disable-msg=too-many-nested-blocks
+        for token, replacement in show_tokens.items():
+            if token in token_keys:
+                key_name = '({})'.format(token)
+                for token_path in token_keys[token]:
+                    target = step
+                    token_str = ""
+                    for x in token_path[:-1]:
+                        if token_str in keys_replaced:
+                            x = keys_replaced[token_str + str(x) + "-"]
+                        token_str += str(x) + "-"
+
+                        target = target[x]
+                    use_string_replace = bool(token_path[-1] != "(" + token + ")")
+
+                    final_key = token_path[-1]
+                    # check if key has been replaced before
+                    final_key = keys_replaced.get(final_key, final_key)
+
+                    if use_string_replace:
+                        replaced_key = final_key.replace("(" + token + ")", replacement)
+                    else:
+                        replaced_key = replacement
+
+                    if final_key in target:
+                        target[replaced_key] = target.pop(final_key)
+                    else:
+                        raise KeyError("Could not find token {} ({}) in {}".format(final_key, key_name, target))
+
+                    keys_replaced[token_str] = replaced_key
 
     def _walk_show(self, data, path=None, list_index=None):
         # walks a list of dicts, checking tokens
@@ -279,7 +389,7 @@ class Show(Asset):
                          start_step=None) -> "RunningShow":
         """Play this show with config."""
         if self.loaded:
-            show_steps = self.get_show_steps()
+            show_steps = self.show_steps
         else:
             show_steps = False
 
@@ -459,7 +569,7 @@ class RunningShow:
         """
         del show
         self._show_loaded = True
-        self.show_steps = self.show.get_show_steps()
+        self.show_steps = self.show.show_steps
         self._start_play()
 
     def _start_play(self):
@@ -475,19 +585,14 @@ class RunningShow:
         else:
             self.next_step_index = 0
 
-        if self.show_config.show_tokens and self.show.tokens:
-            self._replace_token_values(**self.show_config.show_tokens)
-            self._replace_token_keys(**self.show_config.show_tokens)
-
         # Figure out the show start time
         if self.show_config.sync_ms:
             # calculate next step based on synchronized start time
             self.next_step_time += (self.show_config.sync_ms / 1000.0) - (self.next_step_time %
                                                                           (self.show_config.sync_ms / 1000.0))
-            # but wait relative to real time
-            delay_secs = self.next_step_time - self.machine.clock.get_time()
-            self._delay_handler = self.machine.clock.schedule_once(
-                self._start_now, delay_secs)
+            # run together with all other shows synced to this time
+            self._delay_handler = self.machine.show_controller.schedule_show_step(self, self._start_now,
+                                                                                  self.next_step_time)
         else:  # run now
             self._start_now()
 
@@ -502,55 +607,6 @@ class RunningShow:
         """Return str representation."""
         return 'Running Show Instance: "{}" {} {}'.format(self.name, self.show_config.show_tokens, self.next_step_index)
 
-    def _replace_token_values(self, **kwargs):
-
-        for token, replacement in kwargs.items():
-            if token in self.show.token_values:
-                for token_path in self.show.token_values[token]:
-                    target = self.show_steps
-                    for x in token_path[:-1]:
-                        target = target[x]
-
-                    if isinstance(target[token_path[-1]], RuntimeToken):
-                        target[token_path[-1]] = target[token_path[-1]].validator_function(replacement, None)
-                    elif target[token_path[-1]] == "(" + token + ")":
-                        target[token_path[-1]] = replacement
-                    else:
-                        target[token_path[-1]] = target[token_path[-1]].replace("(" + token + ")", replacement)
-
-    def _replace_token_keys(self, **kwargs):
-        keys_replaced = dict()
-        # pylint: disable-msg=too-many-nested-blocks
-        for token, replacement in kwargs.items():
-            if token in self.show.token_keys:
-                key_name = '({})'.format(token)
-                for token_path in self.show.token_keys[token]:
-                    target = self.show_steps
-                    token_str = ""
-                    for x in token_path[:-1]:
-                        if token_str in keys_replaced:
-                            x = keys_replaced[token_str + str(x) + "-"]
-                        token_str += str(x) + "-"
-
-                        target = target[x]
-                    use_string_replace = bool(token_path[-1] != "(" + token + ")")
-
-                    final_key = token_path[-1]
-                    # check if key has been replaced before
-                    final_key = keys_replaced.get(final_key, final_key)
-
-                    if use_string_replace:
-                        replaced_key = final_key.replace("(" + token + ")", replacement)
-                    else:
-                        replaced_key = replacement
-
-                    if final_key in target:
-                        target[replaced_key] = target.pop(final_key)
-                    else:
-                        raise KeyError("Could not find token {} ({}) in {}".format(final_key, key_name, target))
-
-                    keys_replaced[token_str] = replaced_key
-
     @property
     def stopped(self):
         """Return if stopped."""
@@ -582,8 +638,8 @@ class RunningShow:
         self._post_events(['stopped'])
 
     def _remove_delay_handler(self):
-        if self._delay_handler:
-            self.machine.clock.unschedule(self._delay_handler)
+        if self._delay_handler is not None:
+            self.machine.show_controller.unschedule_show_step(self, self._delay_handler)
             self._delay_handler = None
 
     def pause(self):
@@ -667,8 +723,9 @@ class RunningShow:
                 return
 
         self.current_step_index = self.next_step_index
+        current_step = self.show.get_show_step(self.current_step_index, self.show_config.show_tokens)
 
-        for item_type, item_dict in self.show_steps[self.current_step_index].items():
+        for item_type, item_dict in current_step.items():
 
             if item_type == 'duration':
                 continue
@@ -692,8 +749,8 @@ class RunningShow:
 
         self.next_step_index += 1
 
-        time_to_next_step = self.show_steps[self.current_step_index]['duration'] / self.show_config.speed
+        time_to_next_step = current_step['duration'] / self.show_config.speed
         if not self.show_config.manual_advance and time_to_next_step > 0:
             self.next_step_time += time_to_next_step
-            self._delay_handler = self.machine.clock.schedule_once(self._run_next_step,
-                                                                   self.next_step_time - self.machine.clock.get_time())
+            self._delay_handler = self.machine.show_controller.schedule_show_step(self, self._run_next_step,
+                                                                                  self.next_step_time)
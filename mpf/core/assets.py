@@ -211,6 +211,8 @@ class BaseAssetManager(MpfController, LogMixin):
                 [x for x in getattr(self.machine, ac.attribute).values() if
                  x.config['load'] == 'preload' or force_assets_load])
 
+        self._preload_config_files(preload_assets)
+
         wait_for_assets = False
         for asset in preload_assets:
             if not asset.load():
@@ -219,6 +221,18 @@ class BaseAssetManager(MpfController, LogMixin):
         if not wait_for_assets:
             self.machine.clear_boot_hold('assets')
 
+    def _preload_config_files(self, assets: List["Asset"]) -> None:
+        """Parse files of config based assets (e.g. shows) in parallel before they are loaded one by one."""
+        file_lists = dict()
+        for asset in assets:
+            # asset pools have no file of their own
+            if getattr(asset, "config_file_type", None) and asset.file and not asset.loaded:
+                file_lists.setdefault(asset.config_file_type, []).append([asset.file])
+
+        for config_type, files in file_lists.items():
+            self.machine.config_processor.preload_config_files(
+                files, config_type, load_from_cache=not self.machine.options['no_load_cache'])
+
     def _create_assets_from_disk(self, config: dict, mode: Optional[Mode] = None) -> dict:
         """Walk a folder (and subfolders) and finds all the assets.
 
@@ -861,6 +875,9 @@ class Asset:
 
     asset_group_class = AssetPool  # replace with your own asset group class
 
+    # config_type for assets loaded by the config processor. their files are parsed in parallel on preload
+    config_file_type = None     # type: str
+
     __slots__ = ["machine", "name", "file", "config", "priority", "_callbacks", "_id", "lock", "loading", "loaded",
                  "unloading"]
 
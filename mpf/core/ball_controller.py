@@ -4,6 +4,7 @@ import asyncio
 from typing import Generator, Union, Iterable
 
 from mpf.devices.ball_device.ball_device import BallDevice
+from mpf.devices.ball_device.ball_routing_table import BallRoutingTable
 
 from mpf.core.delays import DelayManager
 from mpf.core.machine import MachineController
@@ -17,7 +18,7 @@ class BallController(MpfController):
 
     config_name = "ball_controller"
 
-    __slots__ = ["delay", "num_balls_known", "_add_new_balls_task", "_captured_balls"]
+    __slots__ = ["delay", "num_balls_known", "_add_new_balls_task", "_captured_balls", "routing_table"]
 
     def __init__(self, machine: MachineController) -> None:
         """Initialise ball controller.
@@ -33,6 +34,9 @@ class BallController(MpfController):
 
         self.num_balls_known = 0
 
+        # routes between ball devices. used for diagnostics and by ball devices to find their eject paths
+        self.routing_table = BallRoutingTable(self.machine)
+
         # register for events
         self.machine.events.add_handler('request_to_start_game',
                                         self.request_to_start_game)
@@ -6,6 +6,31 @@ import asyncio
 from mpf.core.mpf_controller import MpfController
 
 
+class BcpMessage:
+
+    """A BCP command which may be sent to multiple clients.
+
+    The message is encoded only once per encoder and the result is shared by all clients.
+    """
+
+    __slots__ = ["bcp_command", "kwargs", "_encoded"]
+
+    def __init__(self, bcp_command, kwargs):
+        """Initialise message."""
+        self.bcp_command = bcp_command
+        self.kwargs = kwargs
+        self._encoded = {}
+
+    def encode(self, encoder):
+        """Return the message encoded with encoder(bcp_command, kwargs)."""
+        try:
+            return self._encoded[encoder]
+        except KeyError:
+            encoded = encoder(self.bcp_command, self.kwargs)
+            self._encoded[encoder] = encoded
+            return encoded
+
+
 class BaseBcpClient(MpfController, metaclass=abc.ABCMeta):
 
     """Base class for bcp clients."""
@@ -35,6 +60,10 @@ class BaseBcpClient(MpfController, metaclass=abc.ABCMeta):
         """Send data to client."""
         raise NotImplementedError("implement")
 
+    def send_message(self, message: BcpMessage):
+        """Send a message which is shared with other clients."""
+        self.send(message.bcp_command, message.kwargs)
+
     def stop(self):
         """Stop client connection."""
         raise NotImplementedError("implement")
@@ -22,7 +22,7 @@ class BcpInterface(MpfController):
     The following BCP commands are currently implemented:
         error
         get
-        hello?version=xxx&controller_name=xxx&controller_version=xxx
+        hello?version=xxx&controller_name=xxx&controller_version=xxx&fast_protocols=xxx
         mode_start?name=xxx&priority=xxx
         mode_stop?name=xxx
         player_added?player_num=x
@@ -326,9 +326,13 @@ class BcpInterface(MpfController):
 
     def _monitor_devices(self, client):
         """Register client to get notified of device changes."""
+        if not self.machine.bcp.transport.get_transports_for_handler("_devices"):
+            self.machine.device_manager.add_monitor(self._notify_device_changes)
+        else:
+            # send pending changes to the other clients before the new client gets the current state
+            self.machine.device_manager.flush_device_changes()
+
         self.machine.bcp.transport.add_handler_to_transport("_devices", client)
-        # trigger updates of lights
-        self.machine.light_controller.monitor_lights()
 
         # initially send all states
         for collection in self.machine.device_manager.get_monitorable_devices().values():
@@ -345,18 +349,22 @@ class BcpInterface(MpfController):
         """Remove client to no longer get notified of device changes."""
         self.machine.bcp.transport.remove_transport_from_handle("_devices", client)
 
-    def notify_device_changes(self, device, attribute_name, old_value, new_value):
-        """Notify all listeners about device change."""
-        if not self.configured:
-            return
+        if not self.machine.bcp.transport.get_transports_for_handler("_devices"):
+            self.machine.device_manager.remove_monitor(self._notify_device_changes)
 
-        self.machine.bcp.transport.send_to_clients_with_handler(
-            handler="_devices",
-            bcp_command='device',
-            type=device.class_label,
-            name=device.name,
-            changes=(attribute_name, Util.convert_to_simply_type(old_value), Util.convert_to_simply_type(new_value)),
-            state=device.get_monitorable_state())
+    def _notify_device_changes(self, device, changes, state):
+        """Notify all listeners about changed attributes of a device.
+
+        Send one message per changed attribute with the full state of the device.
+        """
+        for change in changes:
+            self.machine.bcp.transport.send_to_clients_with_handler(
+                handler="_devices",
+                bcp_command='device',
+                type=device.class_label,
+                name=device.name,
+                changes=change,
+                state=state)
 
     def _monitor_switches(self, client):
         """Register client to get notified of switch changes."""
@@ -1,11 +1,21 @@
 """BCP socket client."""
 import json
+import struct
 from urllib.parse import urlsplit, parse_qs, quote, unquote, urlunparse
 
 import asyncio
 
 from mpf._version import __version__, __bcp_version__
-from mpf.core.bcp.bcp_client import BaseBcpClient
+from mpf.core.bcp.bcp_client import BaseBcpClient, BcpMessage
+
+# optional wire format which is used when both sides announce it in their hello
+FAST_PROTOCOL = "json_frames"
+
+# frames start with a byte which cannot start a URL encoded command
+FRAME_MARKER = b'\x00'
+
+# length of the JSON body and length of the raw payload
+FRAME_HEADER = struct.Struct('!II')
 
 
 class MpfJSONEncoder(json.JSONEncoder):
@@ -120,6 +130,35 @@ def encode_command_string(bcp_command, **kwargs):
     return str(urlunparse(('', '', bcp_command.lower(), '', kwarg_string, '')))
 
 
+def encode_command_bytes(bcp_command, kwargs) -> bytes:
+    """Encode a BCP command to a line of bytes which can be written to a socket."""
+    return (encode_command_string(bcp_command, **kwargs) + '\n').encode()
+
+
+def encode_command_frame(bcp_command, kwargs) -> bytes:
+    """Encode a BCP command to a length-prefixed frame.
+
+    The body is a JSON list of command and kwargs which keeps native types. A
+    rawbytes kwarg is appended to the frame as raw payload.
+    """
+    rawbytes = kwargs.get('rawbytes', b'')
+    if rawbytes:
+        kwargs = dict(kwargs)
+        del kwargs['rawbytes']
+
+    body = json.dumps([bcp_command.lower(), kwargs], cls=MpfJSONEncoder).encode()
+    return b''.join((FRAME_MARKER, FRAME_HEADER.pack(len(body), len(rawbytes)), body, rawbytes))
+
+
+def decode_command_frame(body, rawbytes=None):
+    """Decode the body and payload of a frame into command and kwargs."""
+    bcp_command, kwargs = json.loads(body.decode())
+    if rawbytes:
+        kwargs['rawbytes'] = rawbytes
+
+    return bcp_command, kwargs
+
+
 class AsyncioBcpClientSocket():
 
     """Simple asyncio bcp client."""
@@ -200,6 +239,15 @@ class BCPClientSocket(BaseBcpClient):
         bcp: The bcp object.
     """
 
+    # do not write more to the transport while it buffers more than this
+    high_water_mark = 1024 * 1024
+
+    # retry interval while the transport buffer is above high_water_mark
+    backpressure_retry_secs = .01
+
+    # disconnect the client if more than this is queued because the remote side does not read
+    max_pending_bytes = 8 * high_water_mark
+
     def __init__(self, machine, name, bcp):
         """Initialise BCP client socket."""
         self.module_name = 'BCPClientSocket.{}'.format(name)
@@ -211,6 +259,10 @@ class BCPClientSocket(BaseBcpClient):
         self._receiver = None
         self._send_goodbye = True
         self._receive_buffer = b''
+        self._send_buffer = []
+        self._send_buffer_size = 0
+        self._flush_handle = None
+        self._encoder = encode_command_bytes
 
         self._bcp_client_socket_commands = {'hello': self._receive_hello,
                                             'goodbye': self._receive_goodbye}
@@ -267,6 +319,7 @@ class BCPClientSocket(BaseBcpClient):
         if self._send_goodbye:
             self.send_goodbye()
 
+        self._flush(force=True)
         self._sender.close()
 
     def send(self, bcp_command, kwargs):
@@ -276,32 +329,82 @@ class BCPClientSocket(BaseBcpClient):
             bcp_command: command to send
             kwargs: parameters to command
         """
+        self.send_message(BcpMessage(bcp_command, kwargs))
+
+    def send_message(self, message: BcpMessage):
+        """Queue a message which is written to the socket in the next loop iteration."""
         try:
-            bcp_string = encode_command_string(bcp_command, **kwargs)
+            data = message.encode(self._encoder)
         # pylint: disable-msg=broad-except
         except Exception as e:
-            self.warning_log("Failed to encode bcp_command %s with args %s. %s", bcp_command, kwargs, e)
+            self.warning_log("Failed to encode bcp_command %s with args %s. %s", message.bcp_command, message.kwargs,
+                             e)
             return
 
-        if self.debug_log:
-            self.debug_log('Sending "%s"', bcp_string)
+        if self._debug:
+            self.debug_log('Sending "%s"', data)
+
+        self._send_buffer.append(data)
+        self._send_buffer_size += len(data)
+        if self._send_buffer_size > self.max_pending_bytes:
+            # the transport will stop and unregister this client
+            self.warning_log("Remote side does not read. Disconnecting with %s bytes pending.", self._send_buffer_size)
+            self._clear_send_buffer()
+            raise IOError("BCP client {} does not read.".format(self.name))
+
+        if not self._flush_handle:
+            self._flush_handle = self.machine.clock.loop.call_soon(self._flush)
+
+    def _flush(self, force=False):
+        """Write all queued messages to the socket at once."""
+        if self._flush_handle:
+            self._flush_handle.cancel()
+            self._flush_handle = None
 
-        if hasattr(self._sender.transport, "is_closing") and self._sender.transport.is_closing():
-            self.warning_log("Failed to write to bcp since transport is closing. Transport %s", self._sender.transport)
+        if not self._send_buffer:
+            return
+
+        transport = self._sender.transport
+        if hasattr(transport, "is_closing") and transport.is_closing():
+            self.warning_log("Failed to write to bcp since transport is closing. Transport %s", transport)
+            self._clear_send_buffer()
+            return
+
+        if not force and hasattr(transport, "get_write_buffer_size") and \
+                transport.get_write_buffer_size() > self.high_water_mark:
+            # the remote side is slow. keep collecting messages instead of growing the transport buffer
+            self.debug_log("Transport buffer above high water mark. Delaying write.")
+            self._flush_handle = self.machine.clock.loop.call_later(self.backpressure_retry_secs, self._flush)
             return
-        self._sender.write((bcp_string + '\n').encode())
+
+        data = b''.join(self._send_buffer)
+        self._clear_send_buffer()
+        self._sender.write(data)
+
+    def _clear_send_buffer(self):
+        self._send_buffer = []
+        self._send_buffer_size = 0
 
     # pylint: disable-msg=inconsistent-return-statements
     @asyncio.coroutine
     def read_message(self):
         """Read the next message."""
         while True:
-            message = yield from self._receiver.readline()
-
-            # handle EOF
-            if not message:
+            try:
+                message = yield from self._receiver.readexactly(1)
+            except asyncio.IncompleteReadError:
+                # handle EOF
                 raise BrokenPipeError()
 
+            if message == FRAME_MARKER:
+                message_obj = yield from self._read_frame()
+                if message_obj:
+                    return message_obj
+                continue
+
+            if message != b'\n':
+                message += yield from self._receiver.readline()
+
             # strip newline
             message = message[0:-1]
 
@@ -319,6 +422,26 @@ class BCPClientSocket(BaseBcpClient):
             if message_obj:
                 return message_obj
 
+    @asyncio.coroutine
+    def _read_frame(self):
+        """Read a frame after its marker."""
+        try:
+            header = yield from self._receiver.readexactly(FRAME_HEADER.size)
+            body_length, bytes_length = FRAME_HEADER.unpack(header)
+            body = yield from self._receiver.readexactly(body_length)
+            rawbytes = None
+            if bytes_length:
+                # the payload is passed on as read without copying it again
+                rawbytes = yield from self._receiver.readexactly(bytes_length)
+        except asyncio.IncompleteReadError:
+            raise BrokenPipeError()
+
+        if self._debug:
+            self.debug_log('Received frame "%s"', body)
+
+        cmd, kwargs = decode_command_frame(body, rawbytes)
+        return self._handle_command(cmd, kwargs)
+
     def _process_command(self, message, rawbytes=None):
         if self.debug_log:
             self.debug_log('Received "%s"', message)
@@ -327,6 +450,9 @@ class BCPClientSocket(BaseBcpClient):
         if rawbytes:
             kwargs['rawbytes'] = rawbytes
 
+        return self._handle_command(cmd, kwargs)
+
+    def _handle_command(self, cmd, kwargs):
         if cmd in self._bcp_client_socket_commands:
             self._bcp_client_socket_commands[cmd](**kwargs)
             return None
@@ -337,6 +463,11 @@ class BCPClientSocket(BaseBcpClient):
         """Process incoming BCP 'hello' command."""
         self.debug_log('Received BCP Hello from host with kwargs: %s', kwargs)
 
+        # our hello has been sent already. switch to frames if the remote side supports them as well
+        if FAST_PROTOCOL in str(kwargs.get('fast_protocols', '')).split(','):
+            self.debug_log('Using %s protocol', FAST_PROTOCOL)
+            self._encoder = encode_command_frame
+
     def _receive_goodbye(self):
         """Process incoming BCP 'goodbye' command."""
         self._send_goodbye = False
@@ -346,7 +477,8 @@ class BCPClientSocket(BaseBcpClient):
         """Send BCP 'hello' command."""
         self.send('hello', {"version": __bcp_version__,
                             "controller_name": 'Mission Pinball Framework',
-                            "controller_version": __version__})
+                            "controller_version": __version__,
+                            "fast_protocols": FAST_PROTOCOL})
 
     def send_goodbye(self):
         """Send BCP 'goodbye' command."""
@@ -3,7 +3,7 @@ import asyncio
 
 from typing import Union
 
-from mpf.core.bcp.bcp_client import BaseBcpClient
+from mpf.core.bcp.bcp_client import BaseBcpClient, BcpMessage
 
 
 class BcpTransportManager:
@@ -99,8 +99,9 @@ class BcpTransportManager:
 
     def send_to_clients(self, clients, bcp_command, **kwargs):
         """Send command to a list of clients."""
+        message = BcpMessage(bcp_command, kwargs)
         for client in set(clients):
-            self.send_to_client(client, bcp_command, **kwargs)
+            self._send_message_to_client(client, message)
 
     def send_to_clients_with_handler(self, handler, bcp_command, **kwargs):
         """Send command to clients which registered for a specific handler."""
@@ -115,10 +116,18 @@ class BcpTransportManager:
             client.stop()
             self.unregister_transport(client)
 
+    def _send_message_to_client(self, client: BaseBcpClient, message: BcpMessage):
+        try:
+            client.send_message(message)
+        except IOError:
+            client.stop()
+            self.unregister_transport(client)
+
     def send_to_all_clients(self, bcp_command, **kwargs):
         """Send command to all bcp clients."""
-        for client in self._transports:
-            self.send_to_client(client, bcp_command, **kwargs)
+        message = BcpMessage(bcp_command, kwargs)
+        for client in list(self._transports):
+            self._send_message_to_client(client, message)
 
     def shutdown(self, **kwargs):
         """Prepare the BCP clients for MPF shutdown."""
@@ -38,6 +38,11 @@ class ConfigProcessor:
         path_hash = hashlib.md5(bytes(filestring, 'UTF-8')).hexdigest()     # nosec
         return os.path.join(cache_dir, path_hash + ".mpf_cache")
 
+    def get_validation_cache_filename(self, filenames: List[str]) -> str:   # pragma: no cover
+        """Return the file name of the cache for validated configs."""
+        cache_file = self.get_cache_filename(filenames)
+        return os.path.splitext(cache_file)[0] + ".mpf_validated_cache"
+
     def _load_config_from_cache(self, cache_file) -> Tuple[Any, List[str]]:     # nosec
         """Return config from cache."""
         self.log.info("Loading config from cache: %s", cache_file)
@@ -65,6 +70,32 @@ class ConfigProcessor:
                 self.log.warning('Cache file not found: %s', filename)
                 return -1
 
+    def _is_cache_current(self, filenames: List[str]) -> bool:
+        """Return true if the cache for those files exists and is newer than the files."""
+        try:
+            cache_time = os.path.getmtime(self.get_cache_filename(filenames))
+        except OSError:
+            return False
+
+        for configfile in filenames:
+            if not os.path.isfile(configfile) or os.path.getmtime(configfile) > cache_time:
+                return False
+
+        return True
+
+    def preload_config_files(self, file_lists: List[List[str]], config_type: str,
+                             load_from_cache=True) -> None:    # pragma: no cover
+        """Parse all files which are not in the cache in parallel.
+
+        Each entry in file_lists is a list of files which would be passed to load_config_files_with_cache later.
+        """
+        filenames = []
+        for files in file_lists:
+            if not load_from_cache or not self._is_cache_current(files):
+                filenames.extend(files)
+
+        FileManager.preload(filenames, self.get_expected_version(config_type))
+
     # pylint: disable-msg=too-many-arguments
     def load_config_files_with_cache(self, filenames: List[str], config_type: str, load_from_cache=True,
                                      store_to_cache=True, ignore_unknown_sections=False) -> dict:   # pragma: no cover
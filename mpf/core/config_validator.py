@@ -8,10 +8,14 @@ from copy import deepcopy
 
 import pickle   # nosec
 
+from functools import partial
 from typing import Any
+from typing import Callable
 from typing import Dict
+from typing import Tuple
 
 import mpf
+from mpf._version import __version__
 from mpf.core.rgb_color import named_rgb_colors, RGBColor
 from mpf.exceptions.ConfigFileError import ConfigFileError
 from mpf.file_interfaces.yaml_interface import YamlInterface
@@ -32,6 +36,31 @@ class RuntimeToken:
         self.validator_function = validator_function
 
 
+class _Uncacheable(Exception):
+
+    """Raised for values which cannot be stored in the validation cache."""
+
+
+class _LateBoundItem:
+
+    """An item in a cached config which is validated again when the config is loaded from the cache.
+
+    Used for validators which return objects, such as devices or templates.
+    """
+
+    __slots__ = ["item", "validator"]
+
+    def __init__(self, item, validator):
+        """Remember item and validator."""
+        self.item = item
+        self.validator = validator
+
+
+# validators which return objects that cannot be cached or depend on state outside of the validated config
+_LATE_BOUND_VALIDATORS = ("machine", "template_float", "template_int", "template_bool", "template_secs",
+                          "float_or_token", "int_or_token", "num_or_token", "ms_or_token", "color")
+
+
 class ConfigValidator:
 
     """Validates config against config specs."""
@@ -44,6 +73,22 @@ class ConfigValidator:
         self.config_spec = None     # type: Any
         self.log = logging.getLogger('ConfigValidator')
 
+        # validated configs by spec and source. None if the cache is disabled
+        self._validation_cache = None       # type: Dict[tuple, Any]
+        self._validation_cache_file = None  # type: str
+        self._validation_cache_changed = False
+        self._used_validation_keys = set()
+        self._validation_depth = 0
+        # (result, item, validator) by id of the result of late bound validators in the current validation. the
+        # result is kept to make sure that its id is not reused by another object
+        self._late_bound_items = {}         # type: Dict[int, Tuple[Any, Any, str]]
+
+        # built specs and their frozen form for the validation cache by (config_spec, base_spec)
+        self._spec_cache = {}               # type: Dict[Tuple[str, Any], Dict[str, Any]]
+        self._frozen_spec_cache = {}        # type: Dict[Tuple[str, Any], Any]
+        # bound validator and late bound flag by validator string
+        self._validator_cache = {}          # type: Dict[str, Tuple[Callable, bool]]
+
         self.validator_list = {
             "str": self._validate_type_str,
             "lstr": self._validate_type_lstr,
@@ -87,6 +132,7 @@ class ConfigValidator:
 
     def load_device_config_spec(self, config_section, config_spec):
         """Load config specs for a device."""
+        self._clear_spec_cache()
         self.config_spec[config_section] = self._process_config_spec(YamlInterface.process(config_spec), config_section)
 
     def load_mode_config_spec(self, mode_string, config_spec):
@@ -161,12 +207,33 @@ class ConfigValidator:
     def unload_config_spec(self):
         """Unload specs."""
         self.config_spec = None
+        self._clear_spec_cache()
+
+    def _clear_spec_cache(self):
+        """Forget built specs after specs changed."""
+        self._spec_cache = {}
+        self._frozen_spec_cache = {}
+
+    @staticmethod
+    def _get_spec_key(config_spec, base_spec):
+        if isinstance(base_spec, list):
+            base_spec = tuple(base_spec)
+        return config_spec, base_spec
 
     def build_spec(self, config_spec, base_spec):
-        """Build config spec out of two or more specs."""
+        """Build config spec out of two or more specs.
+
+        Built specs are cached. Do not modify the returned dict.
+        """
         if not self.config_spec:
             self.load_config_spec()
 
+        key = self._get_spec_key(config_spec, base_spec)
+        try:
+            return self._spec_cache[key]
+        except KeyError:
+            pass
+
         # build up the actual config spec we're going to use
         spec_list = [config_spec]
 
@@ -188,8 +255,142 @@ class ConfigValidator:
             this_base_spec.update(this_spec)
             this_spec = this_base_spec
 
+        self._spec_cache[key] = this_spec
         return this_spec
 
+    def load_validation_cache(self, cache_file, load_from_cache=True):
+        """Enable the cache for validated configs and load it from a file."""
+        self._validation_cache_file = cache_file
+        self._validation_cache = {}
+        self._used_validation_keys = set()
+        self._validation_cache_changed = False
+        if not load_from_cache or not os.path.isfile(cache_file):
+            return
+
+        try:
+            with open(cache_file, 'rb') as f:
+                cache = pickle.load(f)  # nosec
+        except Exception:   # noqa
+            self.log.warning("Could not load validation cache file: %s", cache_file)
+            return
+
+        # validated configs may differ between MPF versions even with the same spec
+        if isinstance(cache, tuple) and len(cache) == 2 and cache[0] == __version__:
+            self._validation_cache = cache[1]
+
+    def save_validation_cache(self):
+        """Store all validated configs which were used since the cache was loaded."""
+        if not self._validation_cache_file or not self._validation_cache_changed:
+            return
+
+        # drop entries of configs which no longer exist
+        cache = {key: self._validation_cache[key] for key in self._used_validation_keys
+                 if key in self._validation_cache}
+
+        # a parallel run must not write to the same temp file
+        temp_file = "{}.{}.tmp".format(self._validation_cache_file, os.getpid())
+        with open(temp_file, 'wb') as f:
+            pickle.dump((__version__, cache), f, protocol=4)
+        os.replace(temp_file, self._validation_cache_file)
+        self._validation_cache_changed = False
+        self.log.info('Validation cache created: %s', self._validation_cache_file)
+
+    @classmethod
+    def _freeze(cls, value):
+        """Return a hashable representation of a config."""
+        if value is None or isinstance(value, str):
+            return value
+        if isinstance(value, (bool, int, float)):
+            # keep 1, 1.0 and True apart
+            return type(value), value
+        if isinstance(value, dict):
+            return type(value) is not dict, tuple((cls._freeze(k), cls._freeze(v)) for k, v in value.items())
+        if isinstance(value, (list, tuple)):
+            return type(value).__name__, tuple(cls._freeze(v) for v in value)
+        if isinstance(value, set):
+            return "set", frozenset(cls._freeze(v) for v in value)
+
+        raise _Uncacheable()
+
+    def _to_cacheable(self, value):
+        """Return a copy of a validated config which can be pickled."""
+        if value is None or isinstance(value, (str, bool, int, float)):
+            return value
+        late_bound_item = self._late_bound_items.get(id(value))
+        if late_bound_item and late_bound_item[0] is value:
+            return _LateBoundItem(late_bound_item[1], late_bound_item[2])
+        if isinstance(value, dict):
+            return (OrderedDict if isinstance(value, OrderedDict) else dict)(
+                (self._to_cacheable(k), self._to_cacheable(v)) for k, v in value.items())
+        if isinstance(value, list):
+            return [self._to_cacheable(v) for v in value]
+        if isinstance(value, tuple):
+            return tuple(self._to_cacheable(v) for v in value)
+        if isinstance(value, set):
+            return {self._to_cacheable(v) for v in value}
+
+        raise _Uncacheable()
+
+    def _from_cacheable(self, value, validation_failure_info):
+        """Return a new validated config from a cached config."""
+        if isinstance(value, dict):
+            return value.__class__((self._from_cacheable(k, validation_failure_info),
+                                    self._from_cacheable(v, validation_failure_info)) for k, v in value.items())
+        if isinstance(value, (list, tuple, set)):
+            return value.__class__(self._from_cacheable(v, validation_failure_info) for v in value)
+        if isinstance(value, _LateBoundItem):
+            return self.validate_item(value.item, value.validator, validation_failure_info)
+
+        return value
+
+    # pylint: disable-msg=too-many-arguments
+    def _validate_config_with_cache(self, config_spec, base_spec, this_spec, source, validation_failure_info,
+                                    add_missing_keys):
+        """Return a validated config from cache or validate it and add it to the cache."""
+        spec_key = self._get_spec_key(config_spec, base_spec)
+        try:
+            frozen_spec = self._frozen_spec_cache[spec_key]
+        except KeyError:
+            frozen_spec = self._frozen_spec_cache[spec_key] = self._freeze(this_spec)
+
+        try:
+            key = (spec_key, add_missing_keys, frozen_spec, self._freeze(source))
+        except _Uncacheable:
+            return self._validate_config_with_spec(config_spec, this_spec, source, validation_failure_info,
+                                                   add_missing_keys)
+
+        cached_config = self._validation_cache.get(key)
+        if cached_config is not None:
+            try:
+                config = self._from_cacheable(cached_config, validation_failure_info)
+            except ConfigFileError:
+                # e.g. a referenced device is gone. validate again to report the error
+                pass
+            else:
+                self._used_validation_keys.add(key)
+                # callers expect the source to be validated in place
+                source.update(config)
+                return source
+
+        self._validation_depth += 1
+        try:
+            config = self._validate_config_with_spec(config_spec, this_spec, source, validation_failure_info,
+                                                     add_missing_keys)
+            try:
+                cached_config = self._to_cacheable(config)
+            except _Uncacheable:
+                cached_config = None
+        finally:
+            self._validation_depth -= 1
+            self._late_bound_items = {}
+
+        if cached_config is not None:
+            self._validation_cache[key] = cached_config
+            self._used_validation_keys.add(key)
+            self._validation_cache_changed = True
+
+        return config
+
     # pylint: disable-msg=too-many-arguments,too-many-branches
     def validate_config(self, config_spec, source, section_name=None,
                         base_spec=None, add_missing_keys=True, prefix=None) -> Dict[str, Any]:
@@ -214,6 +415,17 @@ class ConfigValidator:
 
         this_spec = self.build_spec(config_spec, base_spec)
 
+        if self._validation_cache is not None and not self._validation_depth and isinstance(source, dict):
+            return self._validate_config_with_cache(config_spec, base_spec, this_spec, source,
+                                                    validation_failure_info, add_missing_keys)
+
+        return self._validate_config_with_spec(config_spec, this_spec, source, validation_failure_info,
+                                               add_missing_keys)
+
+    # pylint: disable-msg=too-many-arguments
+    def _validate_config_with_spec(self, config_spec, this_spec, source, validation_failure_info,
+                                   add_missing_keys) -> Dict[str, Any]:
+        """Validate a config dict against a built spec."""
         if '__allow_others__' not in this_spec:
             self.check_for_invalid_sections(this_spec, source,
                                             validation_failure_info)
@@ -680,20 +892,40 @@ class ConfigValidator:
         except AttributeError:
             pass
 
-        if '(' in validator and ')' in validator[-1:] == ')':
-            validator_parts = validator.split('(')
-            validator = validator_parts[0]
-            param = validator_parts[1][:-1]
-            return self.validator_list[validator](item, validation_failure_info=validation_failure_info, param=param)
-        elif validator in self.validator_list:
-            return self.validator_list[validator](item, validation_failure_info=validation_failure_info)
+        try:
+            validator_func, late_bound = self._validator_cache[validator]
+        except KeyError:
+            validator_func, late_bound = self._compile_validator(validator, validation_failure_info)
 
+        result = validator_func(item, validation_failure_info=validation_failure_info)
+
+        if late_bound and self._validation_depth and not (result is None or
+                                                          isinstance(result, (str, bool, int, float))):
+            # remember how to create this result when the config is loaded from the cache
+            self._late_bound_items[id(result)] = (result, item, validator)
+
+        return result
+
+    def _compile_validator(self, validator, validation_failure_info):
+        """Parse a validator string such as "machine(switches)" once and bind its parameter."""
+        if '(' in validator and validator[-1:] == ')':
+            name, param = validator[:-1].split('(', 1)
         else:
+            name, param = validator, None
+
+        if name not in self.validator_list:
             raise ConfigFileError("Invalid Validator '{}' in config spec {}:{}".format(
                                   validator,
                                   validation_failure_info[0][0],
                                   validation_failure_info[1]), 4, self.log.name)
 
+        validator_func = self.validator_list[name]
+        if param is not None:
+            validator_func = partial(validator_func, param=param)
+
+        self._validator_cache[validator] = (validator_func, name in _LATE_BOUND_VALIDATORS)
+        return self._validator_cache[validator]
+
     def _build_error_path(self, validation_failure_info):
         if isinstance(validation_failure_info[0], tuple):
             return "{}:{}".format(self._build_error_path(validation_failure_info[0]), validation_failure_info[1])
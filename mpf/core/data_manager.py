@@ -6,18 +6,34 @@ import errno
 import threading
 import time
 import _thread
+from collections import deque
 
 from mpf.core.file_manager import FileManager
+from mpf.file_interfaces.yaml_interface import YamlInterface
 from mpf.core.mpf_controller import MpfController
 
 
 class DataManager(MpfController):
 
-    """Handles key value data loading and saving for the machine."""
+    """Handles key value data loading and saving for the machine.
+
+    Single changes are appended to a journal next to the data file. After compact_after changes (or a call to
+    save_all) the whole data is written to the data file and the journal is emptied. Journal entries are encoded as
+    yaml like the data file so values are restored the same way from both. Changes which cannot be written in one
+    line (e.g. strings with line breaks) are written as full snapshot instead.
+
+    A snapshot is written in steps which can be interrupted at any time: The journal is rotated aside, the snapshot is
+    written next to the data file, the rotated journals are removed and the snapshot replaces the data file. On load a
+    complete snapshot wins over the rotated journals. Otherwise, the rotated journals are replayed before the journal.
+    """
 
     config_name = "data_manager"
 
-    __slots_ = ["name", "min_wait_secs", "filename", "data", "_dirty"]
+    __slots_ = ["name", "min_wait_secs", "filename", "journal_filename", "snapshot_filename", "data", "_dirty",
+                "_changes", "_journal_entries", "_journal_has_data"]
+
+    # write a full snapshot after this many journaled changes
+    compact_after = 1000
 
     def __init__(self, machine, name, min_wait_secs=1):
         """Initialise data manger.
@@ -47,8 +63,15 @@ class DataManager(MpfController):
         else:
             raise AssertionError("Invalid path {} for {}".format(config_path, name))
 
+        self.journal_filename = self.filename + ".journal" if self.filename else False
+        self.snapshot_filename = "{}.snapshot{}".format(*os.path.splitext(self.filename)) if self.filename else False
+
         self.data = dict()
         self._dirty = threading.Event()
+        # encoded journal lines or snapshots of data. written in order by the writing thread
+        self._changes = deque()
+        self._journal_entries = 0
+        self._journal_has_data = False
 
         if self.filename:
             self._setup_file()
@@ -69,6 +92,11 @@ class DataManager(MpfController):
                 raise
 
     def _load(self):
+        if os.path.exists(self.snapshot_filename):
+            # the last snapshot has been written completely but did not replace the data file yet
+            self.debug_log("Finishing snapshot %s", self.snapshot_filename)
+            self._finish_snapshot()
+
         self.debug_log("Loading %s from %s", self.name, self.filename)
         if os.path.isfile(self.filename):
             self.data = FileManager.load(self.filename, halt_on_error=False)
@@ -80,6 +108,66 @@ class DataManager(MpfController):
         if not self.data:
             self.data = {}
 
+        self._replay_journal()
+
+    def _get_rotated_journal_numbers(self):
+        """Return the numbers of all journals which have been rotated aside for a snapshot (oldest first)."""
+        prefix = os.path.basename(self.journal_filename) + "."
+        try:
+            files = os.listdir(os.path.dirname(self.journal_filename))
+        except OSError:
+            return []
+
+        return sorted(int(file[len(prefix):]) for file in files
+                      if file.startswith(prefix) and file[len(prefix):].isdigit())
+
+    def _get_rotated_journal_filename(self, number):
+        """Return the filename of a rotated journal."""
+        return "{}.{}".format(self.journal_filename, number)
+
+    def _replay_journal(self):
+        """Apply all changes from the journals which are not in the data file yet."""
+        replayed = 0
+        for number in self._get_rotated_journal_numbers():
+            replayed += self._replay_journal_file(self._get_rotated_journal_filename(number))
+
+        journal_lines = self._replay_journal_file(self.journal_filename)
+        if journal_lines:
+            self._journal_has_data = True
+
+        if replayed or journal_lines:
+            # compact the journals into the data file
+            self._queue_change(None)
+
+    def _replay_journal_file(self, filename):
+        """Apply all changes from one journal and return the number of lines."""
+        try:
+            with open(filename, encoding='utf8') as f:
+                lines = f.readlines()
+        except OSError:
+            return 0
+
+        for line in lines:
+            try:
+                change = YamlInterface.process(line)
+            except Exception:   # pylint: disable-msg=broad-except
+                change = None
+
+            if not isinstance(change, list) or len(change) not in (1, 2) or not isinstance(change[0], list):
+                # the last line may be incomplete after a power loss
+                self.warning_log("Ignoring broken entry in %s", filename)
+                break
+
+            if len(change) == 2:
+                self._set(change[0], change[1])
+            else:
+                self._remove(change[0])
+
+        if lines:
+            self.debug_log("Replayed %s changes from %s", len(lines), filename)
+
+        return len(lines)
+
     def get_data(self, section=None):
         """Return the value of this DataManager's data.
 
@@ -110,8 +198,102 @@ class DataManager(MpfController):
     def save_all(self, data):
         """Update all data."""
         self.data = data
+        self._queue_change(None)
+
+    def set_value(self, path, value):
+        """Set a single value and only write this change to disk.
+
+        Args:
+            path: Key or tuple of keys of nested dicts.
+            value: The new value.
+        """
+        if not isinstance(path, (tuple, list)):
+            path = (path,)
+
+        self._set(path, value)
+        self._queue_change(self._encode_change(path, value))
+
+    def remove_key(self, path):
+        """Remove a key and only write this change to disk.
+
+        Args:
+            path: Key or tuple of keys of nested dicts.
+        """
+        if not isinstance(path, (tuple, list)):
+            path = (path,)
+
+        self._remove(path)
+        self._queue_change(self._encode_change(path))
+
+    def _set(self, path, value):
+        data = self.data
+        for key in path[:-1]:
+            data = data.setdefault(key, {})
+        data[path[-1]] = value
+
+    def _remove(self, path):
+        data = self.data
+        for key in path[:-1]:
+            data = data.get(key, {})
+        data.pop(path[-1], None)
+
+    @staticmethod
+    def _encode_change(path, *value):
+        """Return a journal line for a change or None if it cannot be written in one line."""
+        line = YamlInterface.save_to_str([list(path)] + list(value))
+        if "\n" in line[:-1]:
+            return None
+        return line
+
+    def _queue_change(self, change):
+        """Queue a journal line or a snapshot of all data if change is None."""
+        if change is None or self._journal_entries >= self.compact_after:
+            change = copy.deepcopy(self.data)
+            self._journal_entries = 0
+        else:
+            self._journal_entries += 1
+
+        self._changes.append(change)
         self._trigger_save()
 
+    def _write_changes(self):
+        """Write all queued changes to disk."""
+        lines = []
+        while self._changes:
+            change = self._changes.popleft()
+            if isinstance(change, str):
+                lines.append(change)
+                continue
+
+            # a snapshot contains all earlier changes
+            lines = []
+            self._write_snapshot(change)
+
+        if lines:
+            self.debug_log("Appending %s changes to: %s", len(lines), self.journal_filename)
+            with open(self.journal_filename, 'a', encoding='utf8') as f:
+                f.write("".join(lines))
+            self._journal_has_data = True
+
+    def _write_snapshot(self, data):
+        """Write a snapshot of all data and remove all journals it contains."""
+        if self._journal_has_data:
+            # keep journals which were rotated before a crash
+            numbers = self._get_rotated_journal_numbers()
+            os.replace(self.journal_filename, self._get_rotated_journal_filename(numbers[-1] + 1 if numbers else 1))
+            self._journal_has_data = False
+
+        self.debug_log("Writing %s to: %s", self.name, self.filename)
+        # saving is atomic. once the snapshot exists it replaces the journals on load
+        FileManager.save(self.snapshot_filename, data)
+        self._finish_snapshot()
+
+    def _finish_snapshot(self):
+        """Remove all rotated journals and replace the data file by the snapshot."""
+        for number in self._get_rotated_journal_numbers():
+            os.remove(self._get_rotated_journal_filename(number))
+        os.replace(self.snapshot_filename, self.filename)
+
     def _writing_thread(self):  # pragma: no cover
         # prevent early writes at start-up
         time.sleep(self.min_wait_secs)
@@ -120,13 +302,9 @@ class DataManager(MpfController):
                 continue
             self._dirty.clear()
 
-            data = copy.deepcopy(self.data)
-            self.debug_log("Writing %s to: %s", self.name, self.filename)
-            # save data
-            FileManager.save(self.filename, data)
+            self._write_changes()
             # prevent too many writes
             time.sleep(self.min_wait_secs)
 
-        # if dirty write data one last time during shutdown
-        if self._dirty.is_set():
-            FileManager.save(self.filename, data)
+        # write remaining changes one last time during shutdown
+        self._write_changes()
@@ -56,6 +56,13 @@ class Device(LogMixin, metaclass=abc.ABCMeta):
         """Compare two devices."""
         return self.name < other.name
 
+    def is_monitorable_state_changing(self) -> bool:
+        """Return true if the monitorable state changes without writes to monitored attributes (e.g. during a fade).
+
+        Device monitors will check the state of the device again after every update while this is true.
+        """
+        return False
+
     @asyncio.coroutine
     def device_added_to_mode(self, mode: "Mode") -> Generator[int, None, None]:
         """Add a device to a running mode.
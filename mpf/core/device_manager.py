@@ -2,6 +2,8 @@
 import asyncio
 from collections import OrderedDict
 
+from typing import Callable, Dict, List, Any, Iterable, Tuple
+
 from mpf.core.utility_functions import Util
 from mpf.core.mpf_controller import MpfController
 
@@ -16,7 +18,8 @@ class DeviceManager(MpfController):
 
     config_name = "device_manager"
 
-    __slots__ = ["_monitorable_devices", "collections", "device_classes"]
+    __slots__ = ["_monitorable_devices", "collections", "device_classes", "monitors", "_dirty_devices",
+                 "_monitored_states", "_monitor_update_handle"]
 
     def __init__(self, machine):
         """Initialize device manager."""
@@ -24,6 +27,12 @@ class DeviceManager(MpfController):
 
         self._monitorable_devices = {}
 
+        # called with device, changes and full state at most once per device_monitor_update_ms
+        self.monitors = []                  # type: List[Callable[[Device, List[tuple], Dict[str, Any]], None]]
+        self._dirty_devices = OrderedDict()     # type: Dict[Device, None]
+        self._monitored_states = {}         # type: Dict[Device, Dict[str, Any]]
+        self._monitor_update_handle = None
+
         self.collections = OrderedDict()
         self.device_classes = OrderedDict()  # collection_name: device_class
 
@@ -53,17 +62,74 @@ class DeviceManager(MpfController):
             self._monitorable_devices[device.collection] = {}
         self._monitorable_devices[device.collection][device.name] = device
 
+    def add_monitor(self, monitor: Callable[["Device", List[tuple], Dict[str, Any]], None]):
+        """Add a monitor which is called with all changed attributes of a device."""
+        if not self.monitors:
+            # remember the current state to send only changes later
+            for collection in self._monitorable_devices.values():
+                for device in collection.values():
+                    self._monitored_states[device] = device.get_monitorable_state()
+
+        self.monitors.append(monitor)
+
+    def remove_monitor(self, monitor: Callable[["Device", List[tuple], Dict[str, Any]], None]):
+        """Remove a device monitor."""
+        if monitor in self.monitors:
+            self.monitors.remove(monitor)
+
+        if not self.monitors:
+            self._dirty_devices = OrderedDict()
+            self._monitored_states = {}
+            if self._monitor_update_handle:
+                self._monitor_update_handle.cancel()
+                self._monitor_update_handle = None
+
     def notify_device_changes(self, device, notify, old, value):
         """Notify subscribers about changes in a registered device.
 
+        Changes are collected and monitors are notified once per device_monitor_update_ms with the state of the device
+        at that time.
+
         Args:
             device: The device that changed.
-            notify:
+            notify: The name of the attribute which changed.
             old: The old value.
             value: The new value.
 
         """
-        self.machine.bcp.interface.notify_device_changes(device, notify, old, value)
+        del notify
+        del old
+        del value
+        if not self.monitors:
+            return
+
+        self._dirty_devices[device] = None
+        if not self._monitor_update_handle:
+            self._monitor_update_handle = self.machine.clock.loop.call_later(
+                self.machine.config['mpf']['device_monitor_update_ms'] / 1000, self.flush_device_changes)
+
+    def flush_device_changes(self):
+        """Notify monitors about all changed attributes of devices since the last flush."""
+        if self._monitor_update_handle:
+            self._monitor_update_handle.cancel()
+            self._monitor_update_handle = None
+
+        dirty_devices = self._dirty_devices
+        self._dirty_devices = OrderedDict()
+        for device in dirty_devices:
+            old_state = self._monitored_states.get(device, {})
+            state = device.get_monitorable_state()
+            self._monitored_states[device] = state
+
+            changes = [(attribute, old_state.get(attribute), value) for attribute, value in state.items()
+                       if old_state.get(attribute) != value]
+
+            if changes:
+                for monitor in self.monitors:
+                    monitor(device, changes, state)
+
+            if device.is_monitorable_state_changing():
+                self.notify_device_changes(device, None, None, None)
 
     def _load_device_config_spec(self, **kwargs):
         del kwargs
@@ -193,6 +259,9 @@ class DeviceManager(MpfController):
             for device_name in config:
                 collection[device_name].load_config(config[device_name])
 
+            # tags and numbers changed
+            collection.invalidate_indexes()
+
     @asyncio.coroutine
     def initialize_devices(self):
         """Initialise devices."""
@@ -213,6 +282,9 @@ class DeviceManager(MpfController):
             for device_name in config:
                 yield from collection[device_name].device_added_system_wide()
 
+            # platforms and hardware numbers are known now
+            collection.invalidate_indexes()
+
     # pylint: disable-msg=too-many-nested-blocks
     def get_device_control_events(self, config):
         """Scan a config dictionary for control_events.
@@ -309,9 +381,14 @@ class DeviceCollection(dict):
 
     One instance of this class will be created for each different type of
     hardware device (such as coils, lights, switches, ball devices, etc.).
+
+    Lookups by tag, number, platform and hardware number use indexes which are
+    built on first use. They are dropped when devices are added or removed and
+    when the device manager (re)loads or initialises devices.
     """
 
-    __slots__ = ["machine", "name", "config_section", "_tag_cache"]
+    __slots__ = ["machine", "name", "config_section", "_tag_cache", "_number_index", "_platform_index",
+                 "_hw_number_index"]
 
     def __init__(self, machine, collection, config_section):
         """Initialise device collection."""
@@ -321,13 +398,37 @@ class DeviceCollection(dict):
         self.name = collection
         self.config_section = config_section
         self._tag_cache = dict()
+        self._number_index = None       # type: Dict[Any, Device]
+        self._platform_index = None     # type: Dict[Any, List[Device]]
+        self._hw_number_index = None    # type: Dict[Tuple[Any, Any], Device]
+
+    def invalidate_indexes(self):
+        """Drop all indexes after devices changed their config, tags or hardware."""
+        self._tag_cache = dict()
+        self._number_index = None
+        self._platform_index = None
+        self._hw_number_index = None
+
+    def __setitem__(self, key, value):
+        """Add device for key."""
+        self.invalidate_indexes()
+        return super().__setitem__(key, value)
 
     def __delitem__(self, key):
         """Delete item for key."""
-        # clear the tag cache
-        self._tag_cache = dict()
+        self.invalidate_indexes()
         return super().__delitem__(key)
 
+    def pop(self, *args):
+        """Remove device and return it."""
+        self.invalidate_indexes()
+        return super().pop(*args)
+
+    def clear(self):
+        """Remove all devices."""
+        self.invalidate_indexes()
+        return super().clear()
+
     def __getattr__(self, attr):
         """Return device by key."""
         # We use this to allow the programmer to access a hardware item like
@@ -362,9 +463,84 @@ class DeviceCollection(dict):
             self._tag_cache[tag] = items
             return items
 
+    def items_tagged_all(self, tags: Iterable[str]) -> List["Device"]:
+        """Return a list of devices which have all of the tags (in collection order)."""
+        tag_lists = sorted((self.items_tagged(tag) for tag in tags), key=len)
+        if not tag_lists:
+            return []
+
+        other_tags = [set(items) for items in tag_lists[1:]]
+        return [item for item in tag_lists[0] if all(item in items for items in other_tags)]
+
+    def items_tagged_any(self, tags: Iterable[str]) -> List["Device"]:
+        """Return a list of devices which have at least one of the tags (in order of tags)."""
+        found = set()
+        result = []
+        for tag in tags:
+            for item in self.items_tagged(tag):
+                if item not in found:
+                    found.add(item)
+                    result.append(item)
+
+        return result
+
     def number(self, number):
         """Return a device object based on its number."""
-        for name, obj in self.items():
-            if obj.config['number'] == number:
-                return self[name]
-        raise AssertionError("Object not found for number {}".format(number))
+        if self._number_index is None:
+            self._number_index = {}
+            for obj in self:
+                # first device wins if a number is used twice
+                self._number_index.setdefault(obj.config.get('number'), obj)
+
+        try:
+            return self._number_index[number]
+        except (KeyError, TypeError):
+            raise AssertionError("Object not found for number {}".format(number))
+
+    def items_by_platform(self, platform) -> List["Device"]:
+        """Return a list of devices which use a certain platform."""
+        if self._platform_index is None:
+            self._platform_index = {}
+            for obj in self:
+                for obj_platform in self._get_platforms(obj):
+                    self._platform_index.setdefault(obj_platform, []).append(obj)
+
+        return self._platform_index.get(platform, [])
+
+    @staticmethod
+    def _get_platforms(device):
+        """Return all platforms of a device. Lights may use multiple platforms."""
+        platforms = getattr(device, "platforms", None)
+        if platforms:
+            return platforms
+        return [device.platform]
+
+    @staticmethod
+    def _get_hw_devices(device):
+        """Return (platform, hardware device) of all switches, drivers or light channels of a device."""
+        hw_devices = []
+        for attribute in ("hw_switch", "hw_driver"):
+            hw_device = getattr(device, attribute, None)
+            if hw_device is not None:
+                hw_devices.append((device.platform, hw_device))
+
+        # every light channel may use a different platform
+        hw_devices.extend(getattr(device, "hw_driver_platforms", []))
+
+        return hw_devices
+
+    def hw_number(self, platform, number):
+        """Return the device which uses a hardware number on a platform.
+
+        Light channels are indexed under the platform of each channel.
+        """
+        if self._hw_number_index is None:
+            self._hw_number_index = {}
+            for obj in self:
+                for hw_platform, hw_device in self._get_hw_devices(obj):
+                    self._hw_number_index.setdefault((hw_platform, hw_device.number), obj)
+
+        try:
+            return self._hw_number_index[(platform, number)]
+        except (KeyError, TypeError):
+            raise AssertionError("Object not found for hardware number {} on platform {}".format(number, platform))
@@ -1,13 +1,15 @@
 """Classes for the EventManager and QueuedEvents."""
 import inspect
+from bisect import bisect_left, bisect_right
 from collections import deque, namedtuple
-import uuid
+from itertools import count
+import weakref
 
 import asyncio
 from functools import partial
 from unittest.mock import MagicMock
 
-from typing import Dict, Any, Tuple, Optional, Generator, Callable, List
+from typing import Dict, Any, Tuple, Optional, Generator, Callable, List, Set
 
 from mpf.core.mpf_controller import MpfController
 
@@ -21,6 +23,13 @@ EventHandlerKey = namedtuple("EventHandlerKey", ["key", "event"])
 RegisteredHandler = namedtuple("RegisteredHandler", ["callback", "priority", "kwargs", "key", "condition",
                                                      "blocking_facility"])
 PostedEvent = namedtuple("PostedEvent", ["event", "type", "callback", "kwargs"])
+DispatchEntry = namedtuple("DispatchEntry", ["lane", "handler"])
+
+# Dispatch lanes for compiled handlers. Handlers in the fast lane neither have kwargs nor a condition and can be
+# called with the posted kwargs directly. All other lanes need the kwargs merged first.
+LANE_FAST = 0
+LANE_KWARGS = 1
+LANE_CONDITION = 2
 
 
 class EventManager(MpfController):
@@ -29,7 +38,9 @@ class EventManager(MpfController):
 
     config_name = "event_manager"
 
-    __slots__ = ["registered_handlers", "event_queue", "callback_queue", "monitor_events", "_queue_tasks"]
+    __slots__ = ["registered_handlers", "event_queue", "callback_queue", "monitor_events", "_queue_tasks",
+                 "_dispatch_plans", "_handler_priorities", "_handlers_by_key", "_keys_by_callback",
+                 "_handler_key_counter", "_verified_handler_functions", "_pending_queue_events"]
 
     def __init__(self, machine: "MachineController") -> None:
         """Initialize EventManager."""
@@ -39,7 +50,14 @@ class EventManager(MpfController):
         self.event_queue = deque([])        # type: Deque[PostedEvent]
         self.callback_queue = deque([])     # type: Deque[Tuple[Any, dict]]
         self.monitor_events = False
-        self._queue_tasks = []              # type: List[asyncio.Task]
+        self._queue_tasks = set()           # type: Set[asyncio.Task]
+        self._pending_queue_events = deque()    # type: Deque[Tuple[str, Any, dict]]
+        self._dispatch_plans = {}           # type: Dict[str, Tuple[DispatchEntry, ...]]
+        self._handler_priorities = {}       # type: Dict[str, List[int]]
+        self._handlers_by_key = {}          # type: Dict[int, Tuple[str, RegisteredHandler]]
+        self._keys_by_callback = {}         # type: Dict[Any, Dict[int, str]]
+        self._handler_key_counter = count()
+        self._verified_handler_functions = weakref.WeakSet()    # type: weakref.WeakSet
 
         self.add_handler("debug_dump_stats", self._debug_dump_events)
 
@@ -47,8 +65,9 @@ class EventManager(MpfController):
         del kwargs
         self.log.info("--- DEBUG DUMP EVENTS ---")
         self.log.info("Total registered_handlers: %s. Total event_queue: %s. Total callback_queue: %s. "
-                      "Total _queue_tasks: %s", len(self.registered_handlers), len(self.event_queue),
-                      len(self.callback_queue), len(self._queue_tasks))
+                      "Total _queue_tasks: %s. Total _pending_queue_events: %s", len(self.registered_handlers),
+                      len(self.event_queue), len(self.callback_queue), len(self._queue_tasks),
+                      len(self._pending_queue_events))
         self.log.info("Registered Handlers:")
         handlers = sorted(self.registered_handlers.items(), key=lambda x: -len(x[1]))
         for event_name, event_list in handlers:
@@ -125,7 +144,7 @@ class EventManager(MpfController):
                 conflict, the event-level ones will win.
 
         Returns:
-            A GUID reference to the handler which you can use to later remove
+            A unique key of the handler which you can use to later remove
             the handler via ``remove_handler_by_key``.
 
         For example:
@@ -147,30 +166,20 @@ class EventManager(MpfController):
             raise ValueError('Cannot handle events with spaces in the event name, '
                              'please remedy "{}"'.format(event))
 
-        sig = inspect.signature(handler)
-        if 'kwargs' not in sig.parameters:
-            raise AssertionError("Handler {} for event '{}' is missing **kwargs. Actual signature: {}".format(
-                handler, event, sig))
-
-        if sig.parameters['kwargs'].kind != inspect.Parameter.VAR_KEYWORD:
-            raise AssertionError("Handler {} for event '{}' param kwargs is missing '**'. Actual signature: {}".format(
-                handler, event, sig))
+        self._verify_handler_signature(handler, event)
 
         event, condition = self.get_event_and_condition_from_string(event)
 
-        # Add an entry for this event if it's not there already
-        if event not in self.registered_handlers:
-            self.registered_handlers[event] = []
-
-        key = uuid.uuid4()
+        key = next(self._handler_key_counter)
 
-        # An event 'handler' in our case is a tuple with 4 elements:
-        # the handler method, priority, dict of kwargs, & uuid key
+        # An event 'handler' in our case is a tuple with 6 elements:
+        # the handler method, priority, dict of kwargs, key, condition and
+        # blocking facility
         if hasattr(handler, "relative_priority") and not isinstance(handler, MagicMock):
             priority += handler.relative_priority
 
-        self.registered_handlers[event].append(RegisteredHandler(handler, priority, kwargs, key, condition,
-                                                                 blocking_facility))
+        registered_handler = RegisteredHandler(handler, priority, kwargs, key, condition, blocking_facility)
+        self._insert_handler(event, registered_handler)
 
         if self._debug:
             try:
@@ -180,16 +189,109 @@ class EventManager(MpfController):
             except IndexError:
                 pass
 
-        # Sort the handlers for this event based on priority. We do it now
-        # so the list is pre-sorted so we don't have to do that with each
-        # event post.
-        self.registered_handlers[event].sort(key=lambda x: x.priority, reverse=True)
-
         if self._info:
             self._verify_handlers(event, self.registered_handlers[event])
 
         return EventHandlerKey(key, event)
 
+    def _verify_handler_signature(self, handler: Any, event: str) -> None:
+        """Verify that a handler accepts **kwargs.
+
+        The result is cached per function so bound methods and partials of
+        the same function are only inspected once.
+        """
+        func = handler
+        while isinstance(func, partial):
+            func = func.func
+        func = getattr(func, "__func__", func)
+
+        try:
+            if func in self._verified_handler_functions:
+                return
+        except TypeError:
+            pass
+
+        sig = inspect.signature(handler)
+        if 'kwargs' not in sig.parameters:
+            raise AssertionError("Handler {} for event '{}' is missing **kwargs. Actual signature: {}".format(
+                handler, event, sig))
+
+        if sig.parameters['kwargs'].kind != inspect.Parameter.VAR_KEYWORD:
+            raise AssertionError("Handler {} for event '{}' param kwargs is missing '**'. Actual signature: {}".format(
+                handler, event, sig))
+
+        try:
+            self._verified_handler_functions.add(func)
+        except TypeError:
+            # some builtins cannot be weak referenced. just check them every time
+            pass
+
+    def _insert_handler(self, event: str, handler: RegisteredHandler) -> None:
+        """Insert a handler into the sorted handler list of an event and index it."""
+        handlers = self.registered_handlers.get(event)
+        if handlers is None:
+            handlers = self.registered_handlers[event] = []
+            priorities = self._handler_priorities[event] = []
+        else:
+            priorities = self._handler_priorities[event]
+
+        # Priorities are stored negated so the list is ascending. Inserting
+        # right of equal priorities keeps the order of registration.
+        index = bisect_right(priorities, -handler.priority)
+        priorities.insert(index, -handler.priority)
+        handlers.insert(index, handler)
+        self._dispatch_plans.pop(event, None)
+
+        self._handlers_by_key[handler.key] = (event, handler)
+        try:
+            self._keys_by_callback.setdefault(handler.callback, {})[handler.key] = event
+        except TypeError:
+            # unhashable callbacks are not indexed. see _get_keys_for_callback
+            pass
+
+    def _get_keys_for_callback(self, callback: Any) -> List[int]:
+        """Return the keys of all handlers registered with callback."""
+        try:
+            return list(self._keys_by_callback.get(callback, ()))
+        except TypeError:
+            return [handler.key for _, handler in self._handlers_by_key.values() if handler.callback == callback]
+
+    def _remove_handler_with_key(self, key: int) -> None:
+        """Remove a handler from its event and all indexes."""
+        try:
+            event, handler = self._handlers_by_key.pop(key)
+        except KeyError:
+            return
+
+        handlers = self.registered_handlers[event]
+        priorities = self._handler_priorities[event]
+        # only handlers with the same priority need to be searched
+        start = bisect_left(priorities, -handler.priority)
+        end = bisect_right(priorities, -handler.priority, start)
+        for index in range(start, end):
+            if handlers[index].key == key:
+                del handlers[index]
+                del priorities[index]
+                break
+        self._dispatch_plans.pop(event, None)
+
+        try:
+            callback_keys = self._keys_by_callback[handler.callback]
+        except (KeyError, TypeError):
+            pass
+        else:
+            callback_keys.pop(key, None)
+            if not callback_keys:
+                del self._keys_by_callback[handler.callback]
+
+        if self._debug:
+            try:
+                self.debug_log("Removing method %s from event %s", (str(handler.callback).split(' '))[2], event)
+            except IndexError:
+                pass
+
+        self._remove_event_if_empty(event)
+
     def _verify_handlers(self, event, sorted_handlers):
         """Verify that no races can happen."""
         if not sorted_handlers:
@@ -249,17 +351,10 @@ class EventManager(MpfController):
         # If we don't have kwargs, then we'll look for just the handler meth.
         # If we have kwargs, we'll look for that combination. If it finds it,
         # remove it.
-        if event in self.registered_handlers:
-            if kwargs:
-                # slice the full list [:] to make a copy so we can delete from the
-                # original while iterating
-                for rh in self.registered_handlers[event][:]:
-                    if rh[0] == handler and rh[2] == kwargs:
-                        self.registered_handlers[event].remove(rh)
-            else:
-                for rh in self.registered_handlers[event][:]:
-                    if rh[0] == handler:
-                        self.registered_handlers[event].remove(rh)
+        for key in self._get_keys_for_callback(handler):
+            registered_event, registered_handler = self._handlers_by_key[key]
+            if registered_event == event and (not kwargs or registered_handler.kwargs == kwargs):
+                self._remove_handler_with_key(key)
 
         return self.add_handler(event, handler, priority, **kwargs)
 
@@ -268,8 +363,8 @@ class EventManager(MpfController):
 
         Use carefully. This is currently used to remove handlers for all init events which only occur once.
         """
-        if event in self.registered_handlers:
-            del self.registered_handlers[event]
+        for handler in self.registered_handlers.get(event, [])[:]:
+            self._remove_handler_with_key(handler.key)
 
     def remove_handler(self, method: Any) -> None:
         """Remove an event handler from all events a method is registered to handle.
@@ -277,17 +372,8 @@ class EventManager(MpfController):
         Args:
             method : The method whose handlers you want to remove.
         """
-        events_to_delete_if_empty = []
-        for event, handler_list in self.registered_handlers.items():
-            for handler_tup in handler_list[:]:  # copy via slice
-                if handler_tup[0] == method:
-                    handler_list.remove(handler_tup)
-                    if self._debug:
-                        self.debug_log("Removing method %s from event %s", (str(method).split(' '))[2], event)
-                    events_to_delete_if_empty.append(event)
-
-        for event in events_to_delete_if_empty:
-            self._remove_event_if_empty(event)
+        for key in self._get_keys_for_callback(method):
+            self._remove_handler_with_key(key)
 
     def remove_handler_by_event(self, event: str, handler: Any) -> None:
         """Remove the handler you pass from the event you pass.
@@ -302,17 +388,9 @@ class EventManager(MpfController):
         handler / event combination, regardless of whether the keyword
         arguments match or not.
         """
-        events_to_delete_if_empty = []
-        if event in self.registered_handlers:
-            for handler_tup in self.registered_handlers[event][:]:
-                if handler_tup[0] == handler:
-                    self.registered_handlers[event].remove(handler_tup)
-                    if self._debug:
-                        self.debug_log("Removing method %s from event %s", (str(handler).split(' '))[2], event)
-                    events_to_delete_if_empty.append(event)
-
-        for this_event in events_to_delete_if_empty:
-            self._remove_event_if_empty(this_event)
+        for key in self._get_keys_for_callback(handler):
+            if self._handlers_by_key[key][0] == event:
+                self._remove_handler_with_key(key)
 
     def remove_handler_by_key(self, key: EventHandlerKey) -> None:
         """Remove a registered event handler by key.
@@ -320,17 +398,7 @@ class EventManager(MpfController):
         Args:
             key: The key of the handler you want to remove
         """
-        if key.event not in self.registered_handlers:
-            return
-        events_to_delete_if_empty = []
-        for handler_tup in self.registered_handlers[key.event][:]:  # copy via slice
-            if handler_tup.key == key.key:
-                self.registered_handlers[key.event].remove(handler_tup)
-                if self._debug:
-                    self.debug_log("Removing method %s from event %s", (str(handler_tup[0]).split(' '))[2], key.event)
-                events_to_delete_if_empty.append(key.event)
-        for event in events_to_delete_if_empty:
-            self._remove_event_if_empty(event)
+        self._remove_handler_with_key(key.key)
 
     def remove_handlers_by_keys(self, key_list: List[EventHandlerKey]) -> None:
         """Remove multiple event handlers based on a passed list of keys.
@@ -339,7 +407,7 @@ class EventManager(MpfController):
             key_list: A list of keys of the handlers you want to remove
         """
         for key in key_list:
-            self.remove_handler_by_key(key)
+            self._remove_handler_with_key(key.key)
 
     def _remove_event_if_empty(self, event: str) -> None:
         # Checks to see if the event doesn't have any more registered handlers,
@@ -350,10 +418,39 @@ class EventManager(MpfController):
 
         if not self.registered_handlers[event]:  # if value is empty list
             del self.registered_handlers[event]
+            del self._handler_priorities[event]
+            self._dispatch_plans.pop(event, None)
             if self._debug:
                 self.debug_log("Removing event %s since there are no more"
                                " handlers registered for it", event)
 
+    def _get_dispatch_plan(self, event: str) -> Tuple[DispatchEntry, ...]:
+        """Return the compiled dispatch plan for an event.
+
+        The plan is an immutable snapshot of the (sorted) handlers of an event. It is compiled on the first post after
+        a handler for this event has been added or removed. Since it is never mutated, a post can iterate it without
+        copying. Handlers added while an event is processed will not be called for that post.
+        """
+        try:
+            return self._dispatch_plans[event]
+        except KeyError:
+            pass
+
+        plan = []
+        for handler in self.registered_handlers.get(event, []):
+            if handler.condition is not None:
+                lane = LANE_CONDITION
+            elif handler.kwargs:
+                lane = LANE_KWARGS
+            else:
+                lane = LANE_FAST
+            plan.append(DispatchEntry(lane, handler))
+
+        compiled_plan = tuple(plan)
+        if compiled_plan:
+            self._dispatch_plans[event] = compiled_plan
+        return compiled_plan
+
     def wait_for_event(self, event_name: str) -> asyncio.Future:
         """Wait for event."""
         return self.wait_for_any_event([event_name])
@@ -568,28 +665,26 @@ class EventManager(MpfController):
                                this_event[2], this_event[3])
             self.debug_log("+========================================")
 
-    @asyncio.coroutine
-    def _run_handlers_sequential(self, event: str, callback, kwargs: dict) -> Generator[int, None, None]:
-        """Run all handlers for an event."""
-        if self._debug:
-            self.debug_log("^^^^ Processing queue event '%s'. Callback: %s,"
-                           " Args: %s", event, callback, kwargs)
-
-        # all handlers may have been removed in the meantime
-        if event not in self.registered_handlers:
-            return
+    def _run_queue_handlers(self, event: str, callback, kwargs: dict, plan: Tuple[DispatchEntry, ...],
+                            index: int) -> bool:
+        """Run the handlers of a queue event inline starting at index.
 
-        # Now let's call the handlers one-by-one, including any kwargs
-        for handler in self.registered_handlers[event][:]:
-            # use slice above so we don't process new handlers that came
-            # in while we were processing previous handlers
+        Returns True if all handlers are done. If a handler registers a wait
+        this returns False and a task will run the remaining handlers (and the
+        callback) once the wait has been cleared.
+        """
+        while index < len(plan):
+            lane, handler = plan[index]
+            index += 1
 
             # merge the post's kwargs with the registered handler's kwargs
             # in case of conflict, handlers kwargs will win
-            merged_kwargs = dict(list(kwargs.items()) + list(handler.kwargs.items()))
+            merged_kwargs = dict(kwargs)
+            if lane != LANE_FAST:
+                merged_kwargs.update(handler.kwargs)
 
             # if condition exists and is not true skip
-            if handler.condition is not None and not handler.condition.evaluate(merged_kwargs):
+            if lane == LANE_CONDITION and not handler.condition.evaluate(merged_kwargs):
                 continue
 
             # log if debug is enabled and this event is not the timer tick
@@ -603,45 +698,62 @@ class EventManager(MpfController):
                     pass
 
             # call the handler and save the results
-
             try:
-                queue = merged_kwargs.pop('queue')
+                handler_queue = merged_kwargs.pop('queue')
             except KeyError:
-                queue = QueuedEvent(self.debug_log)
+                # every handler gets its own queue because it may keep it and wait later
+                handler_queue = QueuedEvent(self.debug_log)
 
-            handler.callback(queue=queue, **merged_kwargs)
+            handler.callback(queue=handler_queue, **merged_kwargs)
 
-            if queue.waiter:
-                queue.event = asyncio.Event(loop=self.machine.clock.loop)
-                yield from queue.event.wait()
+            if handler_queue.waiter:
+                handler_queue.event = asyncio.Event(loop=self.machine.clock.loop)
+                task = self.machine.clock.loop.create_task(
+                    self._resume_queue_event(event, callback, kwargs, plan, index, handler_queue))
+                task.add_done_callback(self._done)
+                self._queue_tasks.add(task)
+                return False
 
         if self._debug:
             self.debug_log("vvvv Finished queue event '%s'. Callback: %s. "
                            "Args: %s", event, callback, kwargs)
 
-        if callback:
+        return True
+
+    @asyncio.coroutine
+    def _resume_queue_event(self, event: str, callback, kwargs: dict, plan: Tuple[DispatchEntry, ...], index: int,
+                            queue: "QueuedEvent") -> Generator[int, None, None]:
+        """Wait for a queue to clear and run the remaining handlers of a queue event."""
+        yield from queue.event.wait()
+
+        if self._run_queue_handlers(event, callback, kwargs, plan, index) and callback:
             callback(**kwargs)
 
     def _run_handlers(self, event: str, ev_type: Optional[str], kwargs: dict) -> Any:
         """Run all handlers for an event."""
         result = None
-        for handler in self.registered_handlers[event][:]:
-            # use slice above so we don't process new handlers that came
-            # in while we were processing previous handlers
-
-            if '_min_priority' in kwargs and handler.blocking_facility and \
+        # the plan is an immutable snapshot so handlers added while we are
+        # processing this event will not be called
+        for lane, handler in self._get_dispatch_plan(event):
+            if handler.blocking_facility and '_min_priority' in kwargs and \
                 (kwargs['_min_priority']['all'] > handler.priority or (
                     handler.blocking_facility in kwargs['_min_priority'] and
                     kwargs['_min_priority'][handler.blocking_facility] > handler.priority)):
                 continue
 
-            # merge the post's kwargs with the registered handler's kwargs
-            # in case of conflict, handler kwargs will win
-            merged_kwargs = dict(list(kwargs.items()) + list(handler.kwargs.items()))
+            if lane == LANE_FAST:
+                # no handler kwargs and no condition. the call below will
+                # copy kwargs anyway
+                merged_kwargs = kwargs
+            else:
+                # merge the post's kwargs with the registered handler's kwargs
+                # in case of conflict, handler kwargs will win
+                merged_kwargs = dict(kwargs)
+                merged_kwargs.update(handler.kwargs)
 
-            # if condition exists and is not true skip
-            if handler.condition is not None and not handler.condition.evaluate(merged_kwargs):
-                continue
+                # if condition exists and is not true skip
+                if lane == LANE_CONDITION and not handler.condition.evaluate(merged_kwargs):
+                    continue
 
             if self._debug:
                 try:
@@ -680,15 +792,42 @@ class EventManager(MpfController):
         if event not in self.registered_handlers:
             # fast path if there are not handlers
             self.callback_queue.append((callback, kwargs))
-        else:
-            task = self.machine.clock.loop.create_task(self._run_handlers_sequential(event, callback, kwargs))
-            task.add_done_callback(self._done)
-            self._queue_tasks.append(task)
+            return
+
+        # queue events run after the current events have been processed. all
+        # queue events posted until then are run in one batch
+        if not self._pending_queue_events:
+            self.machine.clock.loop.call_soon(self._run_pending_queue_events)
+        self._pending_queue_events.append((event, callback, kwargs))
+
+    def _run_pending_queue_events(self) -> None:
+        """Run handlers of all pending queue events inline.
+
+        A task is only created when a handler registers a wait.
+        """
+        try:
+            while self._pending_queue_events:
+                event, callback, kwargs = self._pending_queue_events.popleft()
+
+                if self._debug:
+                    self.debug_log("^^^^ Processing queue event '%s'. Callback: %s,"
+                                   " Args: %s", event, callback, kwargs)
+
+                # all handlers may have been removed in the meantime
+                if event not in self.registered_handlers:
+                    continue
+
+                if self._run_queue_handlers(event, callback, kwargs, self._get_dispatch_plan(event), 0) and callback:
+                    callback(**kwargs)
+        finally:
+            # in case a handler crashed continue with the other events later
+            if self._pending_queue_events:
+                self.machine.clock.loop.call_soon(self._run_pending_queue_events)
 
     def _done(self, future):
-        """Remove queue task from list and evaluate result."""
+        """Remove queue task from set and evaluate result."""
         future.result()
-        self._queue_tasks.remove(future)
+        self._queue_tasks.discard(future)
 
     def _process_event(self, event: str, ev_type: Optional[str], callback=None, **kwargs: dict) -> None:
         # Internal method which actually handles the events. Don't call this.
@@ -755,6 +894,8 @@ class QueuedEvent:
 
     """Base class for an event queue which is created each time a queue event is called."""
 
+    __slots__ = ["debug_log", "waiter", "event"]
+
     def __init__(self, debug_log: Callable[[str], None]) -> None:
         """Initialize QueueEvent."""
         self.debug_log = debug_log
@@ -2,11 +2,14 @@
 
 import logging
 import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
 from mpf.file_interfaces.yaml_interface import YamlInterface
 
 MYPY = False
 if MYPY:    # noqa
-    from typing import Dict
+    from typing import Dict, Tuple, Any, List
 
 
 class FileManager:
@@ -17,6 +20,11 @@ class FileManager:
     file_interfaces = dict()    # type: Dict[str, YamlInterface]
     initialized = False
 
+    # configs parsed by preload which have not been loaded yet by (filename, verify_version)
+    preloaded_files = dict()    # type: Dict[Tuple[str, Any], Any]
+    # starting worker processes only pays off for a couple of files
+    min_files_for_preload = 4
+
     @classmethod
     def init(cls):
         """Initialise file interfaces."""
@@ -89,6 +97,11 @@ class FileManager:
                 "Could not find file '{}'. Resolved abs path to {}".format(
                     filename, os.path.abspath(filename)))
 
+        try:
+            return FileManager.preloaded_files.pop((file, verify_version))
+        except KeyError:
+            pass
+
         ext = os.path.splitext(file)[1]
 
         try:
@@ -98,6 +111,33 @@ class FileManager:
 
         return interface.load(file, verify_version, halt_on_error)
 
+    @staticmethod
+    def preload(filenames: "List[str]", verify_version=False) -> None:
+        """Parse multiple files in parallel.
+
+        The results are returned by the next call to load for each file. Files which fail to parse are skipped and
+        will report their error when they are loaded.
+        """
+        filenames = [filename for filename in set(filenames)
+                     if (filename, verify_version) not in FileManager.preloaded_files and os.path.isfile(filename)]
+        if len(filenames) < FileManager.min_files_for_preload:
+            return
+
+        FileManager.log.debug("Preloading %s files", len(filenames))
+        workers = min(len(filenames), os.cpu_count() or 1)
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                configs = list(executor.map(_preload_file, filenames, repeat(verify_version),
+                                            chunksize=max(1, len(filenames) // (workers * 4))))
+        # worker processes may not be available on this platform. files will be loaded one by one then
+        except Exception as e:   # pylint: disable-msg=broad-except
+            FileManager.log.warning("Could not preload files: %s", e)
+            return
+
+        for filename, config in zip(filenames, configs):
+            if config is not None:
+                FileManager.preloaded_files[(filename, verify_version)] = config
+
     @staticmethod
     def save(filename, data):
         """Save data to file."""
@@ -116,3 +156,11 @@ class FileManager:
 
         # move temp file
         os.replace(temp_file, filename)
+
+
+def _preload_file(filename, verify_version):
+    """Parse a file in a worker process."""
+    try:
+        return FileManager.load(filename, verify_version, True)
+    except Exception:   # pylint: disable-msg=broad-except
+        return None
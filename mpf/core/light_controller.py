@@ -1,6 +1,5 @@
 """Handles all light updates."""
-import asyncio
-from typing import Dict
+from typing import Dict, Set, Iterable
 
 from mpf.core.machine import MachineController
 from mpf.core.settings_controller import SettingEntry
@@ -9,6 +8,10 @@ from mpf.core.rgb_color import RGBColorCorrectionProfile, RGBColor
 
 from mpf.core.mpf_controller import MpfController
 
+MYPY = False
+if MYPY:   # pragma: no cover
+    from mpf.core.platform import LightsPlatform
+
 
 class LightController(MpfController):
 
@@ -26,7 +29,9 @@ class LightController(MpfController):
         # will only get initialised if there are lights
         self._initialised = False
 
-        self._monitor_update_task = None                    # type: asyncio.Task
+        # platforms which need a light_sync once the current batch of light updates is done
+        self._light_sync_depth = 0
+        self._light_sync_platforms = set()                  # type: Set[LightsPlatform]
 
         if 'named_colors' in self.machine.config:
             self._load_named_colors()
@@ -72,28 +77,26 @@ class LightController(MpfController):
         self.machine.settings.add_setting(SettingEntry("brightness", "Brightness", 100, "brightness", 1.0,
                                                        {0.25: "25%", 0.5: "50%", 0.75: "75%", 1.0: "100% (default)"}))
 
-    def monitor_lights(self):
-        """Update the color of lights for the monitor."""
-        if not self._monitor_update_task:
-            self._monitor_update_task = self.machine.clock.loop.create_task(self._monitor_update_lights())
-            self._monitor_update_task.add_done_callback(self._done)
-
-    @staticmethod
-    def _done(future: asyncio.Future):
-        try:
-            future.result()
-        except asyncio.CancelledError:
-            pass
-
-    @asyncio.coroutine
-    def _monitor_update_lights(self):
-        colors = {}
-        while True:
-            for light in self.machine.lights:
-                color = light.get_color()
-                old = colors.get(light, None)
-                if old != color:
-                    self.machine.device_manager.notify_device_changes(light, "color", old, color)
-                    colors[light] = color
-            yield from asyncio.sleep(1 / self.machine.config['mpf']['default_light_hw_update_hz'],
-                                     loop=self.machine.clock.loop)
+    def defer_light_sync(self):
+        """Collect light syncs of all following light updates until flush_light_sync is called."""
+        self._light_sync_depth += 1
+
+    def flush_light_sync(self):
+        """Sync all platforms with light updates since defer_light_sync once."""
+        self._light_sync_depth -= 1
+        if self._light_sync_depth:
+            return
+
+        platforms = self._light_sync_platforms
+        self._light_sync_platforms = set()
+        for platform in platforms:
+            platform.light_sync()
+
+    def light_sync(self, platforms: Iterable["LightsPlatform"]):
+        """Sync platforms after a light update or defer the sync when light updates are batched."""
+        if self._light_sync_depth:
+            self._light_sync_platforms.update(platforms)
+            return
+
+        for platform in platforms:
+            platform.light_sync()
@@ -0,0 +1,122 @@
+"""Shared scheduler which advances software and long fades of all light channels."""
+import weakref
+from asyncio import AbstractEventLoop
+
+from typing import Callable, Tuple, Dict, Any
+
+MYPY = False
+if MYPY:   # pragma: no cover
+    from mpf.platforms.interfaces.light_platform_interface import LightPlatformDirectFade
+
+
+class _FadeBucket:
+
+    """All fading channels which share the same fade interval."""
+
+    __slots__ = ["interval_ms", "lights", "timer", "next_tick"]
+
+    def __init__(self, interval_ms: int) -> None:
+        """Initialise bucket."""
+        self.interval_ms = interval_ms
+        self.lights = {}    # type: Dict[LightPlatformDirectFade, Callable[[int], Tuple[float, int]]]
+        self.timer = None   # type: Any
+        self.next_tick = None   # type: float
+
+
+class LightFadeScheduler:
+
+    """Advance all running fades of one loop with one timer per fade interval.
+
+    Instead of running one task per light channel, channels register their fade callback here. Channels with the same
+    interval (usually derived from default_light_hw_update_hz) are updated in one pass so their fades stay aligned.
+    """
+
+    __slots__ = ["loop", "_buckets", "_bucket_by_light", "__weakref__"]
+
+    _schedulers = weakref.WeakKeyDictionary()     # type: weakref.WeakKeyDictionary
+
+    def __init__(self, loop: AbstractEventLoop) -> None:
+        """Initialise fade scheduler."""
+        self.loop = loop
+        self._buckets = {}              # type: Dict[int, _FadeBucket]
+        self._bucket_by_light = {}      # type: Dict[LightPlatformDirectFade, _FadeBucket]
+
+    @classmethod
+    def get_scheduler(cls, loop: AbstractEventLoop) -> "LightFadeScheduler":
+        """Return the scheduler for a loop."""
+        try:
+            return cls._schedulers[loop]
+        except KeyError:
+            scheduler = cls(loop)
+            cls._schedulers[loop] = scheduler
+            return scheduler
+
+    def add_fade(self, light: "LightPlatformDirectFade",
+                 color_and_fade_callback: Callable[[int], Tuple[float, int]]):
+        """Continue a fade of a light in the next tick of its interval.
+
+        This replaces any running fade of the light.
+        """
+        interval_ms = light.get_fade_interval_ms()
+        bucket = self._bucket_by_light.get(light)
+        if bucket and bucket.interval_ms != interval_ms:
+            self.remove_fade(light)
+            bucket = None
+
+        if not bucket:
+            bucket = self._buckets.get(interval_ms)
+            if not bucket:
+                bucket = _FadeBucket(interval_ms)
+                self._buckets[interval_ms] = bucket
+            self._bucket_by_light[light] = bucket
+
+        bucket.lights[light] = color_and_fade_callback
+        if not bucket.timer:
+            bucket.next_tick = self.loop.time() + interval_ms / 1000
+            bucket.timer = self.loop.call_at(bucket.next_tick, self._tick, bucket)
+
+    def remove_fade(self, light: "LightPlatformDirectFade"):
+        """Stop a running fade of a light."""
+        bucket = self._bucket_by_light.pop(light, None)
+        if not bucket:
+            return
+        del bucket.lights[light]
+        if not bucket.lights:
+            self._remove_bucket(bucket)
+
+    def is_fading(self, light: "LightPlatformDirectFade") -> bool:
+        """Return true if the light has a running fade."""
+        return light in self._bucket_by_light
+
+    def _remove_bucket(self, bucket: _FadeBucket):
+        if bucket.timer:
+            bucket.timer.cancel()
+            bucket.timer = None
+        if self._buckets.get(bucket.interval_ms) is bucket:
+            del self._buckets[bucket.interval_ms]
+
+    def _tick(self, bucket: _FadeBucket):
+        """Advance all fades of one interval.
+
+        A channel which raises is dropped. The other channels continue in the next tick.
+        """
+        bucket.timer = None
+        try:
+            for light, color_and_fade_callback in list(bucket.lights.items()):
+                if bucket.lights.get(light) is not color_and_fade_callback:
+                    # fade was replaced or stopped during this pass
+                    continue
+                continue_fade = False
+                try:
+                    continue_fade = light.fade_step(color_and_fade_callback)
+                finally:
+                    if not continue_fade:
+                        del bucket.lights[light]
+                        del self._bucket_by_light[light]
+        finally:
+            if not bucket.lights:
+                self._remove_bucket(bucket)
+            elif not bucket.timer:
+                # schedule relative to the last tick to prevent drift
+                bucket.next_tick = max(bucket.next_tick + bucket.interval_ms / 1000, self.loop.time())
+                bucket.timer = self.loop.call_at(bucket.next_tick, self._tick, bucket)
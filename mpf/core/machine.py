@@ -276,6 +276,9 @@ class MachineController(LogMixin):
         self.events.remove_all_handlers_for_event("init_phase_4")
         self.events.remove_all_handlers_for_event("init_phase_5")
 
+        # all configs of devices and modes are validated by now
+        self.config_validator.save_validation_cache()
+
         self.clear_boot_hold('init')
 
     @asyncio.coroutine
@@ -401,6 +404,10 @@ class MachineController(LogMixin):
         self.set_machine_var(name="platform_version", value=platform_info[2])
         self.set_machine_var(name="platform_machine", value=machine())
 
+        # later changes are only journaled. start with a snapshot of all persisted vars
+        if self.config['mpf']['save_machine_vars_to_disk']:
+            self._write_machine_vars_to_disk()
+
     def _load_initial_machine_vars(self) -> None:
         """Load initial machine var values from config if they did not get loaded from data."""
         if 'machine_vars' not in self.config:
@@ -434,6 +441,11 @@ class MachineController(LogMixin):
             config_files, "machine", load_from_cache=not self.options['no_load_cache'],
             store_to_cache=self.options['create_config_cache'])
 
+        if self.options['create_config_cache']:
+            self.config_validator.load_validation_cache(
+                self.config_processor.get_validation_cache_filename(config_files),
+                load_from_cache=not self.options['no_load_cache'])
+
     def verify_system_info(self):
         """Dump information about the Python installation to the log.
 
@@ -702,6 +714,8 @@ class MachineController(LogMixin):
     def shutdown(self) -> None:
         """Shutdown the machine."""
         self.thread_stopper.set()
+        # store configs of shows which got validated later on
+        self.config_validator.save_validation_cache()
         if hasattr(self, "device_manager"):
             self.device_manager.stop_devices()
         self._platform_stop()
@@ -734,7 +748,13 @@ class MachineController(LogMixin):
     def _write_machine_var_to_disk(self, name: str) -> None:
         """Write value to disk."""
         if self.machine_vars[name]['persist'] and self.config['mpf']['save_machine_vars_to_disk']:
-            self._write_machine_vars_to_disk()
+            self.machine_var_data_manager.set_value(
+                name, {"value": self.machine_vars[name]["value"], "expire": self.machine_vars[name]['expire_secs']})
+
+    def _remove_machine_var_from_disk(self, name: str) -> None:
+        """Remove value from disk."""
+        if self.config['mpf']['save_machine_vars_to_disk']:
+            self.machine_var_data_manager.remove_key(name)
 
     def _write_machine_vars_to_disk(self):
         """Update machine vars on disk."""
@@ -848,7 +868,7 @@ class MachineController(LogMixin):
         try:
             prev_value = self.machine_vars[name]
             del self.machine_vars[name]
-            self._write_machine_vars_to_disk()
+            self._remove_machine_var_from_disk(name)
         except KeyError:
             pass
         else:
@@ -870,8 +890,7 @@ class MachineController(LogMixin):
         for var in list(self.machine_vars.keys()):
             if var.startswith(startswith) and var.endswith(endswith):
                 del self.machine_vars[var]
-
-        self._write_machine_vars_to_disk()
+                self._remove_machine_var_from_disk(var)
 
     def get_platform_sections(self, platform_section: str, overwrite: str) -> "SmartVirtualHardwarePlatform":
         """Return platform section."""
@@ -462,6 +462,8 @@ class Mode(LogMixin):
                     # load config
                     device.load_config(settings)
 
+            getattr(self.machine, collection_name).invalidate_indexes()
+
         for collection_name, device_class in iter(self.machine.device_manager.device_classes.items()):
             # check if there is config for the device type
             if device_class.config_section not in self.config:
@@ -472,6 +474,8 @@ class Mode(LogMixin):
                 device = collection[device]
                 yield from device.device_added_to_mode(mode=self)
 
+            getattr(self.machine, collection_name).invalidate_indexes()
+
     def _remove_mode_devices(self) -> None:
         for device in self.mode_devices:
             device.device_removed_from_mode(self)
@@ -108,6 +108,11 @@ class ModeController(MpfController):
 
         self._build_mode_folder_dicts()
 
+        # parse the config files of all modes at once
+        self.machine.config_processor.preload_config_files(
+            [self._get_mode_config_files(mode) for mode in set(self.machine.config['modes'])], "mode",
+            load_from_cache=not self.machine.options['no_load_cache'])
+
         for mode in set(self.machine.config['modes']):
 
             if mode in self.machine.modes:
@@ -163,7 +168,7 @@ class ModeController(MpfController):
             return False
         return mode_config_file
 
-    def _load_mode_config(self, mode_string):
+    def _get_mode_config_files(self, mode_string):
         config_files = []
         # Is there an MPF default config for this mode? If so, load it first
         mpf_mode_config = self._get_mpf_mode_config(mode_string)
@@ -176,6 +181,11 @@ class ModeController(MpfController):
         if mode_config_file:
             config_files.append(mode_config_file)
 
+        return config_files
+
+    def _load_mode_config(self, mode_string):
+        config_files = self._get_mode_config_files(mode_string)
+
         if not config_files:
             raise AssertionError("Did not find any config for mode {}.".format(mode_string))
 
@@ -5,7 +5,8 @@ import asyncio
 import operator as op
 import abc
 import re
-from typing import Tuple, List, Any
+from collections import namedtuple
+from typing import Tuple, Dict
 
 from mpf.core.utility_functions import Util
 
@@ -25,6 +26,13 @@ bool_operators = {ast.And: lambda a, b: a and b, ast.Or: lambda a, b: a or b}
 
 comparisons = {ast.Eq: op.eq, ast.Lt: op.lt, ast.Gt: op.gt, ast.LtE: op.le, ast.GtE: op.ge, ast.NotEq: op.ne}
 
+# marks compiled templates which are not constant
+NOT_CONSTANT = object()
+
+# a template compiled to closures. evaluate(variables) returns the value. evaluate_and_subscribe(variables,
+# subscriptions) returns the value and appends subscriptions to the list. constant is the folded value or NOT_CONSTANT
+CompiledTemplate = namedtuple("CompiledTemplate", ["evaluate", "evaluate_and_subscribe", "constant"])
+
 
 class TemplateEvalError(Exception):
 
@@ -67,7 +75,7 @@ class BoolTemplate(BaseTemplate):
     def evaluate(self, parameters, fail_on_missing_params=False):
         """Evaluate template to bool."""
         try:
-            result = self.placeholder_manager.evaluate_template(self.template, parameters)
+            result = self.template.evaluate(parameters)
         except ValueError:
             if fail_on_missing_params:
                 raise
@@ -93,7 +101,7 @@ class FloatTemplate(BaseTemplate):
     def evaluate(self, parameters, fail_on_missing_params=False):
         """Evaluate template to float."""
         try:
-            result = self.placeholder_manager.evaluate_template(self.template, parameters)
+            result = self.template.evaluate(parameters)
         except ValueError:
             if fail_on_missing_params:
                 raise
@@ -120,7 +128,7 @@ class IntTemplate(BaseTemplate):
     def evaluate(self, parameters, fail_on_missing_params=False):
         """Evaluate template to float."""
         try:
-            result = self.placeholder_manager.evaluate_template(self.template, parameters)
+            result = self.template.evaluate(parameters)
         except ValueError:
             if fail_on_missing_params:
                 raise
@@ -146,7 +154,7 @@ class StringTemplate(BaseTemplate):
     def evaluate(self, parameters, fail_on_missing_params=False):
         """Evaluate template to string."""
         try:
-            result = self.placeholder_manager.evaluate_template(self.template, parameters)
+            result = self.template.evaluate(parameters)
         except ValueError:
             if fail_on_missing_params:
                 raise
@@ -163,7 +171,7 @@ class RawTemplate(BaseTemplate):
     def evaluate(self, parameters, fail_on_missing_params=False):
         """Evaluate template."""
         try:
-            result = self.placeholder_manager.evaluate_template(self.template, parameters)
+            result = self.template.evaluate(parameters)
         except (ValueError, IndexError):
             if fail_on_missing_params:
                 raise
@@ -520,143 +528,295 @@ class BasePlaceholderManager(MpfController):
     module_name = 'PlaceholderManager'
     config_name = 'placeholder_manager'
 
-    __slots__ = ["_eval_methods"]
+    __slots__ = ["_compile_methods", "_compiled_templates"]
 
     def __init__(self, machine):
         """Initialise."""
         super().__init__(machine)
-        self._eval_methods = {
-            ast.Num: self._eval_num,
-            ast.Str: self._eval_str,
-            ast.NameConstant: self._eval_name_constant,
-            ast.BinOp: self._eval_bin_op,
-            ast.UnaryOp: self._eval_unary_op,
-            ast.Compare: self._eval_compare,
-            ast.BoolOp: self._eval_bool_op,
-            ast.Attribute: self._eval_attribute,
-            ast.Subscript: self._eval_subscript,
-            ast.Name: self._eval_name,
-            ast.IfExp: self._eval_if
+        self._compile_methods = {
+            ast.Num: self._compile_num,
+            ast.Str: self._compile_str,
+            ast.NameConstant: self._compile_name_constant,
+            ast.BinOp: self._compile_bin_op,
+            ast.UnaryOp: self._compile_unary_op,
+            ast.Compare: self._compile_compare,
+            ast.BoolOp: self._compile_bool_op,
+            ast.Attribute: self._compile_attribute,
+            ast.Subscript: self._compile_subscript,
+            ast.Name: self._compile_name,
+            ast.IfExp: self._compile_if
         }
+        self._compiled_templates = dict()   # type: Dict[str, CompiledTemplate]
 
-    @staticmethod
-    def _parse_template(template_str):
-        return ast.parse(template_str, mode='eval').body
+    def _parse_template(self, template_str) -> CompiledTemplate:
+        """Parse and compile a template once."""
+        try:
+            return self._compiled_templates[template_str]
+        except KeyError:
+            pass
 
-    @staticmethod
-    def _eval_num(node, variables, subscribe):
-        del variables
-        del subscribe
-        return node.n, []
+        template = self._compile(ast.parse(template_str, mode='eval').body)
+        self._compiled_templates[template_str] = template
+        return template
 
-    @staticmethod
-    def _eval_str(node, variables, subscribe):
-        del variables
-        del subscribe
-        return node.s, []
+    def _compile(self, node) -> CompiledTemplate:
+        """Compile an ast node into closures."""
+        if node is None:
+            return self._compile_constant(None)
+
+        compile_method = self._compile_methods.get(type(node))
+        if not compile_method:
+            def evaluate_unsupported(variables, subscriptions=None):
+                del variables
+                del subscriptions
+                raise TypeError(type(node))
+            return CompiledTemplate(evaluate_unsupported, evaluate_unsupported, NOT_CONSTANT)
+
+        return compile_method(node)
 
     @staticmethod
-    def _eval_name_constant(node, variables, subscribe):
-        del variables
-        del subscribe
-        return node.value, []
-
-    def _eval_if(self, node, variables, subscribe):
-        value, subscription = self._eval(node.test, variables, subscribe)
-        if value:
-            ret_value, ret_subscription = self._eval(node.body, variables, subscribe)
-            return ret_value, subscription + ret_subscription
-        else:
-            ret_value, ret_subscription = self._eval(node.orelse, variables, subscribe)
-            return ret_value, subscription + ret_subscription
+    def _compile_constant(value) -> CompiledTemplate:
+        def evaluate(variables):
+            del variables
+            return value
 
-    def _eval_bin_op(self, node, variables, subscribe):
-        left_value, left_subscription = self._eval(node.left, variables, subscribe)
-        right_value, right_subscription = self._eval(node.right, variables, subscribe)
+        def evaluate_and_subscribe(variables, subscriptions):
+            del variables
+            del subscriptions
+            return value
+
+        return CompiledTemplate(evaluate, evaluate_and_subscribe, value)
+
+    def _compile_folded(self, function, *children) -> CompiledTemplate:
+        """Fold function into a constant if all children are constant. Return None otherwise."""
+        if any(child.constant is NOT_CONSTANT for child in children):
+            return None
         try:
-            ret_value = operators[type(node.op)](left_value, right_value)
-        except TypeError:
-            raise TemplateEvalError(left_subscription + right_subscription)
-        return ret_value, left_subscription + right_subscription
+            return self._compile_constant(function(*[child.constant for child in children]))
+        except Exception:   # pylint: disable-msg=broad-except
+            # keep errors at evaluation time
+            return None
+
+    def _compile_num(self, node):
+        return self._compile_constant(node.n)
+
+    def _compile_str(self, node):
+        return self._compile_constant(node.s)
+
+    def _compile_name_constant(self, node):
+        return self._compile_constant(node.value)
+
+    def _compile_if(self, node):
+        test, test_subscribe, test_constant = self._compile(node.test)
+        body = self._compile(node.body)
+        orelse = self._compile(node.orelse)
+        if test_constant is not NOT_CONSTANT:
+            return body if test_constant else orelse
+        body, body_subscribe, _ = body
+        orelse, orelse_subscribe, _ = orelse
+
+        def evaluate(variables):
+            if test(variables):
+                return body(variables)
+            return orelse(variables)
+
+        def evaluate_and_subscribe(variables, subscriptions):
+            if test_subscribe(variables, subscriptions):
+                return body_subscribe(variables, subscriptions)
+            return orelse_subscribe(variables, subscriptions)
+
+        return CompiledTemplate(evaluate, evaluate_and_subscribe, NOT_CONSTANT)
+
+    def _compile_bin_op(self, node):
+        operator = operators[type(node.op)]
+        left_template = self._compile(node.left)
+        right_template = self._compile(node.right)
+        folded = self._compile_folded(operator, left_template, right_template)
+        if folded:
+            return folded
+        left, left_subscribe, _ = left_template
+        right, right_subscribe, _ = right_template
+
+        def evaluate(variables):
+            left_value = left(variables)
+            right_value = right(variables)
+            try:
+                return operator(left_value, right_value)
+            except TypeError:
+                raise TemplateEvalError([])
+
+        def evaluate_and_subscribe(variables, subscriptions):
+            left_value = left_subscribe(variables, subscriptions)
+            right_value = right_subscribe(variables, subscriptions)
+            try:
+                return operator(left_value, right_value)
+            except TypeError:
+                raise TemplateEvalError(subscriptions)
+
+        return CompiledTemplate(evaluate, evaluate_and_subscribe, NOT_CONSTANT)
+
+    def _compile_unary_op(self, node):
+        operator = operators[type(node.op)]
+        operand_template = self._compile(node.operand)
+        folded = self._compile_folded(operator, operand_template)
+        if folded:
+            return folded
+        operand, operand_subscribe, _ = operand_template
+
+        def evaluate(variables):
+            return operator(operand(variables))
+
+        def evaluate_and_subscribe(variables, subscriptions):
+            return operator(operand_subscribe(variables, subscriptions))
 
-    def _eval_unary_op(self, node, variables, subscribe):
-        value, subscription = self._eval(node.operand, variables, subscribe)
-        return operators[type(node.op)](value), subscription
+        return CompiledTemplate(evaluate, evaluate_and_subscribe, NOT_CONSTANT)
 
-    def _eval_compare(self, node, variables, subscribe):
+    def _compile_compare(self, node):
         if len(node.ops) > 1:
             raise AssertionError("Only single comparisons are supported.")
-        left_value, left_subscription = self._eval(node.left, variables, subscribe)
-        right_value, right_subscription = self._eval(node.comparators[0], variables, subscribe)
-        try:
-            return comparisons[type(node.ops[0])](left_value, right_value), left_subscription + right_subscription
-        except TypeError:
-            raise TemplateEvalError(left_subscription + right_subscription)
-
-    def _eval_bool_op(self, node, variables, subscribe):
-        result, subscription = self._eval(node.values[0], variables, subscribe)
-        for i in range(1, len(node.values)):
-            value, new_subscription = self._eval(node.values[i], variables, subscribe)
-            subscription += new_subscription
+        comparison = comparisons[type(node.ops[0])]
+        left_template = self._compile(node.left)
+        right_template = self._compile(node.comparators[0])
+        folded = self._compile_folded(comparison, left_template, right_template)
+        if folded:
+            return folded
+        left, left_subscribe, _ = left_template
+        right, right_subscribe, _ = right_template
+
+        def evaluate(variables):
+            left_value = left(variables)
+            right_value = right(variables)
             try:
-                result = bool_operators[type(node.op)](result, value)
+                return comparison(left_value, right_value)
             except TypeError:
-                raise TemplateEvalError(subscription)
-        return result, subscription
+                raise TemplateEvalError([])
 
-    def _eval_attribute(self, node, variables, subscribe):
-        slice_value, subscription = self._eval(node.value, variables, subscribe)
-        if isinstance(slice_value, dict) and node.attr in slice_value:
-            ret_value = slice_value[node.attr]
-        else:
+        def evaluate_and_subscribe(variables, subscriptions):
+            left_value = left_subscribe(variables, subscriptions)
+            right_value = right_subscribe(variables, subscriptions)
             try:
-                ret_value = getattr(slice_value, node.attr)
-            except ValueError:
-                if subscribe:
-                    raise TemplateEvalError(subscription + [slice_value.subscribe_attribute(node.attr)])
-                else:
-                    raise
-        if subscribe:
-            return ret_value, subscription + [slice_value.subscribe_attribute(node.attr)]
-        else:
-            return ret_value, subscription + []
+                return comparison(left_value, right_value)
+            except TypeError:
+                raise TemplateEvalError(subscriptions)
+
+        return CompiledTemplate(evaluate, evaluate_and_subscribe, NOT_CONSTANT)
+
+    def _compile_bool_op(self, node):
+        bool_operator = bool_operators[type(node.op)]
+        value_templates = [self._compile(value) for value in node.values]
+        values = [value_template.evaluate for value_template in value_templates]
+        values_subscribe = [value_template.evaluate_and_subscribe for value_template in value_templates]
+
+        # unlike in python there is no short-circuit. every operand is evaluated so all of them are subscribed
+        def evaluate(variables):
+            result = values[0](variables)
+            for value in values[1:]:
+                value = value(variables)
+                try:
+                    result = bool_operator(result, value)
+                except TypeError:
+                    raise TemplateEvalError([])
+            return result
+
+        def evaluate_and_subscribe(variables, subscriptions):
+            result = values_subscribe[0](variables, subscriptions)
+            for value in values_subscribe[1:]:
+                value = value(variables, subscriptions)
+                try:
+                    result = bool_operator(result, value)
+                except TypeError:
+                    raise TemplateEvalError(subscriptions)
+            return result
+
+        return CompiledTemplate(evaluate, evaluate_and_subscribe, NOT_CONSTANT)
+
+    def _compile_attribute(self, node):
+        attribute = node.attr
+        value, value_subscribe, _ = self._compile(node.value)
+
+        def evaluate(variables):
+            slice_value = value(variables)
+            if isinstance(slice_value, dict) and attribute in slice_value:
+                return slice_value[attribute]
+            return getattr(slice_value, attribute)
+
+        def evaluate_and_subscribe(variables, subscriptions):
+            slice_value = value_subscribe(variables, subscriptions)
+            if isinstance(slice_value, dict) and attribute in slice_value:
+                ret_value = slice_value[attribute]
+            else:
+                try:
+                    ret_value = getattr(slice_value, attribute)
+                except ValueError:
+                    subscriptions.append(slice_value.subscribe_attribute(attribute))
+                    raise TemplateEvalError(subscriptions)
+            subscriptions.append(slice_value.subscribe_attribute(attribute))
+            return ret_value
+
+        return CompiledTemplate(evaluate, evaluate_and_subscribe, NOT_CONSTANT)
 
-    def _eval_subscript(self, node, variables, subscribe):
-        value, subscription = self._eval(node.value, variables, subscribe)
+    def _compile_subscript(self, node):
+        value, value_subscribe, _ = self._compile(node.value)
         if isinstance(node.slice, ast.Index):
-            slice_value, slice_subscript = self._eval(node.slice.value, variables, subscribe)
-            try:
-                return value[slice_value], subscription + slice_subscript
-            except ValueError:
-                raise TemplateEvalError(subscription + slice_subscript)
+            index, index_subscribe, _ = self._compile(node.slice.value)
+
+            def evaluate(variables):
+                container = value(variables)
+                index_value = index(variables)
+                try:
+                    return container[index_value]
+                except ValueError:
+                    raise TemplateEvalError([])
+
+            def evaluate_and_subscribe(variables, subscriptions):
+                container = value_subscribe(variables, subscriptions)
+                index_value = index_subscribe(variables, subscriptions)
+                try:
+                    return container[index_value]
+                except ValueError:
+                    raise TemplateEvalError(subscriptions)
+
         elif isinstance(node.slice, ast.Slice):
-            lower, lower_subscription = self._eval(node.slice.lower, variables, subscribe)
-            upper, upper_subscription = self._eval(node.slice.upper, variables, subscribe)
-            step, step_subscription = self._eval(node.slice.step, variables, subscribe)
-            return value[lower:upper:step], subscription + lower_subscription + upper_subscription + step_subscription
+            lower, lower_subscribe, _ = self._compile(node.slice.lower)
+            upper, upper_subscribe, _ = self._compile(node.slice.upper)
+            step, step_subscribe, _ = self._compile(node.slice.step)
+
+            def evaluate(variables):
+                return value(variables)[lower(variables):upper(variables):step(variables)]
+
+            def evaluate_and_subscribe(variables, subscriptions):
+                container = value_subscribe(variables, subscriptions)
+                return container[lower_subscribe(variables, subscriptions):upper_subscribe(variables, subscriptions):
+                                 step_subscribe(variables, subscriptions)]
         else:
             raise TypeError(type(node))
 
-    def _eval_name(self, node, variables, subscribe):
-        var = self.get_global_parameters(node.id)
-        if var:
-            if subscribe:
-                return var, [var.subscribe()]
-            else:
-                return var, []
-        elif node.id in variables:
-            return variables[node.id], []
-        else:
-            raise ValueError("Missing variable {}".format(node.id))
+        return CompiledTemplate(evaluate, evaluate_and_subscribe, NOT_CONSTANT)
 
-    def _eval(self, node, variables, subscribe) -> Tuple[Any, List]:
-        if node is None:
-            return None, []
+    def _compile_name(self, node):
+        name = node.id
+        get_global_parameters = self.get_global_parameters
 
-        elif type(node) in self._eval_methods:  # pylint: disable-msg=unidiomatic-typecheck
-            return self._eval_methods[type(node)](node, variables, subscribe)
-        else:
-            raise TypeError(type(node))
+        def evaluate(variables):
+            var = get_global_parameters(name)
+            if var:
+                return var
+            try:
+                return variables[name]
+            except KeyError:
+                raise ValueError("Missing variable {}".format(name))
+
+        def evaluate_and_subscribe(variables, subscriptions):
+            var = get_global_parameters(name)
+            if var:
+                subscriptions.append(var.subscribe())
+                return var
+            try:
+                return variables[name]
+            except KeyError:
+                raise ValueError("Missing variable {}".format(name))
+
+        return CompiledTemplate(evaluate, evaluate_and_subscribe, NOT_CONSTANT)
 
     def build_float_template(self, template_str, default_value=0.0):
         """Build a float template from a string."""
@@ -688,14 +848,16 @@ class BasePlaceholderManager(MpfController):
         """Return global params."""
         raise NotImplementedError()
 
-    def evaluate_template(self, template, parameters):
+    @staticmethod
+    def evaluate_template(template: CompiledTemplate, parameters):
         """Evaluate template."""
-        return self._eval(template, parameters, False)[0]
+        return template.evaluate(parameters)
 
-    def evaluate_and_subscribe_template(self, template, parameters):
+    def evaluate_and_subscribe_template(self, template: CompiledTemplate, parameters):
         """Evaluate and subscribe template."""
+        subscriptions = []
         try:
-            value, subscriptions = self._eval(template, parameters, True)
+            value = template.evaluate_and_subscribe(parameters, subscriptions)
         except TemplateEvalError as e:
             value = e
             subscriptions = e.subscriptions
@@ -744,25 +906,27 @@ class PlaceholderManager(BasePlaceholderManager):
 
     """Manages templates and placeholders for MPF."""
 
-    __slots__ = []
+    __slots__ = ["_global_placeholders"]
+
+    def __init__(self, machine):
+        """Initialise placeholder manager."""
+        super().__init__(machine)
+        # placeholders only wrap the machine so they can be shared by all templates
+        self._global_placeholders = {
+            "settings": SettingsPlaceholder(self.machine),
+            "machine": MachinePlaceholder(self.machine),
+            "device": DevicesPlaceholder(self.machine),
+            "mode": ModePlaceholder(self.machine),
+            "current_player": PlayerPlaceholder(self.machine),
+            "players": PlayersPlaceholder(self.machine),
+        }
 
-    # pylint: disable-msg=too-many-return-statements
     def get_global_parameters(self, name):
         """Return global params."""
-        if name == "settings":
-            return SettingsPlaceholder(self.machine)
-        elif name == "machine":
-            return MachinePlaceholder(self.machine)
-        elif name == "device":
-            return DevicesPlaceholder(self.machine)
-        elif name == "mode":
-            return ModePlaceholder(self.machine)
-        elif name == "current_player":
-            return PlayerPlaceholder(self.machine)
-        elif name == "players":
-            return PlayersPlaceholder(self.machine)
-        elif self.machine.game:
-            if name == "game":
-                return self.machine.game
+        placeholder = self._global_placeholders.get(name)
+        if placeholder:
+            return placeholder
+        elif name == "game" and self.machine.game:
+            return self.machine.game
 
         return False
@@ -360,6 +360,7 @@ class LightsPlatform(BasePlatform, metaclass=abc.ABCMeta):
 
 
 SwitchConfig = namedtuple("SwitchConfig", ["invert", "debounce"])
+SwitchChange = namedtuple("SwitchChange", ["num", "state", "platform"])
 
 
 class SwitchPlatform(BasePlatform, metaclass=abc.ABCMeta):
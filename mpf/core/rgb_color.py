@@ -6,11 +6,17 @@ Copyright (c) 2015 Erick Daniszewski
 The MIT License (MIT)
 """
 import random
+from array import array
 
-from typing import List, Union, Tuple
+from typing import List, Union, Tuple, Sequence, Iterable
 
 from mpf.core.utility_functions import Util
 
+try:
+    import numpy
+except ImportError:     # pragma: no cover
+    numpy = None
+
 channel_min_val = 0
 channel_max_val = 255
 rgb_min = (0, 0, 0)
@@ -460,6 +466,110 @@ class RGBColor:
         named_rgb_colors[str(name.lower())] = RGBColor(color).rgb
 
 
+class RGBColorBatch:
+
+    """Colors of many lights in one contiguous buffer.
+
+    The colors are stored in a NumPy array with one row per color when NumPy is installed and in a flat array of
+    bytes otherwise. Blend, brightness and lookup tables are applied to all colors in one call and give the same
+    results as RGBColor.blend, Light.gamma_correct and RGBColorCorrectionProfile.apply.
+    """
+
+    __slots__ = ["_values"]
+
+    def __init__(self, colors: Iterable[Union["RGBColor", Tuple[int, int, int]]]) -> None:
+        """Create a batch from RGBColor instances or RGB tuples."""
+        rgb_values = [color.rgb if isinstance(color, RGBColor) else color for color in colors]
+        if numpy is not None:
+            self._values = numpy.array(rgb_values, dtype=numpy.uint8).reshape(-1, 3)
+        else:
+            self._values = array('B', [channel for rgb in rgb_values for channel in rgb])
+
+    @classmethod
+    def _from_values(cls, values) -> "RGBColorBatch":
+        batch = cls.__new__(cls)
+        batch._values = values
+        return batch
+
+    def __len__(self):
+        """Return the number of colors in this batch."""
+        if numpy is not None:
+            return len(self._values)
+        return len(self._values) // 3
+
+    def get_rgb(self, index: int) -> Tuple[int, int, int]:
+        """Return the RGB tuple of one color in this batch."""
+        if numpy is not None:
+            red, green, blue = self._values[index].tolist()
+            return red, green, blue
+        offset = index * 3
+        return self._values[offset], self._values[offset + 1], self._values[offset + 2]
+
+    def get_color(self, index: int) -> "RGBColor":
+        """Return one color of this batch as RGBColor."""
+        return RGBColor(self.get_rgb(index))
+
+    def tobytes(self) -> bytes:
+        """Return all colors as bytes (RGB for every color)."""
+        return self._values.tobytes()
+
+    @classmethod
+    def blend(cls, start_colors: "RGBColorBatch", end_colors: "RGBColorBatch",
+              fractions: Sequence[float]) -> "RGBColorBatch":
+        """Blend two batches of colors.
+
+        Args:
+            start_colors: The start colors
+            end_colors: The end colors
+            fractions: One fraction between 0 and 1 per color
+
+        Returns: A new batch with the blended colors
+        """
+        if numpy is not None:
+            start = start_colors._values.astype(numpy.int16)
+            diff = end_colors._values.astype(numpy.int16) - start
+            fraction_column = numpy.array(fractions, dtype=numpy.float64).reshape(-1, 1)
+            return cls._from_values((start + numpy.trunc(diff * fraction_column)).astype(numpy.uint8))
+
+        return cls._from_values(array('B', [
+            start + int((end - start) * fractions[index // 3])
+            for index, (start, end) in enumerate(zip(start_colors._values, end_colors._values))]))
+
+    def scale(self, factor: float) -> "RGBColorBatch":
+        """Multiply all colors by a brightness factor.
+
+        A factor of 0 or None leaves the colors unaltered (same as in Light.gamma_correct).
+        """
+        if not factor:
+            return self
+
+        if numpy is not None:
+            return self._from_values(numpy.minimum(numpy.trunc(self._values * factor), channel_max_val).astype(
+                numpy.uint8))
+
+        return self._from_values(array('B', [min(int(value * factor), channel_max_val) for value in self._values]))
+
+    def apply_lookup_tables(self, lookup_tables: Sequence[Sequence[int]]) -> "RGBColorBatch":
+        """Map every channel of all colors through its lookup table.
+
+        Args:
+            lookup_tables: Three lists of 256 values (one for red, green and blue)
+
+        Returns: A new batch with the mapped colors
+        """
+        if numpy is not None:
+            tables = numpy.array(lookup_tables, dtype=numpy.uint8)
+            return self._from_values(tables[numpy.arange(3), self._values])
+
+        red_table, green_table, blue_table = lookup_tables
+        values = self._values
+        mapped = array('B', values)
+        mapped[0::3] = array('B', [red_table[value] for value in values[0::3]])
+        mapped[1::3] = array('B', [green_table[value] for value in values[1::3]])
+        mapped[2::3] = array('B', [blue_table[value] for value in values[2::3]])
+        return self._from_values(mapped)
+
+
 class ColorException(AssertionError):
 
     """General exception thrown for color utilities non-exit exceptions."""
@@ -568,6 +678,16 @@ class RGBColorCorrectionProfile:
                          self._lookup_table[1][color.green],
                          self._lookup_table[2][color.blue]))
 
+    def apply_batch(self, colors: RGBColorBatch) -> RGBColorBatch:
+        """Apply the current color correction profile to all colors of a batch.
+
+        Args:
+            colors: The RGBColorBatch which to apply the color correction profile.
+
+        Returns: RGBColorBatch
+        """
+        return colors.apply_lookup_tables(self._lookup_table)
+
     @staticmethod
     def default() -> "RGBColorCorrectionProfile":
         """Create a default profile (gamma-corrected).
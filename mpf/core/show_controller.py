@@ -1,7 +1,13 @@
 """Contains the ShowController base class."""
+from typing import Dict, Callable, Any
+
 from mpf.assets.show import Show, ShowConfig
 from mpf.core.mpf_controller import MpfController
 
+MYPY = False
+if MYPY:   # pragma: no cover
+    from mpf.assets.show import RunningShow
+
 
 class ShowController(MpfController):
 
@@ -12,7 +18,7 @@ class ShowController(MpfController):
 
     """
 
-    __slots__ = ["show_players", "running_shows", "_next_show_id"]
+    __slots__ = ["show_players", "running_shows", "_next_show_id", "_scheduled_steps", "_step_timers"]
 
     config_name = "show_controller"
 
@@ -28,6 +34,10 @@ class ShowController(MpfController):
         self.running_shows = list()
         self._next_show_id = 0
 
+        # steps of running shows which are due at the same time are run from one loop callback
+        self._scheduled_steps = dict()  # type: Dict[float, Dict[RunningShow, Callable[[], None]]]
+        self._step_timers = dict()      # type: Dict[float, Any]
+
         # Registers Show with the asset manager
         Show.initialize(self.machine)
 
@@ -46,6 +56,63 @@ class ShowController(MpfController):
         self._next_show_id += 1
         return self._next_show_id
 
+    @staticmethod
+    def _get_step_key(step_time: float) -> float:
+        # round to prevent float errors from splitting shows which are synced to the same time
+        return round(step_time, 6)
+
+    def schedule_show_step(self, running_show: "RunningShow", callback: Callable[[], None], step_time: float):
+        """Call callback of a running show at step_time.
+
+        All shows with steps at the same time are run in one loop callback ordered by priority. Returns a key to
+        unschedule the step.
+        """
+        step_key = self._get_step_key(step_time)
+        scheduled_steps = self._scheduled_steps.get(step_key)
+        if scheduled_steps is None:
+            scheduled_steps = dict()
+            self._scheduled_steps[step_key] = scheduled_steps
+            self._step_timers[step_key] = self.machine.clock.loop.call_at(step_time, self._run_show_steps, step_key)
+
+        scheduled_steps[running_show] = callback
+        return step_key
+
+    def unschedule_show_step(self, running_show: "RunningShow", step_key: float):
+        """Remove a scheduled step of a running show."""
+        scheduled_steps = self._scheduled_steps.get(step_key)
+        if not scheduled_steps or running_show not in scheduled_steps:
+            return
+
+        del scheduled_steps[running_show]
+        if not scheduled_steps and step_key in self._step_timers:
+            # only remove the timer if the steps are not running right now
+            del self._scheduled_steps[step_key]
+            self._step_timers.pop(step_key).cancel()
+
+    def _run_show_steps(self, step_key: float):
+        """Run all show steps which are due now."""
+        self._step_timers.pop(step_key)
+        scheduled_steps = self._scheduled_steps[step_key]
+        self.machine.light_controller.defer_light_sync()
+        try:
+            while scheduled_steps:
+                for running_show in sorted(scheduled_steps, key=lambda x: -x.show_config.priority):
+                    # the step might have been unscheduled by a previous show in this pass
+                    callback = scheduled_steps.pop(running_show, None)
+                    if callback:
+                        callback()
+        except Exception:
+            if scheduled_steps:
+                # a crashing show must not stall the other shows. run their steps in the next loop iteration
+                self._step_timers[step_key] = self.machine.clock.loop.call_soon(self._run_show_steps, step_key)
+            else:
+                del self._scheduled_steps[step_key]
+            raise
+        else:
+            del self._scheduled_steps[step_key]
+        finally:
+            self.machine.light_controller.flush_light_sync()
+
     def _process_config_shows_section(self, config, **kwargs):
         # processes the shows: section of a mode or machine config
         del kwargs
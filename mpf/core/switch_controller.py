@@ -4,13 +4,15 @@ Contains the SwitchController class which is responsible for reading switch
 states and posting events to the framework.
 """
 
+import heapq
 import logging
-from collections import defaultdict, namedtuple
+from collections import namedtuple
 import asyncio
 from functools import partial
-from typing import Any, Callable, Dict, List, Tuple
+from itertools import count
+from typing import Any, Callable, Dict, Iterable, List, Tuple
 
-from mpf.core.platform import SwitchPlatform
+from mpf.core.platform import SwitchPlatform, SwitchChange
 
 from mpf.core.machine import MachineController
 from mpf.core.mpf_controller import MpfController
@@ -18,7 +20,6 @@ from mpf.devices.switch import Switch
 
 MonitoredSwitchChange = namedtuple("MonitoredSwitchChange", ["name", "label", "platform", "num", "state"])
 SwitchHandler = namedtuple("SwitchHandler", ["switch_name", "callback", "state", "ms"])
-TimedSwitchHandler = namedtuple("TimedSwitchHandler", ["callback", 'switch_name', 'state', 'ms'])
 
 
 class RegisteredSwitch:
@@ -34,14 +35,34 @@ class RegisteredSwitch:
         self.cancelled = False
 
 
+class TimedSwitchHandler:
+
+    """Timed switch handler which waits for its time to be called."""
+
+    __slots__ = ["callback", "switch", "state", "ms", "cancelled"]
+
+    def __init__(self, callback, switch, state, ms):
+        """Initialise timed switch handler."""
+        self.callback = callback
+        self.switch = switch
+        self.state = state
+        self.ms = ms
+        self.cancelled = False
+
+    def __repr__(self):
+        """Return str representation."""
+        return "<TimedSwitchHandler {} state: {} ms: {} callback: {}>".format(self.switch.name, self.state, self.ms,
+                                                                              self.callback)
+
+
 class SwitchController(MpfController):
 
     """Tracks all switches in the machine, receives switch activity, and converts switch changes into events."""
 
     config_name = "switch_controller"
 
-    __slots__ = ["registered_switches", "_timed_switch_handler_delay", "active_timed_switches",
-                 "_switch_lookup", "monitors", "_initialised"]
+    __slots__ = ["registered_switches", "_timed_switch_heap", "_timed_switch_handlers", "_timed_switch_counter",
+                 "_timed_switch_timer", "_timed_switch_cancelled", "_switch_lookup", "monitors", "_initialised"]
 
     def __init__(self, machine: MachineController) -> None:
         """Initialise switch controller."""
@@ -50,13 +71,20 @@ class SwitchController(MpfController):
         # Dictionary of switches and states that have been registered for
         # callbacks.
 
-        self._timed_switch_handler_delay = dict()               # type: Any
+        self._timed_switch_heap = list()            # type: List[Tuple[float, int, TimedSwitchHandler]]
+        # Heap of timed switch handlers which are waiting for a switch to be
+        # in a state for some ms. Ordered by the time they will be called.
+        # In other words, this tracks things like "do foo() if switch bar is
+        # active for 100ms." Cancelled handlers stay in the heap until they
+        # are popped or the heap is compacted.
 
-        self.active_timed_switches = defaultdict(list)          # type: Dict[float, List[TimedSwitchHandler]]
-        # Dictionary of switches that are currently in a state counting ms
-        # waiting to notify their handlers. In other words, this is the dict
-        # that tracks current switches for things like "do foo() if switch bar
-        # is active for 100ms."
+        self._timed_switch_handlers = dict()        # type: Dict[Switch, List[TimedSwitchHandler]]
+        # Pending timed switch handlers per switch. Used to cancel them when
+        # the switch changes without looking at the handlers of other switches.
+
+        self._timed_switch_counter = count()
+        self._timed_switch_timer = None             # type: Tuple[asyncio.TimerHandle, float]
+        self._timed_switch_cancelled = 0
 
         self._switch_lookup = dict()                            # type: Dict[Tuple[str, SwitchPlatform], Switch]
         # Lookup table for switch + platform to an Switch object
@@ -273,12 +301,51 @@ class SwitchController(MpfController):
         if switch:
             self.process_switch_obj(switch, state, logical)
         else:
-            if self._debug_to_console or self._debug_to_file:
-                self.debug_log("Unknown switch %s change to state %s on platform %s", num, state, platform)
             # if the switch is not configured still trigger the monitor
+            monitored_change = self._get_unknown_switch_change(num, state, platform)
             for monitor in self.monitors:
-                monitor(MonitoredSwitchChange(name=str(num), label="{}-{}".format(str(platform), str(num)),
-                                              platform=platform, num=str(num), state=state))
+                monitor(monitored_change)
+
+    def process_switch_changes(self, changes: Iterable[SwitchChange], logical=False):
+        """Process a batch of switch changes by switch number.
+
+        Platforms which receive multiple switch changes at once should use
+        this instead of calling process_switch_by_num for every switch. All
+        changes get the same timestamp, monitors are notified once the whole
+        batch has been applied and the event queue is processed afterwards.
+
+        Args:
+            changes: Iterable of SwitchChange tuples (num, state, platform) in
+                the order they happened. See process_switch_by_num.
+            logical: Whether the states are logical or physical states.
+        """
+        if not self._initialised:
+            raise AssertionError("Got early switch changes {}".format(changes))
+
+        timestamp = self.machine.clock.get_time()
+        monitored_changes = []
+        for num, state, platform in changes:
+            switch = self._switch_lookup.get((num, platform), None)
+            if not switch:
+                monitored_changes.append(self._get_unknown_switch_change(num, state, platform))
+            elif self._process_switch_obj(switch, state, logical, timestamp) and self.monitors:
+                monitored_changes.append(MonitoredSwitchChange(name=switch.name, label=switch.label,
+                                                               platform=switch.platform,
+                                                               num=switch.hw_switch.number, state=switch.state))
+
+        if monitored_changes:
+            for monitor in self.monitors:
+                for monitored_change in monitored_changes:
+                    monitor(monitored_change)
+
+        self.machine.events.process_event_queue()
+
+    def _get_unknown_switch_change(self, num, state, platform) -> MonitoredSwitchChange:
+        """Log change of an unknown switch and return the change for monitors."""
+        if self._debug_to_console or self._debug_to_file:
+            self.debug_log("Unknown switch %s change to state %s on platform %s", num, state, platform)
+        return MonitoredSwitchChange(name=str(num), label="{}-{}".format(str(platform), str(num)),
+                                     platform=platform, num=str(num), state=state)
 
     def process_switch(self, name, state=1, logical=False):
         """Process a new switch state change for a switch by name.
@@ -343,6 +410,16 @@ class SwitchController(MpfController):
         handles NC versus NO switches and translates them to 'active' versus
         'inactive'.)
         """
+        if self._process_switch_obj(obj, state, logical, self.machine.clock.get_time()):
+            for monitor in self.monitors:
+                monitor(MonitoredSwitchChange(name=obj.name, label=obj.label, platform=obj.platform,
+                                              num=obj.hw_switch.number, state=obj.state))
+
+    def _process_switch_obj(self, obj: Switch, state, logical, timestamp: float) -> bool:
+        """Update a switch and call its handlers.
+
+        Returns False if the switch already was in that state.
+        """
         # We need int, but this lets it come in as boolean also
         if state:
             state = 1
@@ -368,13 +445,13 @@ class SwitchController(MpfController):
                     "had some non-debounced state changes. This could be "
                     "nothing, but if it happens a lot it could indicate noise "
                     "or interference on the line. Switch: %s", obj.name)
-            return
+            return False
 
         # Update the hardware state since we always want this to match real hw
         obj.hw_state = hw_state
         # update the switch device
         obj.state = state
-        obj.last_change = self.machine.clock.get_time()
+        obj.last_change = timestamp
 
         if state:
             self.info_log("<<<<<<< '%s' active >>>>>>>", obj.name)
@@ -383,11 +460,9 @@ class SwitchController(MpfController):
 
         self._call_handlers(obj, state)
 
-        self._cancel_timed_handlers(obj.name, state)
+        self._cancel_timed_handlers(obj, state)
 
-        for monitor in self.monitors:
-            monitor(MonitoredSwitchChange(name=obj.name, label=obj.label, platform=obj.platform,
-                                          num=obj.hw_switch.number, state=state))
+        return True
 
     def wait_for_switch(self, switch_name: str, state: int = 1, only_on_change=True, ms=0):
         """Wait for a switch to change into a state.
@@ -449,34 +524,48 @@ class SwitchController(MpfController):
         if not _future.done():
             _future.set_result(kwargs)
 
-    def _cancel_timed_handlers(self, name, state):
-        # now check if the opposite state is in the active timed switches list
-        # if so, remove it
-        for k, v, in self.active_timed_switches.items():
-            # using items() instead of iteritems() since we might want to
-            # delete while iterating
-            for k2, item in enumerate(v):
-                if item.switch_name == str(name) and item.state == state ^ 1:
-                    # ^1 in above line invertes the state
-                    if self.active_timed_switches[k] and self.active_timed_switches[k][k2]:
-                        del self.active_timed_switches[k][k2]
+    def _cancel_timed_handlers(self, switch, state):
+        """Cancel timed handlers of a switch which wait for the opposite state."""
+        handlers = self._timed_switch_handlers.get(switch)
+        if handlers:
+            self._remove_timed_handlers(switch, [handler for handler in handlers if handler.state != state])
+
+    def _remove_timed_handlers(self, switch, handlers_to_remove: List[TimedSwitchHandler]):
+        """Remove pending timed handlers of a switch."""
+        if not handlers_to_remove:
+            return
+
+        for handler in handlers_to_remove:
+            handler.cancelled = True
+
+        remaining_handlers = [handler for handler in self._timed_switch_handlers[switch] if not handler.cancelled]
+        if remaining_handlers:
+            self._timed_switch_handlers[switch] = remaining_handlers
+        else:
+            del self._timed_switch_handlers[switch]
+
+        # cancelled handlers are removed lazily from the heap. compact it when
+        # they become the majority (e.g. because of switch chatter)
+        self._timed_switch_cancelled += len(handlers_to_remove)
+        if self._timed_switch_cancelled > len(self._timed_switch_heap) // 2:
+            self._timed_switch_heap[:] = [entry for entry in self._timed_switch_heap if not entry[2].cancelled]
+            heapq.heapify(self._timed_switch_heap)
+            self._timed_switch_cancelled = 0
 
     def _add_timed_switch_handler(self, switch, time: float, timed_switch_handler: TimedSwitchHandler):
-        self.active_timed_switches[time].append(timed_switch_handler)
+        heapq.heappush(self._timed_switch_heap, (time, next(self._timed_switch_counter), timed_switch_handler))
+        self._timed_switch_handlers.setdefault(switch, []).append(timed_switch_handler)
 
-        next_event_time = self.get_next_timed_switch_event()
-        add_handler = False
+        if not self._timed_switch_timer or time < self._timed_switch_timer[1]:
+            self._schedule_timed_switch_timer(time)
 
-        if switch not in self._timed_switch_handler_delay:
-            add_handler = True
-        elif next_event_time < self._timed_switch_handler_delay[switch][1]:
-            add_handler = True
-            self.machine.clock.unschedule(self._timed_switch_handler_delay[switch][0])
+    def _schedule_timed_switch_timer(self, next_event_time: float):
+        """Schedule the timer for timed switch handlers."""
+        if self._timed_switch_timer:
+            self.machine.clock.unschedule(self._timed_switch_timer[0])
 
-        if add_handler:
-            handler = self.machine.clock.loop.call_at(
-                next_event_time, partial(self._process_active_timed_switches, switch))
-            self._timed_switch_handler_delay[switch] = (handler, next_event_time)
+        handler = self.machine.clock.loop.call_at(next_event_time, self._process_active_timed_switches)
+        self._timed_switch_timer = (handler, next_event_time)
 
     def _call_handlers(self, switch, state):
         for entry in self.registered_switches[switch][state][:]:  # generator?
@@ -491,7 +580,7 @@ class SwitchController(MpfController):
                 # active timed switch list
                 key = switch.last_change + (entry.ms / 1000.0)
                 value = TimedSwitchHandler(callback=entry.callback,
-                                           switch_name=switch.name,
+                                           switch=switch,
                                            state=state,
                                            ms=entry.ms)
                 self._add_timed_switch_handler(switch, key, value)
@@ -568,7 +657,7 @@ class SwitchController(MpfController):
         # then let's see if the switch is currently in the state that the
         # handler was registered for. If so, and if the switch has been in this
         # state for less time than the ms registered, then we need to add this
-        # switch to our active_timed_switches list so this handler is called
+        # switch to our timed switch handlers so this handler is called
         # when this switch's active time expires. (in other words, we're
         # catching delayed switches that were in progress when this handler was
         # registered.
@@ -579,7 +668,7 @@ class SwitchController(MpfController):
                 # switch's original activation time.
                 key = self.machine.clock.get_time() + ((ms - self.ms_since_change(switch.name)) / 1000.0)
                 value = TimedSwitchHandler(callback=callback,
-                                           switch_name=switch.name,
+                                           switch=switch,
                                            state=state,
                                            ms=ms)
                 self._add_timed_switch_handler(switch, key, value)
@@ -617,12 +706,11 @@ class SwitchController(MpfController):
                 entry.cancelled = True
                 self.registered_switches[switch][state].remove(entry)
 
-        for k in list(self.active_timed_switches.keys()):
-            timed_entry = self.active_timed_switches[k]
-            for dummy_key, entry in enumerate(timed_entry):
-                if (entry.switch_name == switch.name and entry.state == state and entry.ms == ms and
-                        entry.callback == callback):
-                    del self.active_timed_switches[k][dummy_key]
+        timed_handlers = self._timed_switch_handlers.get(switch)
+        if timed_handlers:
+            self._remove_timed_handlers(switch, [entry for entry in timed_handlers if
+                                                 entry.state == state and entry.ms == ms and
+                                                 entry.callback == callback])
 
     def log_active_switches(self, **kwargs):
         """Write out entries to the INFO log file of all switches that are currently active."""
@@ -636,42 +724,52 @@ class SwitchController(MpfController):
         """Return the event name which is posted when switch_name becomes active."""
         return "{}_active".format(switch_name)
 
+    def _prune_timed_switch_heap(self):
+        """Pop cancelled handlers from the top of the heap."""
+        heap = self._timed_switch_heap
+        while heap and heap[0][2].cancelled:
+            heapq.heappop(heap)
+            self._timed_switch_cancelled -= 1
+
     def get_next_timed_switch_event(self):
         """Return time of the next timed switch event."""
-        if not self.active_timed_switches:
+        self._prune_timed_switch_heap()
+        if not self._timed_switch_heap:
             raise AssertionError("No active timed switches")
-        return min(self.active_timed_switches.keys())
+        return self._timed_switch_heap[0][0]
 
-    def _process_active_timed_switches(self, switch):
+    def _process_active_timed_switches(self):
         """Process active times switches.
 
-        Checks the current list of active timed switches to see if it's
-        time to take action on any of them. If so, does the callback and then
-        removes that entry from the list.
+        Pops all timed switch handlers which are due from the heap and calls
+        them. Afterwards, schedules the timer for the next handler.
         """
-        del self._timed_switch_handler_delay[switch]
-        next_event_time = False
+        self._timed_switch_timer = None
         current_time = self.machine.clock.get_time()
-        for k in list(self.active_timed_switches.keys()):
-            if k <= current_time:  # change to generator?
-                for entry in list(self.active_timed_switches[k]):
-                    # check if removed by previous entry
-                    if entry not in self.active_timed_switches[k]:
-                        continue
-                    if self._debug_to_console or self._debug_to_file:
-                        self.debug_log(
-                            "Processing timed switch handler. Switch: %s "
-                            " State: %s, ms: %s", entry.switch_name,
-                            entry.state, entry.ms)
-                    entry.callback()
-                del self.active_timed_switches[k]
-            else:
-                if not next_event_time or next_event_time > k:
-                    next_event_time = k
+        heap = self._timed_switch_heap
+        while heap and heap[0][0] <= current_time:
+            entry = heapq.heappop(heap)[2]
+            # check if removed by previous entry
+            if entry.cancelled:
+                self._timed_switch_cancelled -= 1
+                continue
+
+            entry.cancelled = True
+            handlers = self._timed_switch_handlers[entry.switch]
+            handlers.remove(entry)
+            if not handlers:
+                del self._timed_switch_handlers[entry.switch]
+
+            if self._debug_to_console or self._debug_to_file:
+                self.debug_log(
+                    "Processing timed switch handler. Switch: %s "
+                    " State: %s, ms: %s", entry.switch.name,
+                    entry.state, entry.ms)
+            entry.callback()
 
         self.machine.events.process_event_queue()
-        if next_event_time:
-            handler = self.machine.clock.loop.call_at(
-                next_event_time,
-                partial(self._process_active_timed_switches, switch))
-            self._timed_switch_handler_delay[switch] = (handler, next_event_time)
+
+        # handlers might have added new timed handlers and scheduled the timer
+        self._prune_timed_switch_heap()
+        if heap and (not self._timed_switch_timer or heap[0][0] < self._timed_switch_timer[1]):
+            self._schedule_timed_switch_timer(heap[0][0])
@@ -0,0 +1,144 @@
+"""Precomputed routes between ball devices."""
+from collections import deque
+
+MYPY = False
+if MYPY:   # pragma: no cover
+    from typing import Dict, List, Tuple, Union   # pylint: disable-msg=cyclic-import,unused-import
+    from mpf.devices.ball_device.ball_device import BallDevice     # pylint: disable-msg=cyclic-import,unused-import
+
+
+class BallRoutingTable:
+
+    """Routes between ball devices computed from their eject_targets.
+
+    The table is built on the first lookup and kept until the config of a ball device changes. All routes are
+    shortest paths found by a breadth-first search from every device over eject_targets (or source devices). Ties
+    are broken by config order. A direct eject always wins.
+    """
+
+    __slots__ = ["_machine", "_paths", "_troughs", "_sources"]
+
+    def __init__(self, machine):
+        """Initialise routing table."""
+        self._machine = machine
+        # path from source to target by source and target
+        self._paths = None      # type: Dict[BallDevice, Dict[BallDevice, Tuple[BallDevice, ...]]]
+        # next trough by device or False if there is none
+        self._troughs = None    # type: Dict[BallDevice, Union[BallDevice, bool]]
+        # source devices by distance with the path from source to device
+        self._sources = None    # type: Dict[BallDevice, List[Tuple[BallDevice, Tuple[BallDevice, ...]]]]
+
+    def invalidate(self):
+        """Discard all routes. They will be built again on the next lookup."""
+        self._paths = None
+        self._troughs = None
+        self._sources = None
+
+    def _build(self):
+        """Build all routes."""
+        devices = [device for device in self._machine.ball_devices if not device.is_playfield()]
+        source_devices = {device: [] for device in devices}     # type: Dict[BallDevice, List[BallDevice]]
+        for device in devices:
+            for target in device.config['eject_targets']:
+                if target in source_devices and device not in source_devices[target]:
+                    source_devices[target].append(device)
+
+        self._paths = {}
+        self._troughs = {}
+        self._sources = {}
+        for device in devices:
+            self._paths[device] = self._build_paths(device)
+            self._troughs[device] = self._build_trough(device)
+            self._sources[device] = self._build_sources(device, source_devices)
+
+    @staticmethod
+    def _build_paths(device):
+        """Return the shortest paths from this device to all reachable targets."""
+        paths = {}
+        queue = deque([(device, (device,))])
+        visited = {device}
+        while queue:
+            current, path = queue.popleft()
+            for target in current.config['eject_targets']:
+                if target in visited:
+                    continue
+                visited.add(target)
+                paths[target] = path + (target,)
+                if not target.is_playfield():
+                    queue.append((target, paths[target]))
+
+        return paths
+
+    @staticmethod
+    def _build_trough(device):
+        """Return the nearest trough downstream of this device (or the device itself)."""
+        queue = deque([device])
+        visited = {device}
+        while queue:
+            current = queue.popleft()
+            if 'trough' in current.tags:
+                return current
+            for target in current.config['eject_targets']:
+                if target in visited or target.is_playfield():
+                    continue
+                visited.add(target)
+                queue.append(target)
+
+        return False
+
+    @staticmethod
+    def _build_sources(device, source_devices):
+        """Return all upstream devices by distance with the shortest path from each to this device."""
+        sources = []
+        queue = deque([(device, (device,))])
+        visited = {device}
+        while queue:
+            current, path = queue.popleft()
+            for source in source_devices[current]:
+                if source in visited:
+                    continue
+                visited.add(source)
+                sources.append((source, (source,) + path))
+                queue.append((source, (source,) + path))
+
+        return sources
+
+    def _ensure_built(self):
+        if self._paths is None:
+            self._build()
+
+    def get_path(self, source, target):
+        """Return a path from source to target as deque (including both) or False if there is none."""
+        self._ensure_built()
+        path = self._paths.get(source, {}).get(target)
+        if not path:
+            return False
+        return deque(path)
+
+    def get_next_hop(self, source, target):
+        """Return the device source has to eject to in order to reach target or None."""
+        self._ensure_built()
+        path = self._paths.get(source, {}).get(target)
+        if not path:
+            return None
+        return path[1]
+
+    def get_next_trough(self, device):
+        """Return the nearest trough downstream of device (or device itself) or False."""
+        self._ensure_built()
+        return self._troughs.get(device, False)
+
+    def find_one_available_ball(self, device):
+        """Return a path from the nearest upstream device with an available ball to device or False."""
+        self._ensure_built()
+        for source, path in self._sources.get(device, []):
+            if source.available_balls > 0:
+                return deque(path)
+
+        return False
+
+    def get_routes(self):
+        """Return all routes by name for diagnostics."""
+        self._ensure_built()
+        return {source.name: {target.name: [device.name for device in path] for target, path in paths.items()}
+                for source, paths in self._paths.items()}
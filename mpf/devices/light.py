@@ -11,11 +11,15 @@ from mpf.core.platform import LightsPlatform
 
 from mpf.core.device_monitor import DeviceMonitor
 from mpf.core.machine import MachineController
-from mpf.core.rgb_color import RGBColor, ColorException
+from mpf.core.rgb_color import RGBColor, ColorException, RGBColorBatch
 from mpf.core.system_wide_device import SystemWideDevice
-from mpf.platforms.interfaces.light_platform_interface import LightPlatformSoftwareFade
+from mpf.platforms.interfaces.light_platform_interface import LightPlatformSoftwareFade, LightPlatformInterface
 from mpf.devices.device_mixins import DevicePositionMixin
 
+MYPY = False
+if MYPY:   # pragma: no cover
+    from mpf.devices.light_group import LightGroup
+
 
 class DriverLight(LightPlatformSoftwareFade):
 
@@ -70,13 +74,15 @@ class Light(SystemWideDevice, DevicePositionMixin):
     collection = 'lights'
     class_label = 'light'
 
-    __slots__ = ["hw_drivers", "platforms", "delay", "default_fade_ms", "_color_correction_profile", "stack",
-                 "hw_driver_functions"]
+    __slots__ = ["hw_drivers", "hw_driver_platforms", "platforms", "delay", "default_fade_ms",
+                 "_color_correction_profile", "stack", "hw_driver_functions", "_resolved_color", "light_group"]
 
     def __init__(self, machine, name):
         """Initialise light."""
         self.hw_drivers = {}
         self.hw_driver_functions = []
+        # (platform, hw driver) of every channel
+        self.hw_driver_platforms = []   # type: List[Tuple[Any, LightPlatformInterface]]
         self.platforms = set()      # type: Set[LightsPlatform]
         super().__init__(machine, name)
         self.machine.light_controller.initialise_light_subsystem()
@@ -86,6 +92,12 @@ class Light(SystemWideDevice, DevicePositionMixin):
 
         self._color_correction_profile = None
 
+        # (time, max_fade_ms, brightness, corrected rgb, fade_ms) of the last update. shared by all channels
+        self._resolved_color = None     # type: Tuple[float, int, float, Tuple[int, int, int], int]
+
+        # set by light groups. all lights of a group are resolved in one batch
+        self.light_group = None     # type: LightGroup
+
         self.stack = list()     # type: List[LightStackEntry]
         """A list of dicts which represents different commands that have come
         in to set this light to a certain color (and/or fade). Each entry in the
@@ -140,15 +152,14 @@ class Light(SystemWideDevice, DevicePositionMixin):
         del kwargs
         check_set = set()
         for light in machine.lights:
-            for drivers in light.hw_drivers.values():
-                for driver in drivers:
-                    key = (light.platform, driver.number, type(driver))
-                    if key in check_set:
-                        raise AssertionError(
-                            "Duplicate light number {} {} for light {}".format(
-                                type(driver), driver.number, light))
+            for platform, driver in light.hw_driver_platforms:
+                key = (platform, driver.number, type(driver))
+                if key in check_set:
+                    raise AssertionError(
+                        "Duplicate light number {} {} for light {}".format(
+                            type(driver), driver.number, light))
 
-                    check_set.add(key)
+                check_set.add(key)
 
     def _map_channels_to_colors(self, channel_list) -> dict:
         if self.config['type']:
@@ -245,16 +256,21 @@ class Light(SystemWideDevice, DevicePositionMixin):
     def _load_hw_driver(self, channel):
         """Load one channel."""
         if channel['platform'] == "drivers":
-            return DriverLight(self.machine.coils[channel['number'].strip()], self.machine.clock.loop,
-                               int(1 / self.machine.config['mpf']['default_light_hw_update_hz'] * 1000))
+            coil = self.machine.coils[channel['number'].strip()]
+            driver = DriverLight(coil, self.machine.clock.loop,
+                                 int(1 / self.machine.config['mpf']['default_light_hw_update_hz'] * 1000))
+            self.hw_driver_platforms.append((coil.platform, driver))
+            return driver
         else:
             platform = self.machine.get_platform_sections('lights', channel['platform'])
             self.platforms.add(platform)
             try:
-                return platform.configure_light(channel['number'], channel['subtype'], channel['platform_settings'])
+                driver = platform.configure_light(channel['number'], channel['subtype'], channel['platform_settings'])
             except AssertionError as e:
                 raise AssertionError("Failed to configure light {} in platform. See error above".
                                      format(self.name)) from e
+            self.hw_driver_platforms.append((platform, driver))
+            return driver
 
     @asyncio.coroutine
     def _initialize(self):
@@ -302,6 +318,7 @@ class Light(SystemWideDevice, DevicePositionMixin):
 
         """
         self._color_correction_profile = profile
+        self._resolved_color = None
 
     def color(self, color, fade_ms=None, priority=0, key=None):
         """Add or update a color entry in this light's stack.
@@ -401,6 +418,7 @@ class Light(SystemWideDevice, DevicePositionMixin):
 
         color_below = self.get_color_below(priority, key)
         self._remove_from_stack_by_key(key)
+        self._resolved_color = None
 
         self.stack.append(LightStackEntry(priority,
                                           key,
@@ -465,6 +483,7 @@ class Light(SystemWideDevice, DevicePositionMixin):
             color_of_key = self._get_color_and_fade(stack, 0)[0]
 
         self._remove_from_stack_by_key(key)
+        self._resolved_color = None
         if fade_ms:
             start_time = self.machine.clock.get_time()
             self.stack.append(LightStackEntry(priority,
@@ -498,6 +517,7 @@ class Light(SystemWideDevice, DevicePositionMixin):
         if found:
             self.debug_log("Removing fadeout for key '%s' from stack", key)
             self.stack = [x for x in self.stack if x.key != key or x.dest_color is not None]
+            self._resolved_color = None
 
         if found and color_change:
             self._schedule_update()
@@ -515,15 +535,19 @@ class Light(SystemWideDevice, DevicePositionMixin):
             self.stack = [x for x in self.stack if x.key != key]
 
     def _schedule_update(self):
+        if self.light_group:
+            self.light_group.mark_light_for_update(self)
+
         for hw_driver, function in self.hw_driver_functions:
             hw_driver.set_fade(function)
 
-        for platform in self.platforms:
-            platform.light_sync()
+        self.machine.light_controller.light_sync(self.platforms)
+        self.machine.device_manager.notify_device_changes(self, "color", None, None)
 
     def clear_stack(self):
         """Remove all entries from the stack and resets this light to 'off'."""
         self.stack = []
+        self._resolved_color = None
 
         self.debug_log("Clearing Stack")
 
@@ -579,13 +603,23 @@ class Light(SystemWideDevice, DevicePositionMixin):
 
             return self._color_correction_profile.apply(color)
 
-    # pylint: disable-msg=too-many-return-statements
     def _get_color_and_fade(self, stack, max_fade_ms: int) -> Tuple[RGBColor, int]:
+        start_color, dest_color, ratio, fade_ms = self._get_blend_and_fade(stack, max_fade_ms)
+        if start_color is None:
+            return dest_color, fade_ms
+        return RGBColor.blend(start_color, dest_color, ratio), fade_ms
+
+    # pylint: disable-msg=too-many-return-statements
+    def _get_blend_and_fade(self, stack, max_fade_ms: int) -> Tuple[RGBColor, RGBColor, float, int]:
+        """Return start color, dest color, blend ratio and fade of the stack.
+
+        Start color is None if there is nothing to blend.
+        """
         try:
             color_settings = stack[0]
         except IndexError:
             # no stack
-            return RGBColor('off'), -1
+            return None, RGBColor('off'), 1.0, -1
 
         dest_color = color_settings.dest_color
 
@@ -593,8 +627,8 @@ class Light(SystemWideDevice, DevicePositionMixin):
         if not color_settings.dest_time:
             # if we are transparent just return the lower layer
             if dest_color is None:
-                return self._get_color_and_fade(stack[1:], max_fade_ms)
-            return dest_color, -1
+                return self._get_blend_and_fade(stack[1:], max_fade_ms)
+            return None, dest_color, 1.0, -1
 
         current_time = self.machine.clock.get_time()
 
@@ -602,8 +636,8 @@ class Light(SystemWideDevice, DevicePositionMixin):
         if current_time >= color_settings.dest_time:
             # if we are transparent just return the lower layer
             if dest_color is None:
-                return self._get_color_and_fade(stack[1:], max_fade_ms)
-            return color_settings.dest_color, -1
+                return self._get_blend_and_fade(stack[1:], max_fade_ms)
+            return None, color_settings.dest_color, 1.0, -1
 
         if dest_color is None:
             dest_color, lower_fade_ms = self._get_color_and_fade(stack[1:], max_fade_ms)
@@ -613,7 +647,7 @@ class Light(SystemWideDevice, DevicePositionMixin):
         target_time = current_time + (max_fade_ms / 1000.0)
         # check if fade will be done before max_fade_ms
         if target_time > color_settings.dest_time:
-            return dest_color, int((color_settings.dest_time - current_time) * 1000)
+            return None, dest_color, 1.0, int((color_settings.dest_time - current_time) * 1000)
 
         # figure out the ratio of how far along we are
         try:
@@ -622,17 +656,76 @@ class Light(SystemWideDevice, DevicePositionMixin):
         except ZeroDivisionError:
             ratio = 1.0
 
-        return RGBColor.blend(color_settings.start_color, dest_color, ratio), max_fade_ms
+        return color_settings.start_color, dest_color, ratio, max_fade_ms
 
-    def _get_brightness_and_fade(self, max_fade_ms: int, color: str) -> Tuple[float, int]:
-        uncorrected_color, fade_ms = self._get_color_and_fade(self.stack, max_fade_ms)
-        corrected_color = self.gamma_correct(uncorrected_color)
-        corrected_color = self.color_correct(corrected_color)
+    def _is_resolved(self, current_time, max_fade_ms, brightness) -> bool:
+        resolved_color = self._resolved_color
+        return bool(resolved_color and resolved_color[0] == current_time and resolved_color[1] == max_fade_ms and
+                    resolved_color[2] == brightness)
 
-        if color in ["red", "blue", "green"]:
-            brightness = getattr(corrected_color, color) / 255.0
+    @staticmethod
+    def resolve_colors(lights: List["Light"], max_fade_ms: int):
+        """Resolve the corrected colors of many lights in one batch.
+
+        Blend, brightness and color correction are applied to all lights at once. Lights which already resolved their
+        color in this tick are skipped. The result is cached per light and shared by all its channels.
+        """
+        if not lights:
+            return
+        machine = lights[0].machine
+        current_time = machine.clock.get_time()
+        brightness = machine.get_machine_var("brightness")
+
+        lights_by_profile = {}  # type: Dict[Any, List[Tuple[Light, RGBColor, RGBColor, float, int]]]
+        for light in lights:
+            if light._is_resolved(current_time, max_fade_ms, brightness):
+                continue
+            start_color, dest_color, ratio, fade_ms = light._get_blend_and_fade(light.stack, max_fade_ms)
+            if start_color is None:
+                start_color = dest_color
+                ratio = 0.0
+            lights_by_profile.setdefault(light._color_correction_profile, []).append(
+                (light, start_color, dest_color, ratio, fade_ms))
+
+        for profile, entries in lights_by_profile.items():
+            colors = RGBColorBatch.blend(RGBColorBatch(entry[1] for entry in entries),
+                                         RGBColorBatch(entry[2] for entry in entries),
+                                         [entry[3] for entry in entries]).scale(brightness)
+            if profile is not None:
+                colors = profile.apply_batch(colors)
+
+            for index, (light, _, _, _, fade_ms) in enumerate(entries):
+                light._resolved_color = (current_time, max_fade_ms, brightness, colors.get_rgb(index), fade_ms)
+
+    def _get_corrected_rgb_and_fade(self, max_fade_ms: int) -> Tuple[Tuple[int, int, int], int]:
+        """Return the corrected rgb values and fade of this light.
+
+        The result is cached until the stack changes or time advances so all channels share one evaluation.
+        """
+        current_time = self.machine.clock.get_time()
+        brightness = self.machine.get_machine_var("brightness")
+        if not self._is_resolved(current_time, max_fade_ms, brightness):
+            if self.light_group:
+                self.light_group.resolve_pending_lights(self, max_fade_ms)
+            else:
+                uncorrected_color, fade_ms = self._get_color_and_fade(self.stack, max_fade_ms)
+                corrected_color = self.gamma_correct(uncorrected_color)
+                corrected_color = self.color_correct(corrected_color)
+                self._resolved_color = (current_time, max_fade_ms, brightness, corrected_color.rgb, fade_ms)
+
+        return self._resolved_color[3], self._resolved_color[4]
+
+    def _get_brightness_and_fade(self, max_fade_ms: int, color: str) -> Tuple[float, int]:
+        (red, green, blue), fade_ms = self._get_corrected_rgb_and_fade(max_fade_ms)
+
+        if color == "red":
+            brightness = red / 255.0
+        elif color == "green":
+            brightness = green / 255.0
+        elif color == "blue":
+            brightness = blue / 255.0
         elif color == "white":
-            brightness = min(corrected_color.red, corrected_color.green, corrected_color.blue) / 255.0
+            brightness = min(red, green, blue) / 255.0
         else:
             raise ColorException("Invalid color {}".format(color))
         return brightness, fade_ms
@@ -676,3 +769,7 @@ class Light(SystemWideDevice, DevicePositionMixin):
     def fade_in_progress(self) -> bool:
         """Return true if a fade is in progress."""
         return bool(self.stack and self.stack[0].dest_time > self.machine.clock.get_time())
+
+    def is_monitorable_state_changing(self) -> bool:
+        """Return true while the color changes during a fade."""
+        return self.fade_in_progress
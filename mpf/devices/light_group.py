@@ -5,7 +5,7 @@ import copy
 
 import math
 
-from typing import List
+from typing import List, Set
 
 from mpf.core.machine import MachineController
 
@@ -22,6 +22,8 @@ class LightGroup(SystemWideDevice):
         super().__init__(machine, name)
 
         self.lights = []        # type: List[Light]
+        # lights with a changed stack or a running fade. they are resolved in one batch
+        self._pending_lights = set()    # type: Set[Light]
 
     @classmethod
     def prepare_config(cls, config: dict, is_mode_config: bool):
@@ -68,6 +70,7 @@ class LightGroup(SystemWideDevice):
         light_config['y'] = y
         light_config = light.validate_and_parse_config(light_config, False)
         light.load_config(light_config)
+        light.light_group = self
         self.lights.append(light)
         self.machine.lights[light.name] = light
 
@@ -75,6 +78,18 @@ class LightGroup(SystemWideDevice):
     def _create_lights(self):
         raise NotImplementedError("Implement")
 
+    def mark_light_for_update(self, light: Light):
+        """Resolve the color of this light in the next batch."""
+        self._pending_lights.add(light)
+
+    def resolve_pending_lights(self, light: Light, max_fade_ms: int):
+        """Resolve the colors of light and all other lights in this group which changed or fade."""
+        self._pending_lights.add(light)
+        lights = list(self._pending_lights)
+        Light.resolve_colors(lights, max_fade_ms)
+        # fading lights will change again in the next tick
+        self._pending_lights = {pending_light for pending_light in lights if pending_light.fade_in_progress}
+
     def color(self, color, fade_ms=None, priority=0, key=None):
         """Call color on all lights in this group."""
         for light in self.lights:
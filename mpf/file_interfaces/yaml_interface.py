@@ -21,6 +21,12 @@ from ruamel.yaml.constructor import Constructor, ConstructorError
 
 from mpf.core.file_interface import FileInterface
 
+try:
+    # libyaml based parser. only parsing happens in C. tags are still resolved by the MpfResolver
+    from ruamel.yaml.cyaml import CParser
+except ImportError:     # pragma: no cover
+    CParser = None
+
 
 class MpfResolver(BaseResolver):
 
@@ -149,6 +155,23 @@ class MpfLoader(Reader, Scanner, Parser, Composer, MpfConstructor, MpfResolver):
         MpfResolver.__init__(self)
 
 
+if CParser:
+    class MpfCLoader(CParser, MpfConstructor, MpfResolver):
+
+        """Config loader which uses libyaml for parsing."""
+
+        # pylint: disable-msg=super-init-not-called
+        def __init__(self, stream):
+            """Initialise loader."""
+            CParser.__init__(self, stream)
+            MpfConstructor.__init__(self)
+            MpfResolver.__init__(self)
+
+    DefaultLoader = MpfCLoader
+else:   # pragma: no cover
+    DefaultLoader = MpfLoader
+
+
 for ch in list(u'yYnNoO'):
     del Resolver.yaml_implicit_resolvers[ch]
 
@@ -215,7 +238,15 @@ class YamlInterface(FileInterface):
     @staticmethod
     def process(data_string: Iterable[str]) -> dict:
         """Parse yaml from a string."""
-        return yaml.load(data_string, Loader=MpfLoader)
+        return yaml.load(data_string, Loader=DefaultLoader)
+
+    @staticmethod
+    def save_to_str(data: Any) -> str:
+        """Return data as yaml string in flow style.
+
+        Lines are not wrapped. The result contains only one line unless a string in data contains line breaks.
+        """
+        return yaml.dump(data, default_flow_style=True, width=float("inf"))
 
     def save(self, filename: str, data: dict) -> None:   # pragma: no cover
         """Save config to yaml file."""
@@ -10,7 +10,7 @@ import os
 from copy import deepcopy
 from distutils.version import StrictVersion
 
-from typing import Dict, Set
+from typing import Dict, List, Optional, Set
 
 from mpf.platforms.fast.fast_io_board import FastIoBoard
 from mpf.platforms.fast.fast_servo import FastServo
@@ -18,13 +18,13 @@ from mpf.platforms.fast import fast_defines
 from mpf.platforms.fast.fast_dmd import FASTDMD
 from mpf.platforms.fast.fast_driver import FASTDriver
 from mpf.platforms.fast.fast_gi import FASTGIString
-from mpf.platforms.fast.fast_led import FASTDirectLED, FASTDirectLEDChannel
+from mpf.platforms.fast.fast_led import FASTDirectLED, FASTDirectLEDChannel, FASTLEDFrameBuilder
 from mpf.platforms.fast.fast_light import FASTMatrixLight
 from mpf.platforms.fast.fast_serial_communicator import FastSerialCommunicator
 from mpf.platforms.fast.fast_switch import FASTSwitch
 
 from mpf.core.platform import ServoPlatform, DmdPlatform, SwitchPlatform, DriverPlatform, LightsPlatform,\
-    DriverSettings, SwitchSettings, DriverConfig, SwitchConfig
+    DriverSettings, SwitchSettings, DriverConfig, SwitchConfig, SwitchChange
 from mpf.core.utility_functions import Util
 
 
@@ -54,10 +54,12 @@ class FastHardwarePlatform(ServoPlatform, LightsPlatform, DmdPlatform,
         self.rgb_connection = None
         self.serial_connections = set()         # type: Set[FastSerialCommunicator]
         self.fast_leds = {}
+        self.led_frame_builder = None   # type: Optional[FASTLEDFrameBuilder]
         self.flag_led_tick_registered = False
         self.config = None
         self.machine_type = None
         self.hw_switch_data = None
+        self._switch_changes = None     # type: Optional[List[SwitchChange]]
         self.io_boards = {}     # type: Dict[int, FastIoBoard]
 
         self.fast_commands = {'ID': lambda x: None,  # processor ID
@@ -265,30 +267,50 @@ class FastHardwarePlatform(ServoPlatform, LightsPlatform, DmdPlatform,
         This is done once per game loop for efficiency (i.e. all LEDs are sent as a single
         update rather than lots of individual ones).
 
-        Also, every LED is updated every loop, even if it doesn't change. This
-        is in case some interference causes a LED to change color. Since we
-        update every loop, it will only be the wrong color for one tick.
+        Only LEDs which changed since the last update are sent. Messages are
+        split when they exceed rgb_max_leds_per_message.
         """
-        dirty_leds = [led for led in self.fast_leds.values() if led.dirty]
-
-        if dirty_leds:
-            msg = 'RS:' + ','.join(["%s%s" % (led.number, led.current_color) for led in dirty_leds])
-            self.rgb_connection.send(msg)
+        for msg in self.led_frame_builder.build_messages():
+            self.rgb_connection.send_bytes(msg, low_priority=True)
 
     @asyncio.coroutine
     def get_hw_switch_states(self):
         """Return hardware states."""
         return self.hw_switch_data
 
+    def process_received_messages(self, msgs: List[str]):
+        """Process multiple messages which have been received at once.
+
+        Switch changes in those messages are passed to the switch controller as one batch.
+
+        Args:
+            msgs: messages which were received
+        """
+        self._switch_changes = []
+        try:
+            for msg in msgs:
+                self.process_received_message(msg)
+            switch_changes = self._switch_changes
+        finally:
+            self._switch_changes = None
+
+        if switch_changes:
+            self.machine.switch_controller.process_switch_changes(switch_changes)
+
+    def _process_switch_change(self, num, state):
+        """Process or batch a switch change."""
+        if self._switch_changes is None:
+            self.machine.switch_controller.process_switch_by_num(state=state, num=num, platform=self)
+        else:
+            self._switch_changes.append(SwitchChange(num=num, state=state, platform=self))
+
     def receive_nw_open(self, msg):
         """Process network switch open.
 
         Args:
             msg: switch number
         """
-        self.machine.switch_controller.process_switch_by_num(state=0,
-                                                             num=(msg, 1),
-                                                             platform=self)
+        self._process_switch_change((msg, 1), 0)
 
     def receive_nw_closed(self, msg):
         """Process network switch closed.
@@ -296,9 +318,7 @@ class FastHardwarePlatform(ServoPlatform, LightsPlatform, DmdPlatform,
         Args:
             msg: switch number
         """
-        self.machine.switch_controller.process_switch_by_num(state=1,
-                                                             num=(msg, 1),
-                                                             platform=self)
+        self._process_switch_change((msg, 1), 1)
 
     def receive_local_open(self, msg):
         """Process local switch open.
@@ -306,9 +326,7 @@ class FastHardwarePlatform(ServoPlatform, LightsPlatform, DmdPlatform,
         Args:
             msg: switch number
         """
-        self.machine.switch_controller.process_switch_by_num(state=0,
-                                                             num=(msg, 0),
-                                                             platform=self)
+        self._process_switch_change((msg, 0), 0)
 
     def receive_local_closed(self, msg):
         """Process local switch closed.
@@ -316,9 +334,7 @@ class FastHardwarePlatform(ServoPlatform, LightsPlatform, DmdPlatform,
         Args:
             msg: switch number
         """
-        self.machine.switch_controller.process_switch_by_num(state=1,
-                                                             num=(msg, 0),
-                                                             platform=self)
+        self._process_switch_change((msg, 0), 1)
 
     def receive_sa(self, msg):
         """Receive all switch states.
@@ -579,6 +595,7 @@ class FastHardwarePlatform(ServoPlatform, LightsPlatform, DmdPlatform,
                                    int(1 / self.machine.config['mpf']['default_light_hw_update_hz'] * 1000), self)
         elif not subtype or subtype == "led":
             if not self.flag_led_tick_registered:
+                self.led_frame_builder = FASTLEDFrameBuilder(self.config['rgb_max_leds_per_message'])
                 # Update leds every frame
                 self.machine.clock.schedule_interval(self.update_leds,
                                                      1 / self.machine.config['mpf']['default_light_hw_update_hz'])
@@ -588,6 +605,7 @@ class FastHardwarePlatform(ServoPlatform, LightsPlatform, DmdPlatform,
             if number_str not in self.fast_leds:
                 self.fast_leds[number_str] = FASTDirectLED(
                     number_str, int(self.config['hardware_led_fade_time']))
+                self.led_frame_builder.add_led(self.fast_leds[number_str])
             fast_led_channel = FASTDirectLEDChannel(self.fast_leds[number_str], channel)
 
             return fast_led_channel
@@ -8,11 +8,15 @@ from typing import Union
 from mpf.platforms.interfaces.light_platform_interface import LightPlatformInterface
 
 
+# lower case hex string for every byte value
+HEX_BYTES = [("%02x" % value).encode() for value in range(256)]
+
+
 class FASTDirectLED:
 
     """FAST RGB LED."""
 
-    __slots__ = ["number", "dirty", "hardware_fade_ms", "colors", "log"]
+    __slots__ = ["number", "dirty", "hardware_fade_ms", "colors", "log", "frame", "_color_offset"]
 
     def __init__(self, number: str, hardware_fade_ms: int) -> None:
         """Initialise FAST LED."""
@@ -20,6 +24,9 @@ class FASTDirectLED:
         self.dirty = True
         self.hardware_fade_ms = hardware_fade_ms
         self.colors = [0, 0, 0]     # type: List[Union[int, Callable[[int], Tuple[float, int]]]]
+        # number and color of this LED as sent in RS: messages. the color is invalid until the first update.
+        self.frame = bytearray(number.encode() + b"------")
+        self._color_offset = len(self.frame) - 6
         self.log = logging.getLogger('FASTLED')
         # All FAST LEDs are 3 element RGB and are set using hex strings
         self.log.debug("Creating FAST RGB LED at hardware address: %s", self.number)
@@ -27,20 +34,53 @@ class FASTDirectLED:
     @property
     def current_color(self):
         """Return current color."""
-        result = ""
+        self.update_frame()
+        return self.frame[self._color_offset:].decode()
+
+    def update_frame(self) -> bool:
+        """Update the color in frame and return True if it changed since the last update."""
         self.dirty = False
+        changed = False
+        offset = self._color_offset
         # send this as grb because the hardware will twist it again
-        for index in [1, 0, 2]:
+        for index in (1, 0, 2):
             color = self.colors[index]
             if callable(color):
                 brightness, fade_ms = color(self.hardware_fade_ms)  # pylint: disable-msg=not-callable
-                result += hex(int(brightness * 255))[2:].zfill(2)
+                value = HEX_BYTES[int(brightness * 255)]
                 if fade_ms >= self.hardware_fade_ms:
                     self.dirty = True
             else:
-                result += "00"
+                value = b"00"
+
+            if self.frame[offset:offset + 2] != value:
+                self.frame[offset:offset + 2] = value
+                changed = True
+            offset += 2
+
+        return changed
+
+
+class FASTLEDFrameBuilder:
+
+    """Builds RS: messages for all FAST LEDs which changed since the last update."""
+
+    __slots__ = ["leds", "max_leds_per_message"]
+
+    def __init__(self, max_leds_per_message: int) -> None:
+        """Initialise frame builder."""
+        self.leds = []      # type: List[FASTDirectLED]
+        self.max_leds_per_message = max_leds_per_message
+
+    def add_led(self, led: FASTDirectLED):
+        """Add a LED to the frame."""
+        self.leds.append(led)
 
-        return result
+    def build_messages(self) -> List[bytes]:
+        """Return encoded RS: messages for all changed LEDs split at the maximum message length."""
+        changed = [led.frame for led in self.leds if led.dirty and led.update_frame()]
+        return [b'RS:' + b','.join(changed[start:start + self.max_leds_per_message]) + b'\r'
+                for start in range(0, len(changed), self.max_leds_per_message)]
 
 
 class FASTDirectLEDChannel(LightPlatformInterface):
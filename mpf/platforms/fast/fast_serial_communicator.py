@@ -1,5 +1,6 @@
 """Fast serial communicator."""
 import asyncio
+from collections import deque
 from distutils.version import StrictVersion
 
 from mpf.platforms.base_serial_communicator import BaseSerialCommunicator
@@ -40,9 +41,15 @@ class FastSerialCommunicator(BaseSerialCommunicator):
                         'XX:N'
                         ]
 
+    # light updates which are written after all other commands (e.g. driver and rule commands)
+    low_priority_commands = ('RS:', 'L1:', 'GI:')
+
+    # limit for the number of encoded commands which are kept
+    max_encoded_commands = 1000
+
     __slots__ = ["dmd", "remote_processor", "remote_model", "remote_firmware", "max_messages_in_flight",
                  "messages_in_flight", "ignored_messages_in_flight", "send_ready", "write_task", "received_msg",
-                 "send_queue"]
+                 "send_queue", "low_priority_send_queue", "send_pending", "encoded_commands"]
 
     def __init__(self, platform, port, baud):
         """Initialise communicator.
@@ -67,7 +74,10 @@ class FastSerialCommunicator(BaseSerialCommunicator):
 
         self.received_msg = b''
 
-        self.send_queue = asyncio.Queue(loop=platform.machine.clock.loop)
+        self.send_queue = deque()
+        self.low_priority_send_queue = deque()
+        self.send_pending = asyncio.Event(loop=platform.machine.clock.loop)
+        self.encoded_commands = {}
 
         super().__init__(platform, port, baud)
 
@@ -255,34 +265,69 @@ class FastSerialCommunicator(BaseSerialCommunicator):
                 be added automatically.
 
         """
-        self.send_queue.put_nowait(msg)
-
-    def _send(self, msg):
-        debug = self.platform.config['debug']
         if self.dmd:
-            self.writer.write(b'BM:' + msg)
-            if debug:
-                self.platform.log.debug("Send: %s", "".join(" 0x%02x" % b for b in msg))
+            self.send_queue.append(msg)
+            self.send_pending.set()
+        elif msg[0:3] in self.low_priority_commands:
+            # light updates change all the time so they are not kept encoded
+            self.send_bytes(msg.encode() + b'\r', low_priority=True)
+        else:
+            encoded = self.encoded_commands.get(msg)
+            if encoded is None:
+                if len(self.encoded_commands) >= self.max_encoded_commands:
+                    self.encoded_commands.clear()
+                encoded = msg.encode() + b'\r'
+                self.encoded_commands[msg] = encoded
+            self.send_bytes(encoded)
 
+    def send_bytes(self, msg: bytes, low_priority=False):
+        """Send an encoded message which already includes the <CR> character.
+
+        Args:
+            msg: Encoded message.
+            low_priority: Write this message after all other commands (used for light updates).
+        """
+        if low_priority:
+            self.low_priority_send_queue.append(msg)
         else:
-            self.messages_in_flight += 1
-            if self.messages_in_flight > self.max_messages_in_flight:
-                self.send_ready.clear()
+            self.send_queue.append(msg)
+        self.send_pending.set()
 
-                self.log.debug("Enabling Flow Control for %s connection. "
-                               "Messages in flight: %s, Max setting: %s",
-                               self.remote_processor,
-                               self.messages_in_flight,
-                               self.max_messages_in_flight)
+    def _send(self, msg):
+        self.writer.write(b'BM:' + msg)
+        if self.platform.config['debug']:
+            self.platform.log.debug("Send: %s", "".join(" 0x%02x" % b for b in msg))
 
-            self.writer.write(msg.encode() + b'\r')
-            if debug and msg[0:2] != "WD":
-                self.platform.log.debug("Send: %s", msg)
+    def _send_batch(self):
+        """Write all queued messages which fit into the flow control window at once.
+
+        Driver and rule commands are written before light updates.
+        """
+        debug = self.platform.config['debug']
+        batch = []
+        for queue in (self.send_queue, self.low_priority_send_queue):
+            while queue and self.send_ready.is_set():
+                msg = queue.popleft()
+                batch.append(msg)
+                self.messages_in_flight += 1
+                if self.messages_in_flight > self.max_messages_in_flight:
+                    self.send_ready.clear()
+
+                    self.log.debug("Enabling Flow Control for %s connection. "
+                                   "Messages in flight: %s, Max setting: %s",
+                                   self.remote_processor,
+                                   self.messages_in_flight,
+                                   self.max_messages_in_flight)
+
+                if debug and msg[0:2] != b"WD":
+                    self.platform.log.debug("Send: %s", msg[:-1].decode())
+
+        self.writer.write(b''.join(batch))
 
     @asyncio.coroutine
     def _socket_writer(self):
         while True:
-            msg = yield from self.send_queue.get()
+            yield from self.send_pending.wait()
             try:
                 yield from asyncio.wait_for(self.send_ready.wait(), 1.0, loop=self.machine.clock.loop)
             except asyncio.TimeoutError:
@@ -291,11 +336,18 @@ class FastSerialCommunicator(BaseSerialCommunicator):
                 self.messages_in_flight = 0
                 self.send_ready.set()
 
-            self._send(msg)
+            if self.dmd:
+                self._send(self.send_queue.popleft())
+            else:
+                self._send_batch()
+
+            if not self.send_queue and not self.low_priority_send_queue:
+                self.send_pending.clear()
 
     def _parse_msg(self, msg):
         self.received_msg += msg
 
+        messages = []
         while True:
             pos = self.received_msg.find(b'\r')
 
@@ -321,4 +373,8 @@ class FastSerialCommunicator(BaseSerialCommunicator):
                 continue
 
             if msg.decode() not in self.ignored_messages:
-                self.platform.process_received_message(msg.decode())
+                messages.append(msg.decode())
+
+        # process all messages at once so switch changes are batched
+        if messages:
+            self.platform.process_received_messages(messages)
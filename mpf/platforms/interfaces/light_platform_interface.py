@@ -1,10 +1,11 @@
 """Interface for a light hardware devices."""
 import abc
-import asyncio
 from asyncio import AbstractEventLoop
 
 from typing import Callable, Tuple, Any
 
+from mpf.core.light_fade_scheduler import LightFadeScheduler
+
 
 class LightPlatformInterface(metaclass=abc.ABCMeta):
 
@@ -36,13 +37,13 @@ class LightPlatformDirectFade(LightPlatformInterface, metaclass=abc.ABCMeta):
 
     """Implement a light which can set fade and brightness directly."""
 
-    __slots__ = ["loop", "task"]
+    __slots__ = ["loop", "fade_scheduler"]
 
     def __init__(self, number, loop: AbstractEventLoop) -> None:
         """Initialise light."""
         super().__init__(number)
         self.loop = loop
-        self.task = None    # type: asyncio.Task
+        self.fade_scheduler = LightFadeScheduler.get_scheduler(loop)
 
     @abc.abstractmethod
     def get_max_fade_ms(self) -> int:
@@ -54,26 +55,19 @@ class LightPlatformDirectFade(LightPlatformInterface, metaclass=abc.ABCMeta):
         return self.get_max_fade_ms()
 
     def set_fade(self, color_and_fade_callback: Callable[[int], Tuple[float, int]]):
-        """Perform a fade with either a asyncio task or with a single command."""
-        max_fade_ms = self.get_max_fade_ms()
+        """Perform a fade with either the shared fade scheduler or with a single command."""
+        if self.fade_step(color_and_fade_callback):
+            # we have to continue the fade later
+            self.fade_scheduler.add_fade(self, color_and_fade_callback)
+        else:
+            self.fade_scheduler.remove_fade(self)
 
+    def fade_step(self, color_and_fade_callback: Callable[[int], Tuple[float, int]]) -> bool:
+        """Set the current brightness of a fade and return true if the fade has to be continued later."""
+        max_fade_ms = self.get_max_fade_ms()
         brightness, fade_ms = color_and_fade_callback(max_fade_ms)
         self.set_brightness_and_fade(brightness, max(fade_ms, 0))
-        if fade_ms >= max_fade_ms:
-            # we have to continue the fade later
-            if self.task:
-                self.task.cancel()
-            self.task = self.loop.create_task(self._fade(color_and_fade_callback))
-
-    @asyncio.coroutine
-    def _fade(self, color_and_fade_callback):
-        while True:
-            yield from asyncio.sleep(self.get_fade_interval_ms() / 1000, loop=self.loop)
-            max_fade_ms = self.get_max_fade_ms()
-            brightness, fade_ms = color_and_fade_callback(max_fade_ms)
-            self.set_brightness_and_fade(brightness, max(fade_ms, 0))
-            if fade_ms < max_fade_ms:
-                return
+        return fade_ms >= max_fade_ms
 
     @abc.abstractmethod
     def set_brightness_and_fade(self, brightness: float, fade_ms: int):
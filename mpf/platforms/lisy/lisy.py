@@ -15,7 +15,7 @@ from mpf.platforms.lisy.defines import LisyDefines
 from mpf.platforms.interfaces.light_platform_interface import LightPlatformSoftwareFade
 
 from mpf.core.platform import SwitchPlatform, LightsPlatform, DriverPlatform, SwitchSettings, DriverSettings, \
-    DriverConfig, SwitchConfig, SegmentDisplaySoftwareFlashPlatform, HardwareSoundPlatform
+    DriverConfig, SwitchConfig, SegmentDisplaySoftwareFlashPlatform, HardwareSoundPlatform, SwitchChange
 
 
 class LisySwitch(SwitchPlatformInterface):
@@ -296,11 +296,18 @@ class LisyHardwarePlatform(SwitchPlatform, LightsPlatform, DriverPlatform,
 
     @asyncio.coroutine
     def _poll(self):
+        switch_changes = []
         while True:
             self.send_byte(LisyDefines.SwitchesGetChangedSwitches)
             status = yield from self.read_byte()
             if status == 127:
-                # no changes. sleep 1ms
+                # no more changes. tell the switch controller about all new
+                # states at once
+                if switch_changes:
+                    self.machine.switch_controller.process_switch_changes(switch_changes)
+                    switch_changes = []
+
+                # sleep 1ms
                 yield from asyncio.sleep(.001, loop=self.machine.clock.loop)
             else:
                 # bit 7 is state
@@ -308,8 +315,7 @@ class LisyHardwarePlatform(SwitchPlatform, LightsPlatform, DriverPlatform,
                 # bits 0-6 are the switch number
                 switch_num = status & 0b01111111
 
-                # tell the switch controller about the new state
-                self.machine.switch_controller.process_switch_by_num(str(switch_num), switch_state, self)
+                switch_changes.append(SwitchChange(num=str(switch_num), state=switch_state, platform=self))
 
                 # store in dict as well
                 self._inputs[str(switch_num)] = bool(switch_state)
@@ -7,6 +7,8 @@ import asyncio
 import logging
 
 from typing import Callable
+from typing import Dict
+from typing import List
 from typing import Tuple
 
 from mpf.core.platform import LightsPlatform
@@ -16,6 +18,9 @@ MYPY = False
 if MYPY:   # pragma: no cover
     from mpf.core.machine import MachineController
 
+# position of red, green and blue in a GRB pixel
+GRB_OFFSETS = (1, 0, 2)
+
 
 class OpenpixelHardwarePlatform(LightsPlatform):
 
@@ -123,13 +128,16 @@ class OpenPixelClient:
 
     """Base class of an OPC client which connects to a FadeCandy server.
 
+    Every channel is kept as a complete OPC message (header plus GRB pixel
+    data) which is updated in place for dirty pixels only.
+
     Args:
         machine: The main ``MachineController`` instance.
         config: Config to use
     """
 
     __slots__ = ["machine", "log", "update_every_tick", "socket_sender", "max_fade_ms", "channels", "dirty_leds",
-                 "msg", "openpixel_config"]
+                 "last_sent", "openpixel_config"]
 
     def __init__(self, machine, config):
         """Initialise openpixel client."""
@@ -139,9 +147,9 @@ class OpenPixelClient:
         self.update_every_tick = False
         self.socket_sender = None
         self.max_fade_ms = None
-        self.channels = []
-        self.dirty_leds = []
-        self.msg = []
+        self.channels = []      # type: List[bytearray]
+        self.dirty_leds = []    # type: List[Dict[int, Callable[[int], Tuple[float, int]]]]
+        self.last_sent = []     # type: List[float]
         self.openpixel_config = config
 
     @asyncio.coroutine
@@ -176,17 +184,19 @@ class OpenPixelClient:
 
         """
         if len(self.channels) < channel + 1:
-
-            channels_to_add = channel + 1 - len(self.channels)
-
-            self.channels += [list() for _ in range(channels_to_add)]
-            self.dirty_leds += [dict() for _ in range(channels_to_add)]
-            self.msg += [None for _ in range(channels_to_add)]
-
-        if len(self.channels[channel]) < led + 1:
-
-            leds_to_add = led + 1 - len(self.channels[channel])
-            self.channels[channel] += [0 for _ in range(leds_to_add)]
+            for channel_index in range(len(self.channels), channel + 1):
+                self.channels.append(bytearray([channel_index, 0, 0, 0]))
+                self.dirty_leds.append(dict())
+                self.last_sent.append(0)
+
+        msg = self.channels[channel]
+        num_values = (msg[2] << 8) + msg[3]
+        if num_values < led + 1:
+            num_values = led + 1
+            msg[2] = num_values >> 8
+            msg[3] = num_values & 0xFF
+            # only complete pixels are sent
+            msg.extend(bytes(4 + num_values - num_values % 3 - len(msg)))
 
     def set_pixel_color(self, channel, pixel, callback: Callable[[int], Tuple[float, int]]):
         """Set an individual pixel color.
@@ -201,75 +211,49 @@ class OpenPixelClient:
     def tick(self):
         """Update pixels.
 
-        Called periodically.
+        Called periodically. Only channels with changed pixels are sent. If
+        update_every_tick is set, unchanged channels are resent once per
+        keepalive interval.
         """
-        for channel_index in range(len(self.channels)):
-            if not self.update_every_tick and not self.dirty_leds[channel_index]:
-                continue
-            self._handle_dirty_leds(channel_index)
-            self._update_pixels(channel_index)
-
-    def _handle_dirty_leds(self, channel):
-        if not self.dirty_leds[channel]:
-            return
-
-        # invalidate cached message
-        self.msg[channel] = None
-
-        for pixel, callback in dict(self.dirty_leds[channel]).items():
+        now = self.machine.clock.get_time()
+        keepalive = self.openpixel_config['keepalive'] / 1000
+        for channel_index, msg in enumerate(self.channels):
+            if self.dirty_leds[channel_index] and self._handle_dirty_leds(channel_index):
+                self.send(msg)
+                self.last_sent[channel_index] = now
+            elif self.update_every_tick and now - self.last_sent[channel_index] >= keepalive:
+                self.send(msg)
+                self.last_sent[channel_index] = now
+
+    def _handle_dirty_leds(self, channel) -> bool:
+        """Write dirty pixels into the message of the channel and return True if any of them changed."""
+        msg = self.channels[channel]
+        dirty_leds = self.dirty_leds[channel]
+        changed = False
+        done = []
+        for pixel, callback in dirty_leds.items():
             brightness, remaining_fade = callback(self.max_fade_ms)
             value = min(255, max(0, int(brightness * 255)))
-            self.channels[channel][pixel] = value
+            # send GRB because that is the default color order for WS2812
+            color = pixel % 3
+            offset = 4 + pixel - color + GRB_OFFSETS[color]
+            if offset < len(msg) and msg[offset] != value:
+                msg[offset] = value
+                changed = True
             # fade is done
             if remaining_fade < self.max_fade_ms:
-                del self.dirty_leds[channel][pixel]
-
-    def _update_pixels(self, channel):
-        """Send the list of pixel colors to the OPC server.
+                done.append(pixel)
 
-        Args:
-            pixels: A list of 3-item iterables (tuples or lists). Each item is
-                a 0-255 value of the intensity of the red, green, and blue
-                values for the pixel. The first item in the list is the first
-                pixel on the channel, the second item is the second one, etc.
-            channel: Which OPC channel the pixel data will be written to.
-
-        Returns:
-            True on success. False if it was unable to connect to the OPC
-            server.
-
-        Note that you must send color data for all the pixels in a channel (or
-        all the pixels up until the point you want. e.g. if you have 30 LEDs on
-        the channel and you just want to update LED #10, then you need to send
-        pixel data for the first 10 pixels.)
-        """
-        # if we got a cached message just send it
-        if not self.msg[channel]:
-            self.msg[channel] = bytes(self._build_message(channel))
-
-        self.send(self.msg[channel])
-
-    def _build_message(self, channel):
-        """Build the OPC message."""
-        msg = bytearray()
-        pixels = self.channels[channel]
-        len_hi_byte = int(len(pixels) / 256)
-        len_lo_byte = (len(pixels)) % 256
-        header = bytes([channel, 0, len_hi_byte, len_lo_byte])
-        msg.extend(header)
-        for i in range(int(len(pixels) / 3)):
-            # send GRB because that is the default color order for WS2812
+        for pixel in done:
+            del dirty_leds[pixel]
 
-            msg.append(pixels[i * 3 + 1])
-            msg.append(pixels[i * 3])
-            msg.append(pixels[i * 3 + 2])
-        return msg
+        return changed
 
     def blank_all(self):
         """Blank all channels."""
-        for channel_index in range(len(self.channels)):
-            self.channels[channel_index] = [0] * len(self.channels[channel_index])
-            self.send(bytes(self._build_message(channel_index)))
+        for msg in self.channels:
+            msg[4:] = bytes(len(msg) - 4)
+            self.send(msg)
 
     def send(self, message):
         """Send a message to the socket.
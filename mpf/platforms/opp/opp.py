@@ -17,7 +17,7 @@ from mpf.platforms.opp.opp_switch import OPPInputCard
 from mpf.platforms.opp.opp_switch import OPPMatrixCard
 from mpf.platforms.opp.opp_rs232_intf import OppRs232Intf
 from mpf.core.platform import SwitchPlatform, DriverPlatform, LightsPlatform, SwitchSettings, DriverSettings, \
-    DriverConfig, SwitchConfig
+    DriverConfig, SwitchConfig, SwitchChange
 
 MYPY = False
 if MYPY:   # pragma: no cover
@@ -259,6 +259,17 @@ class OppHardwarePlatform(LightsPlatform, SwitchPlatform, DriverPlatform):
         """
         self.opp_connection[chain_serial].send(msg)
 
+    def send_light_update_to_processor(self, chain_serial, msg):
+        """Queue a light update for the processor with a specific serial number.
+
+        Light updates of one loop iteration are sent in one frame per chain after all driver commands.
+
+        Args:
+            chain_serial: Serial of the processor.
+            msg: Message to send.
+        """
+        self.opp_connection[chain_serial].send_coalesced(msg)
+
     def update_incand(self):
         """Update all the incandescents connected to OPP hardware.
 
@@ -268,8 +279,8 @@ class OppHardwarePlatform(LightsPlatform, SwitchPlatform, DriverPlatform):
         communication with the boards.  If this does not end up being the case,
         this will be changed to update all the incandescents each loop.
         """
+        whole_msgs = {}     # type: Dict[str, bytearray]
         for incand in self.opp_incands:
-            whole_msg = bytearray()
             # Check if any changes have been made
             if (incand.oldState ^ incand.newState) != 0:
                 # Update card
@@ -283,14 +294,14 @@ class OppHardwarePlatform(LightsPlatform, SwitchPlatform, DriverPlatform):
                 msg.append((incand.newState >> 8) & 0xff)
                 msg.append(incand.newState & 0xff)
                 msg.extend(OppRs232Intf.calc_crc8_whole_msg(msg))
-                whole_msg.extend(msg)
+                whole_msgs.setdefault(incand.chain_serial, bytearray()).extend(msg)
 
-            if whole_msg:
-                # Note:  No need to send EOM at end of cmds
-                send_cmd = bytes(whole_msg)
-
-                self.send_to_processor(incand.chain_serial, send_cmd)
-                self.log.debug("Update incand cmd:%s", "".join(" 0x%02x" % b for b in send_cmd))
+        # send one message per chain for all cards
+        for chain_serial, whole_msg in whole_msgs.items():
+            # Note:  No need to send EOM at end of cmds
+            self.send_light_update_to_processor(chain_serial, whole_msg)
+            if self.debug:
+                self.log.debug("Update incand cmd:%s", "".join(" 0x%02x" % b for b in whole_msg))
 
     @classmethod
     def get_coil_config_section(cls):
@@ -571,21 +582,17 @@ class OppHardwarePlatform(LightsPlatform, SwitchPlatform, DriverPlatform):
             # Update the state which holds inputs that are active
             changes = opp_inp.oldState ^ new_state
             if changes != 0:
+                switch_changes = []
                 curr_bit = 1
                 for index in range(0, 32):
                     if (curr_bit & changes) != 0:
-                        if (curr_bit & new_state) == 0:
-                            self.machine.switch_controller.process_switch_by_num(
-                                state=1,
-                                num=opp_inp.chain_serial + '-' + opp_inp.cardNum + '-' + str(index),
-                                platform=self)
-                        else:
-                            self.machine.switch_controller.process_switch_by_num(
-                                state=0,
-                                num=opp_inp.chain_serial + '-' + opp_inp.cardNum + '-' + str(index),
-                                platform=self)
+                        switch_changes.append(SwitchChange(
+                            num=opp_inp.chain_serial + '-' + opp_inp.cardNum + '-' + str(index),
+                            state=1 if (curr_bit & new_state) == 0 else 0,
+                            platform=self))
                     curr_bit <<= 1
-            opp_inp.oldState = new_state
+                opp_inp.oldState = new_state
+                self.machine.switch_controller.process_switch_changes(switch_changes)
 
         # we can continue to poll
         self._poll_response_received[chain_serial].set()
@@ -643,25 +650,23 @@ class OppHardwarePlatform(LightsPlatform, SwitchPlatform, DriverPlatform):
                          (msg[6] << 24) | (msg[7] << 16) | (msg[8] << 8) | msg[9]]
 
             # Using a bank so 32 bit python works properly
+            switch_changes = []
             for bank in range(0, 2):
                 changes = opp_inp.oldState[bank] ^ new_state[bank]
                 if changes != 0:
                     curr_bit = 1
                     for index in range(0, 32):
                         if (curr_bit & changes) != 0:
-                            if (curr_bit & new_state[bank]) == 0:
-                                self.machine.switch_controller.process_switch_by_num(
-                                    state=1,
-                                    num=opp_inp.chain_serial + '-' + opp_inp.cardNum + '-' + str(index),
-                                    platform=self)
-                            else:
-                                self.machine.switch_controller.process_switch_by_num(
-                                    state=0,
-                                    num=opp_inp.chain_serial + '-' + opp_inp.cardNum + '-' + str(index),
-                                    platform=self)
+                            switch_changes.append(SwitchChange(
+                                num=opp_inp.chain_serial + '-' + opp_inp.cardNum + '-' + str(index),
+                                state=1 if (curr_bit & new_state[bank]) == 0 else 0,
+                                platform=self))
                         curr_bit <<= 1
                 opp_inp.oldState[bank] = new_state[bank]
 
+            if switch_changes:
+                self.machine.switch_controller.process_switch_changes(switch_changes)
+
         # we can continue to poll
         self._poll_response_received[chain_serial].set()
 
@@ -820,7 +825,7 @@ class OppHardwarePlatform(LightsPlatform, SwitchPlatform, DriverPlatform):
                 self.log.warning("Poll took more than %sms for %s", timeout * 1000, chain_serial)
             else:
                 self._poll_response_received[chain_serial].clear()
-            # send poll
+            # send poll ahead of all light updates queued on this chain
             self.send_to_processor(chain_serial, self.read_input_msg[chain_serial])
             yield from self.opp_connection[chain_serial].writer.drain()
             # the line above saturates the link and seems to overwhelm the hardware. limit it to 100Hz
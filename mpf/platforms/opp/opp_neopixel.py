@@ -125,7 +125,7 @@ class OPPNeopixel:
                 msg.extend(OppRs232Intf.calc_crc8_whole_msg(msg))
                 cmd = bytes(msg)
                 self.log.debug("Add Neo color table entry: %s", "".join(" 0x%02x" % b for b in cmd))
-                self.neoCard.platform.send_to_processor(self.neoCard.chain_serial, cmd)
+                self.neoCard.platform.send_light_update_to_processor(self.neoCard.chain_serial, cmd)
                 self.neoCard.numColorEntries += 1
             else:
                 error = True
@@ -141,4 +141,4 @@ class OPPNeopixel:
             msg.extend(OppRs232Intf.calc_crc8_whole_msg(msg))
             cmd = bytes(msg)
             self.log.debug("Set Neopixel color: %s", "".join(" 0x%02x" % b for b in cmd))
-            self.neoCard.platform.send_to_processor(self.neoCard.chain_serial, cmd)
+            self.neoCard.platform.send_light_update_to_processor(self.neoCard.chain_serial, cmd)
@@ -1,5 +1,8 @@
 """Defines for OPP platform."""
 
+# CRC results as bytes so they do not have to be created for every message
+CRC8_BYTES = [bytes([value]) for value in range(256)]
+
 
 class OppRs232Intf:
 
@@ -108,10 +111,10 @@ class OppRs232Intf:
     def calc_crc8_whole_msg(msg_chars):
         """Calculate CRC for message."""
         crc8_byte = 0xff
-        for ind_char in msg_chars:
-            ind_int = ind_char
-            crc8_byte = OppRs232Intf.CRC8_LOOKUP[crc8_byte ^ ind_int]
-        return bytes([crc8_byte])
+        crc8_lookup = OppRs232Intf.CRC8_LOOKUP
+        for ind_int in msg_chars:
+            crc8_byte = crc8_lookup[crc8_byte ^ ind_int]
+        return CRC8_BYTES[crc8_byte]
 
     @staticmethod
     def calc_crc8_part_msg(msg_chars, start_index, num_chars):
@@ -126,4 +129,4 @@ class OppRs232Intf:
             ind_int = msg_chars[start_index + index]
             crc8_byte = OppRs232Intf.CRC8_LOOKUP[crc8_byte ^ ind_int]
             index += 1
-        return bytes([crc8_byte])
+        return CRC8_BYTES[crc8_byte]
@@ -18,7 +18,7 @@ class OPPSerialCommunicator(BaseSerialCommunicator):
 
     """Manages a Serial connection to the first processor in a OPP serial chain."""
 
-    __slots__ = ["partMsg", "chain_serial", "_lost_synch"]
+    __slots__ = ["partMsg", "chain_serial", "_lost_synch", "_pending_writes", "_flush_scheduled"]
 
     # pylint: disable=too-many-arguments
     def __init__(self, platform: "OppHardwarePlatform", port, baud) -> None:
@@ -26,6 +26,8 @@ class OPPSerialCommunicator(BaseSerialCommunicator):
         self.partMsg = b""
         self.chain_serial = None    # type: str
         self._lost_synch = False
+        self._pending_writes = bytearray()
+        self._flush_scheduled = False
 
         super().__init__(platform, port, baud)
 
@@ -144,6 +146,41 @@ class OPPSerialCommunicator(BaseSerialCommunicator):
                                          ((version_int >> 16) & 0xff), ((version_int >> 8) & 0xff),
                                          (version_int & 0xff)))
 
+    def send(self, msg):
+        """Send a message to the remote processor right away.
+
+        Driver commands and polls use this so they are not delayed by light updates.
+
+        Args:
+            msg: Bytes of the message you want to send.
+        """
+        if self.debug:
+            self.log.debug("Sending: %s (%s)", msg, "".join(" 0x%02x" % b for b in msg))
+        self.writer.write(msg)
+
+    def send_coalesced(self, msg):
+        """Queue a light update for this chain.
+
+        All light updates queued in the same loop iteration are written as one frame.
+
+        Args:
+            msg: Bytes of the message you want to send.
+        """
+        if self.debug:
+            self.log.debug("Queueing: %s (%s)", msg, "".join(" 0x%02x" % b for b in msg))
+        self._pending_writes.extend(msg)
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.machine.clock.loop.call_soon(self._flush)
+
+    def _flush(self):
+        """Write all queued light updates as one frame."""
+        self._flush_scheduled = False
+        frame = bytes(self._pending_writes)
+        self._pending_writes = bytearray()
+        if frame and self.writer:
+            self.writer.write(frame)
+
     def lost_synch(self):
         """Mark connection as desynchronised."""
         self._lost_synch = True
@@ -21,7 +21,7 @@ from mpf.platforms.interfaces.switch_platform_interface import SwitchPlatformInt
 
 from mpf.platforms.interfaces.i2c_platform_interface import I2cPlatformInterface
 
-from mpf.core.platform import I2cPlatform, AccelerometerPlatform, DriverConfig, SwitchConfig
+from mpf.core.platform import I2cPlatform, AccelerometerPlatform, DriverConfig, SwitchConfig, SwitchChange
 from mpf.platforms.interfaces.accelerometer_platform_interface import AccelerometerPlatformInterface
 from mpf.platforms.p_roc_common import PDBConfig, PROCBasePlatform
 from mpf.platforms.p_roc_devices import PROCDriver
@@ -396,31 +396,20 @@ class P3RocHardwarePlatform(PROCBasePlatform, I2cPlatform, AccelerometerPlatform
 
         return result
 
-    def tick(self):
-        """Check the P3-ROC for any events (switch state changes).
-
-        Also tickles the watchdog and flushes any queued commands to the P3-ROC.
-        """
-        # Get P3-ROC events
-        for event in self.proc.get_events():
+    def _process_events(self, events):
+        """Process events from the P3-ROC (switch state changes, accelerometer values and bursts)."""
+        switch_changes = []
+        for event in events:
             event_type = event['type']
             event_value = event['value']
             if event_type == self.pinproc.EventTypeSwitchClosedDebounced:
-                self.machine.switch_controller.process_switch_by_num(state=1,
-                                                                     num=event_value,
-                                                                     platform=self)
+                switch_changes.append(SwitchChange(num=event_value, state=1, platform=self))
             elif event_type == self.pinproc.EventTypeSwitchOpenDebounced:
-                self.machine.switch_controller.process_switch_by_num(state=0,
-                                                                     num=event_value,
-                                                                     platform=self)
+                switch_changes.append(SwitchChange(num=event_value, state=0, platform=self))
             elif event_type == self.pinproc.EventTypeSwitchClosedNondebounced:
-                self.machine.switch_controller.process_switch_by_num(state=1,
-                                                                     num=event_value,
-                                                                     platform=self)
+                switch_changes.append(SwitchChange(num=event_value, state=1, platform=self))
             elif event_type == self.pinproc.EventTypeSwitchOpenNondebounced:
-                self.machine.switch_controller.process_switch_by_num(state=0,
-                                                                     num=event_value,
-                                                                     platform=self)
+                switch_changes.append(SwitchChange(num=event_value, state=0, platform=self))
 
             # The P3-ROC will always send all three values sequentially.
             # Therefore, we will trigger after the Z value
@@ -446,29 +435,25 @@ class P3RocHardwarePlatform(PROCBasePlatform, I2cPlatform, AccelerometerPlatform
             elif event_type == self.pinproc.EventTypeBurstSwitchOpen:
                 if self.debug:
                     self.debug_log("Got burst open event value %s", event_value)
-                self._handle_burst(event_value, 0)
+                self._handle_burst(switch_changes, event_value, 0)
             elif event_type == self.pinproc.EventTypeBurstSwitchClosed:
                 if self.debug:
                     self.debug_log("Got burst closed event value %s", event_value)
-                self._handle_burst(event_value, 1)
+                self._handle_burst(switch_changes, event_value, 1)
             else:   # pragma: no cover
                 self.log.warning("Received unrecognized event from the P3-ROC. "
                                  "Type: %s, Value: %s", event_type, event_value)
 
-        self.proc.watchdog_tickle()
-        self.proc.flush()
+        if switch_changes:
+            self.machine.switch_controller.process_switch_changes(switch_changes)
 
-    def _handle_burst(self, event_value, state):
+    def _handle_burst(self, switch_changes, event_value, state):
         input_num = event_value & 0x3F
         output_num = (event_value >> 6) & 0x1F
         burst_number1 = "burst-{}-{}".format(input_num, output_num)
-        self.machine.switch_controller.process_switch_by_num(state=state,
-                                                             num=burst_number1,
-                                                             platform=self)
+        switch_changes.append(SwitchChange(num=burst_number1, state=state, platform=self))
         burst_number2 = "burst-{}-{}".format(input_num, output_num + 32)
-        self.machine.switch_controller.process_switch_by_num(state=state,
-                                                             num=burst_number2,
-                                                             platform=self)
+        switch_changes.append(SwitchChange(num=burst_number2, state=state, platform=self))
 
 
 class P3RocI2c(I2cPlatformInterface):
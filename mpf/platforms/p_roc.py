@@ -16,7 +16,7 @@ https://github.com/preble/pyprocgame
 import logging
 import asyncio
 
-from mpf.core.platform import DmdPlatform, DriverConfig, SwitchConfig, SegmentDisplayPlatform
+from mpf.core.platform import DmdPlatform, DriverConfig, SwitchConfig, SegmentDisplayPlatform, SwitchChange
 from mpf.platforms.interfaces.dmd_platform import DmdPlatformInterface
 from mpf.platforms.interfaces.segment_display_platform_interface import SegmentDisplayPlatformInterface
 from mpf.platforms.p_roc_common import PDBConfig, PROCBasePlatform
@@ -187,35 +187,28 @@ class PRocHardwarePlatform(PROCBasePlatform, DmdPlatform, SegmentDisplayPlatform
 
         return PRocAlphanumericDisplay(self.alpha_display, number_int)
 
-    def tick(self):
-        """Check the P-ROC for any events (switch state changes or notification that a DMD frame was updated).
-
-        Also tickles the watchdog and flushes any queued commands to the P-ROC.
-        """
-        # Get P-ROC events (switches & DMD frames displayed)
-        for event in self.proc.get_events():
+    def _process_events(self, events):
+        """Process events from the P-ROC (switch state changes or notification that a DMD frame was updated)."""
+        switch_changes = []
+        for event in events:
             event_type = event['type']
             event_value = event['value']
             if event_type == self.pinproc.EventTypeDMDFrameDisplayed:
                 pass
             elif event_type == self.pinproc.EventTypeSwitchClosedDebounced:
-                self.machine.switch_controller.process_switch_by_num(
-                    state=1, num=event_value, platform=self)
+                switch_changes.append(SwitchChange(num=event_value, state=1, platform=self))
             elif event_type == self.pinproc.EventTypeSwitchOpenDebounced:
-                self.machine.switch_controller.process_switch_by_num(
-                    state=0, num=event_value, platform=self)
+                switch_changes.append(SwitchChange(num=event_value, state=0, platform=self))
             elif event_type == self.pinproc.EventTypeSwitchClosedNondebounced:
-                self.machine.switch_controller.process_switch_by_num(
-                    state=1, num=event_value, platform=self)
+                switch_changes.append(SwitchChange(num=event_value, state=1, platform=self))
             elif event_type == self.pinproc.EventTypeSwitchOpenNondebounced:
-                self.machine.switch_controller.process_switch_by_num(
-                    state=0, num=event_value, platform=self)
+                switch_changes.append(SwitchChange(num=event_value, state=0, platform=self))
             else:
                 self.log.warning("Received unrecognized event from the P-ROC. "
                                  "Type: %s, Value: %s", event_type, event_value)
 
-        self.proc.watchdog_tickle()
-        self.proc.flush()
+        if switch_changes:
+            self.machine.switch_controller.process_switch_changes(switch_changes)
 
 
 class PROCDMD(DmdPlatformInterface):
@@ -4,6 +4,7 @@ import asyncio
 import logging
 import platform
 import sys
+import threading
 import time
 from typing import Any, List, Union, Callable, Tuple
 
@@ -66,7 +67,7 @@ class PROCBasePlatform(LightsPlatform, SwitchPlatform, DriverPlatform, metaclass
     """
 
     __slots__ = ["pdbconfig", "pinproc", "proc", "log", "hw_switch_rules", "version", "revision", "hardware_version",
-                 "dipswitches", "machine_type"]
+                 "dipswitches", "machine_type", "_event_reader"]
 
     def __init__(self, machine):
         """Make sure pinproc was loaded."""
@@ -87,6 +88,7 @@ class PROCBasePlatform(LightsPlatform, SwitchPlatform, DriverPlatform, metaclass
         self.revision = None
         self.hardware_version = None
         self.dipswitches = None
+        self._event_reader = None
 
         self.machine_type = pinproc.normalize_machine_type(
             self.machine.config['hardware']['driverboards'])
@@ -108,10 +110,55 @@ class PROCBasePlatform(LightsPlatform, SwitchPlatform, DriverPlatform, metaclass
         that's attached to MPF.
         '''
 
+    @asyncio.coroutine
+    def start(self):
+        """Start the event reader thread if enabled.
+
+        Otherwise, events are read in tick.
+        """
+        if not self.config['use_separate_thread']:
+            return
+
+        self.features['tickless'] = True
+        self.machine.clock.schedule_interval(self._tickle_watchdog, self.config['watchdog_time'] / 4000)
+        self._event_reader = self.machine.clock.loop.run_in_executor(None, self._read_events)
+
     def stop(self):
         """Stop proc."""
         self.proc.reset(1)
 
+    def tick(self):
+        """Check the P-ROC/P3-ROC for any events.
+
+        Also tickles the watchdog and flushes any queued commands to the P-ROC/P3-ROC.
+        """
+        self._process_events(self.proc.get_events())
+        self.proc.watchdog_tickle()
+        self.proc.flush()
+
+    def _tickle_watchdog(self):
+        """Tickle the watchdog from the loop when events are read in a separate thread.
+
+        This will not happen when the loop stalls so the watchdog will still fire in that case.
+        """
+        self.proc.watchdog_tickle()
+
+    def _read_events(self):
+        """Poll pinproc for events in a separate thread and pass them to the loop in batches."""
+        loop = self.machine.clock.loop
+        poll_interval = self.config['event_poll_interval'] / 1000
+        while not self.machine.thread_stopper.is_set():
+            events = self.proc.get_events_from_thread()
+            if events:
+                loop.call_soon_threadsafe(self._process_events, events)
+            else:
+                time.sleep(poll_interval)
+
+    @abc.abstractmethod
+    def _process_events(self, events):
+        """Process events from pinproc."""
+        raise NotImplementedError()
+
     def connect(self):
         """Connect to the P-ROC.
 
@@ -139,6 +186,10 @@ class PROCBasePlatform(LightsPlatform, SwitchPlatform, DriverPlatform, metaclass
                       "Hardware Board ID: %s",
                       self.version, self.revision, self.hardware_version)
 
+        if self.config['use_separate_thread']:
+            # wrap proc before any device gets a reference to it
+            self.proc = PROCThreadSafeProc(self.proc, self.machine.clock.loop)
+
     @classmethod
     def _get_event_type(cls, sw_activity, debounced):
         if sw_activity == 0 and debounced:
@@ -369,6 +420,54 @@ class PROCBasePlatform(LightsPlatform, SwitchPlatform, DriverPlatform, metaclass
         return switch
 
 
+class PROCThreadSafeProc:
+
+    """Wraps pinproc.PinPROC when events are read in a separate thread.
+
+    All calls are serialised with a lock. Commands are flushed once per loop iteration after they have been queued
+    instead of once per tick.
+    """
+
+    __slots__ = ["_proc", "_loop", "_lock", "_flush_pending"]
+
+    # calls which do not queue any commands
+    read_methods = frozenset(["get_events", "read_data", "switch_get_states", "flush"])
+
+    def __init__(self, proc, loop):
+        """Initialise wrapper."""
+        self._proc = proc
+        self._loop = loop
+        self._lock = threading.Lock()
+        self._flush_pending = False
+
+    def __getattr__(self, name):
+        """Return a locked version of a pinproc method."""
+        attr = getattr(self._proc, name)
+        if not callable(attr):
+            return attr
+
+        def _call(*args, **kwargs):
+            with self._lock:
+                result = attr(*args, **kwargs)
+            if name not in self.read_methods and not self._flush_pending:
+                self._flush_pending = True
+                self._loop.call_soon(self._flush)
+            return result
+
+        return _call
+
+    def _flush(self):
+        """Flush all queued commands."""
+        self._flush_pending = False
+        with self._lock:
+            self._proc.flush()
+
+    def get_events_from_thread(self):
+        """Read events from the event reader thread."""
+        with self._lock:
+            return self._proc.get_events()
+
+
 class PDBConfig:
 
     """Handles PDB Config of the P/P3-Roc.
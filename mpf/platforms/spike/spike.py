@@ -14,7 +14,7 @@ from mpf.platforms.interfaces.driver_platform_interface import DriverPlatformInt
 from mpf.platforms.interfaces.switch_platform_interface import SwitchPlatformInterface
 from mpf.platforms.spike.spike_defines import SpikeNodebus
 from mpf.core.platform import SwitchPlatform, DriverPlatform, LightsPlatform, SwitchSettings, DriverSettings, \
-    DriverConfig, SwitchConfig, DmdPlatform
+    DriverConfig, SwitchConfig, DmdPlatform, SwitchChange
 
 
 class SpikeSwitch(SwitchPlatformInterface):
@@ -441,19 +441,19 @@ class SpikePlatform(SwitchPlatform, LightsPlatform, DriverPlatform, DmdPlatform)
 
         changes = self._inputs[node] ^ new_inputs
         if changes != 0:
+            switch_changes = []
             curr_bit = 1
             for index in range(0, 64):
                 if (curr_bit & changes) != 0:
-                    self.machine.switch_controller.process_switch_by_num(
-                        state=(curr_bit & new_inputs) == 0,
-                        num=str(node) + "-" + str(index),
-                        platform=self)
+                    switch_changes.append(SwitchChange(num=str(node) + "-" + str(index),
+                                                       state=(curr_bit & new_inputs) == 0,
+                                                       platform=self))
                 curr_bit <<= 1
+            self._inputs[node] = new_inputs
+            self.machine.switch_controller.process_switch_changes(switch_changes)
         elif self.debug:    # pragma: no cover
             self.log.debug("Got input activity but inputs did not change.")
 
-        self._inputs[node] = new_inputs
-
         return True
 
     @asyncio.coroutine
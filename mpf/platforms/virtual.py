@@ -118,9 +118,7 @@ class VirtualHardwarePlatform(AccelerometerPlatform, I2cPlatform, ServoPlatform,
             self.initial_states_sent = True
 
         else:
-            switches = [x for x in self.machine.switches if x.platform == self]
-
-            for switch in switches:
+            for switch in self.machine.switches.items_by_platform(self):
                 self.hw_switches[switch.hw_switch.number] = switch.state ^ switch.invert
 
         return self.hw_switches
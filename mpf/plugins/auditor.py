@@ -111,6 +111,9 @@ class Auditor:
             for name, value in audits.items():
                 self.machine.set_machine_var("audits_{}_{}".format(category, name), value)
 
+        # later changes are only journaled. start with a snapshot of all audits
+        self._save_audits()
+
     def audit(self, audit_class, event, **kwargs):
         """Log an auditable event.
 
@@ -131,7 +134,7 @@ class Auditor:
 
         self.current_audits[audit_class][event] += 1
         self.machine.set_machine_var("audits_{}_{}".format(audit_class, event), self.current_audits[audit_class][event])
-        self._save_audits()
+        self.data_manager.set_value((audit_class, event), self.current_audits[audit_class][event])
 
     def audit_switch(self, change: MonitoredSwitchChange):
         """Record switch change."""
@@ -155,7 +158,7 @@ class Auditor:
         del kwargs
 
         self.current_audits['events'][eventname] += 1
-        self._save_audits()
+        self.data_manager.set_value(('events', eventname), self.current_audits['events'][eventname])
 
     def audit_player(self, **kwargs):
         """Write player data to the audit log.
@@ -186,7 +189,8 @@ class Auditor:
                     (self.current_audits['player'][item]['total'] + 1))
 
                 self.current_audits['player'][item]['total'] += 1
-        self._save_audits()
+
+            self.data_manager.set_value(('player', item), self.current_audits['player'][item])
 
     @classmethod
     def _merge_into_top_list(cls, new_item, current_list, num_items):
@@ -22,6 +22,28 @@ class TestBallDeviceRouting(MpfTestCase):
         del kwargs
         self._captured += balls
 
+    def test_routing_table(self):
+        routing_table = self.machine.ball_controller.routing_table
+        trough1 = self.machine.ball_devices['test_trough1']
+        trough2 = self.machine.ball_devices['test_trough2']
+        launcher = self.machine.ball_devices['test_launcher']
+        target1 = self.machine.ball_devices['test_target1']
+        drain = self.machine.ball_devices['test_drain']
+        playfield = self.machine.playfield
+
+        self.assertEqual([trough1, launcher, target1], list(trough1.find_path_to_target(target1)))
+        self.assertEqual([trough1, launcher, trough2, playfield], list(trough1.find_path_to_target(playfield)))
+        self.assertEqual(launcher, routing_table.get_next_hop(trough1, trough2))
+        self.assertFalse(target1.find_path_to_target(trough1))
+        self.assertIsNone(routing_table.get_next_hop(target1, trough1))
+
+        self.assertEqual(trough1, trough1.find_next_trough())
+        self.assertEqual(trough2, drain.find_next_trough())
+        self.assertFalse(target1.find_next_trough())
+
+        self.assertEqual(['test_trough1', 'test_launcher', 'test_target1'],
+                         routing_table.get_routes()['test_trough1']['test_target1'])
+
     def test_routing_to_pf_on_capture(self):
         c_launcher = self.machine.coils['c_launcher']
         c_launcher.pulse = MagicMock()
@@ -84,3 +106,43 @@ class TestBallDeviceRouting(MpfTestCase):
         self.advance_time_and_run(1)
 
         self.assertEqual(0, self._missing)
+
+
+class TestBallDeviceRoutingLoop(MpfTestCase):
+
+    def getConfigFile(self):
+        return 'test_ball_device_routing_loop.yaml'
+
+    def getMachinePath(self):
+        return 'tests/machine_files/ball_device/'
+
+    def test_routing_table_with_loop(self):
+        trough = self.machine.ball_devices['test_trough']
+        launcher = self.machine.ball_devices['test_launcher']
+        lock = self.machine.ball_devices['test_lock']
+        vuk = self.machine.ball_devices['test_vuk']
+        scoop = self.machine.ball_devices['test_scoop']
+        playfield = self.machine.playfield
+
+        # lock and vuk eject to each other. routes through the loop have to be complete for every device
+        self.assertEqual([trough, launcher, lock, scoop], list(trough.find_path_to_target(scoop)))
+        self.assertEqual([vuk, lock, scoop], list(vuk.find_path_to_target(scoop)))
+        self.assertEqual([lock, vuk], list(lock.find_path_to_target(vuk)))
+        self.assertEqual([vuk, lock], list(vuk.find_path_to_target(lock)))
+        self.assertEqual([lock, vuk, playfield], list(lock.find_path_to_target(playfield)))
+        self.assertEqual([trough, launcher, playfield], list(trough.find_path_to_target(playfield)))
+        self.assertFalse(scoop.find_path_to_target(lock))
+        self.assertFalse(vuk.find_path_to_target(trough))
+
+        self.assertEqual(trough, trough.find_next_trough())
+        self.assertFalse(vuk.find_next_trough())
+
+        # find the nearest source with a ball
+        self.assertFalse(scoop.find_one_available_ball())
+        trough.available_balls = 1
+        vuk.available_balls = 1
+        self.assertEqual([vuk, lock, scoop], list(scoop.find_one_available_ball()))
+        self.assertEqual([vuk, lock], list(lock.find_one_available_ball()))
+        vuk.available_balls = 0
+        self.assertEqual([trough, launcher, lock, scoop], list(scoop.find_one_available_ball()))
+        self.assertEqual([trough, launcher, lock, vuk], list(vuk.find_one_available_ball()))
@@ -1,6 +1,5 @@
 """Test the bcp interface."""
 import asyncio
-from unittest import mock
 
 from mpf.core.events import RegisteredHandler
 from mpf.tests.MpfBcpTestCase import MpfBcpTestCase
@@ -35,8 +34,7 @@ class TestBcpInterface(MpfBcpTestCase):
     def test_monitor_events(self):
 
         handler = CallHandler()
-        with mock.patch("uuid.uuid4", return_value="abc"):
-            self.machine.events.add_handler("test2", handler)
+        handler_key = self.machine.events.add_handler("test2", handler)
         self._bcp_external_client.reset_and_return_queue()
         self._bcp_external_client.send('monitor_start', {'category': 'events'})
         self.advance_time_and_run()
@@ -54,7 +52,7 @@ class TestBcpInterface(MpfBcpTestCase):
         self.assertIn(
             ('monitored_event', dict(event_name='test2', event_type=None,
                                      event_callback=None, event_kwargs={},
-                                     registered_handlers=[RegisteredHandler(callback='handler', priority=1, kwargs={}, key='abc', condition=None, blocking_facility=None)])),
+                                     registered_handlers=[RegisteredHandler(callback='handler', priority=1, kwargs={}, key=handler_key.key, condition=None, blocking_facility=None)])),
             queue)
 
         self.machine.events.post("test3", callback=handler)
@@ -132,6 +130,12 @@ class TestBcpInterface(MpfBcpTestCase):
                         "changes": ('state', 0, 1)}),
             queue)
 
+        # a change which is reverted within one update interval is not sent
+        self.release_switch_and_run("s_test", 0)
+        self.hit_switch_and_run("s_test", .1)
+        queue = self._bcp_external_client.reset_and_return_queue()
+        self.assertFalse([message for message in queue if message[0] == "device" and message[1]["name"] == "s_test"])
+
         # Now stop the monitor
         self._bcp_external_client.send('monitor_stop', {'category': 'devices'})
         self.advance_time_and_run()
@@ -1,7 +1,8 @@
 import unittest
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch, call
 
-from mpf.core.bcp.bcp_socket_client import decode_command_string, encode_command_string
+from mpf.core.bcp.bcp_socket_client import decode_command_string, encode_command_string, encode_command_frame, \
+    decode_command_frame, FRAME_MARKER, FRAME_HEADER
 from mpf.tests.MpfTestCase import MpfTestCase
 from mpf.tests.loop import MockQueueSocket
 
@@ -114,10 +115,16 @@ class MockBcpQueueSocket(MockQueueSocket):
     """Mock Queue Socket for BCP which emulates reset."""
 
     def send(self, data):
-        if data == b'reset\n':
-            self.recv_queue.append(b'reset_complete\n')
-            return len(data)
-        return super().send(data)
+        # writes may contain multiple messages
+        lines = data.split(b'\n')
+        if b'reset' not in lines:
+            return super().send(data)
+
+        self.recv_queue.append(b'reset_complete\n')
+        remaining = b''.join(line + b'\n' for line in lines[:-1] if line != b'reset')
+        if remaining:
+            super().send(remaining)
+        return len(data)
 
 
 class TestBcpSocketClient(MpfTestCase):
@@ -174,6 +181,53 @@ class TestBcpSocketClient(MpfTestCase):
         self.client_socket.recv_queue.append(b'invalid_method?param1=1&param2=2\n')
         self.advance_time_and_run()
 
+    def testFastProtocol(self):
+        receiver = MagicMock()
+        self.machine.bcp.interface.register_command_callback("receive_bytes", receiver)
+
+        # remote side supports frames
+        self.client_socket.recv_queue.append(b'hello?version=1.1&fast_protocols=json_frames\n')
+        self.advance_time_and_run()
+        while not self.client_socket.send_queue.empty():
+            self.client_socket.send_queue.get_nowait()
+
+        self.machine.bcp.transport.send_to_client(self._bcp_client, "test_cmd", value=1, text="a b")
+        self.advance_time_and_run()
+        data = self.client_socket.send_queue.get_nowait()
+        self.assertEqual(FRAME_MARKER, data[0:1])
+        body_length, bytes_length = FRAME_HEADER.unpack(data[1:1 + FRAME_HEADER.size])
+        self.assertEqual(len(data), 1 + FRAME_HEADER.size + body_length)
+        self.assertEqual(0, bytes_length)
+        self.assertEqual(("test_cmd", {"value": 1, "text": "a b"}),
+                         decode_command_frame(data[1 + FRAME_HEADER.size:]))
+
+        # frames with payload
+        data = b'0' * 4096
+        self.client_socket.recv_queue.append(encode_command_frame("receive_bytes", {"name": "frame", "rawbytes": data}))
+        # URL encoded commands still work
+        self.client_socket.recv_queue.append(b'receive_bytes?name=url\n')
+        self.advance_time_and_run()
+        self.assertEqual([call(name="frame", client=self._bcp_client, rawbytes=data),
+                          call(name="url", client=self._bcp_client)], receiver.call_args_list)
+
+    def testSlowClient(self):
+        self.advance_time_and_run()
+        self._bcp_client.exit_on_close = False
+        self._bcp_client.max_pending_bytes = 10000
+        transport = self._bcp_client._sender.transport
+        with patch.object(transport, "get_write_buffer_size", return_value=self._bcp_client.high_water_mark + 1):
+            # the remote side does not read. messages are kept back
+            for _ in range(9):
+                self.machine.bcp.transport.send_to_client(self._bcp_client, "test_cmd", text="a" * 1000)
+            self.advance_time_and_run(.1)
+            self.assertIn(self._bcp_client, self.machine.bcp.transport.get_all_clients())
+
+            # the client is dropped once too much is pending
+            self.machine.bcp.transport.send_to_client(self._bcp_client, "test_cmd", text="a" * 1000)
+            self.assertNotIn(self._bcp_client, self.machine.bcp.transport.get_all_clients())
+            self.assertEqual([], self._bcp_client._send_buffer)
+            self.advance_time_and_run(.1)
+
 
 class TestBcpSocketMultipleClients(MpfTestCase):
 
@@ -217,3 +271,22 @@ class TestBcpSocketMultipleClients(MpfTestCase):
         self.client_socket_2.recv_queue.append(b'receive_msg?param1=1&param2=2\n')
         self.advance_time_and_run()
         receiver.assert_called_once_with(param1="1", param2="2", client=self._bcp_client_2)
+
+    def testSendToAllClients(self):
+        self.advance_time_and_run()
+        for client_socket in (self.client_socket_1, self.client_socket_2):
+            while not client_socket.send_queue.empty():
+                client_socket.send_queue.get_nowait()
+
+        with patch("mpf.core.bcp.bcp_socket_client.encode_command_string",
+                   wraps=encode_command_string) as encode:
+            self.machine.bcp.transport.send_to_all_clients("test_cmd", value=1)
+            self.machine.bcp.transport.send_to_all_clients("test_cmd2")
+            # every message is encoded once for all clients
+            self.assertEqual(2, encode.call_count)
+
+        self.advance_time_and_run()
+        # both messages are written at once
+        for client_socket in (self.client_socket_1, self.client_socket_2):
+            self.assertEqual(1, client_socket.send_queue.qsize())
+            self.assertEqual(b'test_cmd?value=int:1\ntest_cmd2\n', client_socket.send_queue.get_nowait())
@@ -1,3 +1,6 @@
+import os
+import tempfile
+
 from mpf.core.utility_functions import Util
 from mpf.exceptions.ConfigFileError import ConfigFileError
 from mpf.tests.MpfTestCase import MpfTestCase
@@ -434,6 +437,61 @@ class TestConfig(MpfTestCase):
             validation_string, validation_failure_info, False)
         self.assertEqual('no', results)
 
+    def test_validation_cache(self):
+        self.add_to_config_validator(self.machine, 'cached_section', {
+            'value': ['single', 'int', '1'],
+            'colors': ['list', 'color', 'None'],
+            'template': ['single', 'template_int', '1'],
+        })
+        cache_file = os.path.join(tempfile.mkdtemp(), "test.mpf_validated_cache")
+        validator = self.machine.config_validator
+        validator.load_validation_cache(cache_file)
+
+        config1 = validator.validate_config("cached_section", {"value": "7", "colors": "red", "template": "3 + 4"})
+        self.assertEqual(7, config1['value'])
+        self.assertEqual([(255, 0, 0)], config1['colors'])
+        self.assertEqual(7, config1['template'].evaluate({}))
+        validator.save_validation_cache()
+        self.assertTrue(os.path.isfile(cache_file))
+
+        # load the cache into a fresh validator
+        validator._validation_cache = None
+        validator.load_validation_cache(cache_file)
+        self.assertEqual(1, len(validator._validation_cache))
+
+        source = {"value": "7", "colors": "red", "template": "3 + 4"}
+        config2 = validator.validate_config("cached_section", source)
+        self.assertIs(source, config2)
+        self.assertEqual(7, config2['value'])
+        self.assertEqual([(255, 0, 0)], config2['colors'])
+        # templates are created again
+        self.assertIsNot(config1['template'], config2['template'])
+        self.assertEqual(7, config2['template'].evaluate({}))
+        self.assertFalse(validator._validation_cache_changed)
+
+        # changed content is validated again
+        config3 = validator.validate_config("cached_section", {"value": "8"})
+        self.assertEqual(8, config3['value'])
+        self.assertTrue(validator._validation_cache_changed)
+
+        # only configs used since the last load are stored
+        validator.save_validation_cache()
+        validator.load_validation_cache(cache_file)
+        self.assertEqual(2, len(validator._validation_cache))
+        self.assertFalse(validator._used_validation_keys)
+
+    def test_build_spec_is_cached(self):
+        validator = self.machine.config_validator
+        spec = validator.build_spec("switches", "device")
+        self.assertIs(spec, validator.build_spec("switches", "device"))
+        self.assertIn("number", spec)
+        self.assertIn("label", spec)
+
+        # loading a device spec invalidates built specs
+        validator.load_device_config_spec("test_device", "test_value: single|int|1")
+        self.assertIsNot(spec, validator.build_spec("switches", "device"))
+        self.assertEqual({"test_value": 1}, validator.validate_config("test_device", {}))
+
     def test_config_merge(self):
         a = {"test": {"a": [1], "b": [2, 3]}, "test2": 2}
         b = {"test": {"a": [3], "c": 7}}
@@ -1,5 +1,6 @@
 """Test the bonus mode."""
 import os
+import tempfile
 import time
 from unittest.mock import mock_open, patch
 
@@ -103,3 +104,119 @@ class TestDataManager(MpfTestCase):
 
         self.assertEqual({}, manager.get_data("hallo"))
         self.assertEqual({}, manager.get_data("invalid"))
+
+    def _wait_for(self, condition):
+        for _ in range(1000):
+            if condition():
+                return
+            time.sleep(.01)
+        self.fail("Condition not met")
+
+    def test_journal(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            filename = os.path.join(tmp_dir, "data.yaml")
+            self.machine.config['mpf']['paths']['journal_test'] = filename
+            manager = DataManager(self.machine, "journal_test", min_wait_secs=0)
+
+            manager.save_all({"a": 1})
+            self._wait_for(lambda: os.path.isfile(filename))
+
+            # single changes only go to the journal
+            manager.set_value("b", 2)
+            manager.set_value(("c", "d"), 3)
+            manager.remove_key("a")
+            self.assertEqual({"b": 2, "c": {"d": 3}}, manager.get_data())
+
+            def journal_lines():
+                if not os.path.isfile(filename + ".journal"):
+                    return []
+                with open(filename + ".journal") as f:
+                    return f.readlines()
+
+            self._wait_for(lambda: len(journal_lines()) == 3)
+            self.assertEqual({"a": 1}, YamlInterface().load(filename))
+
+            # journal is replayed on load and compacted into the data file
+            manager2 = DataManager(self.machine, "journal_test", min_wait_secs=0)
+            self.assertEqual({"b": 2, "c": {"d": 3}}, manager2.get_data())
+            self._wait_for(lambda: not journal_lines())
+            self.assertEqual({"b": 2, "c": {"d": 3}}, YamlInterface().load(filename))
+
+    def test_journal_with_machine_vars(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            filename = os.path.join(tmp_dir, "machine_vars.yaml")
+            self.machine.config['mpf']['paths']['journal_test'] = filename
+            manager = DataManager(self.machine, "journal_test", min_wait_secs=0)
+
+            manager.save_all({})
+            self._wait_for(lambda: os.path.isfile(filename))
+
+            def journal_lines():
+                if not os.path.isfile(filename + ".journal"):
+                    return []
+                with open(filename + ".journal") as f:
+                    return f.readlines()
+
+            # values are journaled as yaml like in the data file. tuples stay tuples
+            manager.set_value("last_initials", {"value": ("A", "B", 3), "expire": None})
+            manager.set_value("on_string", {"value": "on", "expire": 1.5})
+            self._wait_for(lambda: len(journal_lines()) == 2)
+
+            manager2 = DataManager(self.machine, "journal_test", min_wait_secs=0)
+            self.assertEqual({"last_initials": {"value": ("A", "B", 3), "expire": None},
+                              "on_string": {"value": "on", "expire": 1.5}}, manager2.get_data())
+            self.assertIsInstance(manager2.get_data()["last_initials"]["value"], tuple)
+            self._wait_for(lambda: not journal_lines())
+            self.assertEqual(manager2.get_data(), YamlInterface().load(filename))
+
+            # values which do not fit in one line are written as snapshot
+            manager2.set_value("message", {"value": "line 1\nline 2", "expire": None})
+            self._wait_for(lambda: YamlInterface().load(filename).get("message"))
+            self.assertEqual({"value": "line 1\nline 2", "expire": None}, YamlInterface().load(filename)["message"])
+            self.assertFalse(journal_lines())
+
+    def test_journal_compaction_crash(self):
+        with tempfile.TemporaryDirectory() as tmp_dir, patch('mpf.core.data_manager._thread.start_new_thread'):
+            filename = os.path.join(tmp_dir, "data.yaml")
+            journal_filename = filename + ".journal"
+            self.machine.config['mpf']['paths']['journal_test'] = filename
+            manager = DataManager(self.machine, "journal_test", min_wait_secs=0)
+
+            manager.save_all({"a": {"b": 1}})
+            manager._write_changes()
+            manager.set_value(("a", "c"), 2)
+            manager.remove_key(("a", "b"))
+            manager._write_changes()
+
+            # crash after the journal has been rotated aside but before the snapshot has been written
+            manager._queue_change(None)
+            with patch('mpf.core.data_manager.FileManager.save', side_effect=OSError):
+                with self.assertRaises(OSError):
+                    manager._write_changes()
+            self.assertFalse(os.path.isfile(journal_filename))
+            self.assertTrue(os.path.isfile(journal_filename + ".1"))
+            self.assertEqual({"a": {"b": 1}}, YamlInterface().load(filename))
+
+            # the rotated journal is replayed and compacted on load
+            manager2 = DataManager(self.machine, "journal_test", min_wait_secs=0)
+            self.assertEqual({"a": {"c": 2}}, manager2.get_data())
+            manager2._write_changes()
+            self.assertFalse(os.path.isfile(journal_filename + ".1"))
+            self.assertEqual({"a": {"c": 2}}, YamlInterface().load(filename))
+
+            # crash after the snapshot has been written but before it replaced the data file
+            manager2.set_value("a", 5)
+            manager2._write_changes()
+            manager2._queue_change(None)
+            with patch.object(manager2, '_finish_snapshot', side_effect=OSError):
+                with self.assertRaises(OSError):
+                    manager2._write_changes()
+            self.assertTrue(os.path.isfile(journal_filename + ".1"))
+            self.assertTrue(os.path.isfile(os.path.join(tmp_dir, "data.snapshot.yaml")))
+            self.assertEqual({"a": {"c": 2}}, YamlInterface().load(filename))
+
+            # the complete snapshot wins. the rotated journal is not replayed on top of it
+            manager3 = DataManager(self.machine, "journal_test", min_wait_secs=0)
+            self.assertEqual({"a": 5}, manager3.get_data())
+            self.assertEqual(["data.yaml"], os.listdir(tmp_dir))
+            self.assertEqual({"a": 5}, YamlInterface().load(filename))
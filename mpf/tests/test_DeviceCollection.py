@@ -49,3 +49,74 @@ class TestDeviceCollection(MpfTestCase):
         self.assertEqual(led2, self.machine.lights.number('2'))
         self.assertEqual(led3, self.machine.lights.number('3'))
         self.assertEqual(led4, self.machine.lights.number('4'))
+
+    def test_multiple_tags(self):
+        led1 = self.machine.lights['led1']
+        led2 = self.machine.lights['led2']
+        led3 = self.machine.lights['led3']
+
+        self.assertEqual([led1], self.machine.lights.items_tagged_all(['tag1', 'tag2']))
+        self.assertEqual([led1, led2], self.machine.lights.items_tagged_all(['tag1']))
+        self.assertEqual([], self.machine.lights.items_tagged_all(['tag1', 'fake_tag']))
+        self.assertEqual([], self.machine.lights.items_tagged_all([]))
+
+        self.assertEqual([led1, led2, led3], self.machine.lights.items_tagged_any(['tag1', 'tag2']))
+        self.assertEqual([led1, led3], self.machine.lights.items_tagged_any(['tag2', 'fake_tag']))
+
+    def test_indexes_are_invalidated(self):
+        led1 = self.machine.lights['led1']
+        self.assertEqual([led1], self.machine.lights.items_tagged_all(['tag1', 'tag2']))
+        self.assertEqual(led1, self.machine.lights.number('1'))
+
+        # adding a device drops the indexes
+        new_light = Light(self.machine, "led5")
+        new_light.config = {'number': '5'}
+        new_light.tags = ['tag1', 'tag2']
+        self.machine.lights['led5'] = new_light
+        self.assertEqual([led1, new_light], self.machine.lights.items_tagged_all(['tag1', 'tag2']))
+        self.assertEqual(new_light, self.machine.lights.number('5'))
+
+        # and so does removing it
+        del self.machine.lights['led5']
+        self.assertEqual([led1], self.machine.lights.items_tagged_all(['tag1', 'tag2']))
+        with self.assertRaises(AssertionError):
+            self.machine.lights.number('5')
+
+    def test_platform_and_hw_number(self):
+        led1 = self.machine.lights['led1']
+        platform = list(led1.platforms)[0]
+        self.assertEqual(4, len(self.machine.lights.items_by_platform(platform)))
+        self.assertEqual([], self.machine.lights.items_by_platform(None))
+
+        driver = list(led1.hw_drivers.values())[0][0]
+        self.assertEqual(led1, self.machine.lights.hw_number(platform, driver.number))
+        with self.assertRaises(AssertionError):
+            self.machine.lights.hw_number(None, driver.number)
+
+
+class TestDeviceCollectionPlatforms(MpfTestCase):
+    def getConfigFile(self):
+        return 'test_device_collection_platforms.yaml'
+
+    def getMachinePath(self):
+        return 'tests/machine_files/device_collection/'
+
+    def get_platform(self):
+        return False
+
+    def test_hw_number_with_multiple_platforms(self):
+        mixed = self.machine.lights['mixed']
+        other = self.machine.lights['other']
+        virtual = self.machine.hardware_platforms['virtual']
+        smart_virtual = self.machine.hardware_platforms['smart_virtual']
+
+        self.assertEqual([mixed, other], self.machine.lights.items_by_platform(virtual))
+        self.assertEqual([mixed], self.machine.lights.items_by_platform(smart_virtual))
+
+        # channels are only indexed under their own platform
+        self.assertEqual(mixed, self.machine.lights.hw_number(virtual, "led-1"))
+        self.assertEqual(mixed, self.machine.lights.hw_number(virtual, "led-3"))
+        self.assertEqual(mixed, self.machine.lights.hw_number(smart_virtual, "led-2"))
+        self.assertEqual(other, self.machine.lights.hw_number(virtual, "led-2"))
+        with self.assertRaises(AssertionError):
+            self.machine.lights.hw_number(smart_virtual, "led-1")
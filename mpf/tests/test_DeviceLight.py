@@ -1,5 +1,8 @@
 """Test the LED device."""
+from unittest.mock import patch
+
 from mpf.core.rgb_color import RGBColor
+from mpf.devices.light import Light
 from mpf.tests.MpfTestCase import MpfTestCase
 
 
@@ -422,3 +425,38 @@ class TestDeviceLight(MpfTestCase):
         self.assertEqual(80 / 255.0, led.hw_drivers["red"][0].current_brightness)
         self.assertEqual(80 / 255.0, led.hw_drivers["green"][0].current_brightness)
         self.assertEqual(80 / 255.0, led.hw_drivers["blue"][0].current_brightness)
+
+    def test_color_cache(self):
+        led = self.machine.lights.led1
+        profile = self.machine.light_controller.light_color_correction_profiles["correction_profile_1"]
+
+        with patch.object(Light, "_get_color_and_fade", autospec=True,
+                          side_effect=Light._get_color_and_fade) as get_color_and_fade:
+            def assert_channels(color):
+                get_color_and_fade.reset_mock()
+                for _ in range(2):
+                    self.assertEqual(color.red / 255.0, led.hw_drivers["red"][0].current_brightness)
+                    self.assertEqual(color.green / 255.0, led.hw_drivers["green"][0].current_brightness)
+                    self.assertEqual(color.blue / 255.0, led.hw_drivers["blue"][0].current_brightness)
+                # all channels share one evaluation of the stack
+                self.assertEqual(1, get_color_and_fade.call_count)
+
+            led.color(RGBColor((100, 50, 10)))
+            assert_channels(RGBColor((100, 50, 10)))
+
+            # all changes below happen without advancing the clock
+            led.color(RGBColor((10, 20, 30)), priority=2, key="test")
+            assert_channels(RGBColor((10, 20, 30)))
+
+            led.remove_from_stack_by_key("test")
+            assert_channels(RGBColor((100, 50, 10)))
+
+            led._set_color_correction_profile(profile)
+            assert_channels(profile.apply(RGBColor((100, 50, 10))))
+            led._set_color_correction_profile(None)
+
+            self.machine.set_machine_var("brightness", 0.5)
+            assert_channels(RGBColor((50, 25, 5)))
+
+            led.clear_stack()
+            assert_channels(RGBColor((0, 0, 0)))
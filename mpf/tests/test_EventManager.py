@@ -1,5 +1,6 @@
 """Test event manager."""
 from mpf.core.delays import DelayManager
+from mpf.core.events import EventManager
 from mpf.core.settings_controller import SettingEntry
 from mpf.tests.MpfFakeGameTestCase import MpfFakeGameTestCase
 from mpf.tests.MpfTestCase import MpfTestCase
@@ -214,6 +215,43 @@ class TestEventManager(MpfFakeGameTestCase, MpfTestCase):
         self.assertEqual(self._handlers_called[0], self.event_handler2)
         self.assertEqual(self._handlers_called[1], self.event_handler1)
 
+    def _handler_adds_handler(self, **kwargs):
+        del kwargs
+        self._handlers_called.append(self._handler_adds_handler)
+        self.machine.events.add_handler('test_event', self.event_handler2, priority=0)
+
+    def test_dispatch_plan(self):
+        # handlers with and without kwargs/conditions run in priority order
+        self.machine.events.add_handler('test_event', self.event_handler1, priority=3)
+        self.machine.events.add_handler('test_event', self.event_handler3, priority=2, test2='handler')
+        self.machine.events.add_handler('test_event{test1 == 2}', self.event_handler2, priority=1)
+
+        self.post_event_with_params('test_event', test1=1)
+        self.assertEqual([self.event_handler1, self.event_handler3], self._handlers_called)
+        self.assertEqual({'test1': 1}, self._handler1_kwargs)
+        self.assertEqual({'test1': 1, 'test2': 'handler'}, self._handler3_kwargs)
+
+        self._handlers_called = []
+        self.post_event_with_params('test_event', test1=2)
+        self.assertEqual([self.event_handler1, self.event_handler3, self.event_handler2], self._handlers_called)
+
+        # the plan is rebuilt after removing a handler
+        self._handlers_called = []
+        self.machine.events.remove_handler(self.event_handler3)
+        self.post_event_with_params('test_event', test1=2)
+        self.assertEqual([self.event_handler1, self.event_handler2], self._handlers_called)
+
+    def test_handler_added_during_post(self):
+        # a handler added while the event is processed is only called on the next post
+        self.machine.events.add_handler('test_event', self._handler_adds_handler)
+
+        self.post_event('test_event')
+        self.assertEqual([self._handler_adds_handler], self._handlers_called)
+        self.assertEqual(0, self._handler2_called)
+
+        self.post_event('test_event')
+        self.assertEqual(1, self._handler2_called)
+
     def test_remove_handler_by_handler(self):
         # tests that a handler can be removed by passing the handler to remove
         self.machine.events.add_handler('test_event', self.event_handler1)
@@ -341,6 +379,53 @@ class TestEventManager(MpfFakeGameTestCase, MpfTestCase):
         self.assertEqual(tuple(), self._handler2_args)
         self.assertEqual(dict(), self._handler2_kwargs)
 
+    def test_remove_handler_by_key_same_priority(self):
+        # handlers with the same priority are called in order of registration
+        # and only the handler with the key is removed
+        self.machine.events.add_handler('test_event', self.event_handler1)
+        key = self.machine.events.add_handler('test_event', self.event_handler2)
+        self.machine.events.add_handler('test_event', self.event_handler3)
+        self.machine.events.add_handler('test_event', self.event_handler2, priority=5)
+
+        self.post_event('test_event')
+        self.assertEqual([self.event_handler2, self.event_handler1, self.event_handler2, self.event_handler3],
+                         self._handlers_called)
+
+        self._handlers_called = []
+        self.machine.events.remove_handler_by_key(key)
+        # removing a key twice does nothing
+        self.machine.events.remove_handler_by_key(key)
+
+        self.post_event('test_event')
+        self.assertEqual([self.event_handler2, self.event_handler1, self.event_handler3], self._handlers_called)
+
+        self.machine.events.remove_handler(self.event_handler2)
+        self.machine.events.remove_handler(self.event_handler1)
+        self.machine.events.remove_handler(self.event_handler3)
+        self.assertFalse(self.machine.events.does_event_exist('test_event'))
+
+    def test_replace_handler(self):
+        self.machine.events.add_handler('test_event', self.event_handler1, test1=1)
+        self.machine.events.add_handler('test_event', self.event_handler1, test1=2)
+
+        self.machine.events.replace_handler('test_event', self.event_handler1, test1=2)
+        self.post_event('test_event')
+        self.assertEqual(2, self._handler1_called)
+
+        self.machine.events.replace_handler('test_event', self.event_handler1)
+        self.post_event('test_event')
+        self.assertEqual(3, self._handler1_called)
+
+    def test_handler_signature_checked_per_function(self):
+        def handler_without_kwargs(test):
+            del test
+
+        for _ in range(2):
+            with self.assertRaises(AssertionError):
+                self.machine.events.add_handler('test_event', handler_without_kwargs)
+
+        self.assertFalse(self.machine.events.does_event_exist('test_event'))
+
     def test_does_event_exist(self):
         self.machine.events.add_handler('test_event', self.event_handler1)
 
@@ -494,6 +579,58 @@ class TestEventManager(MpfFakeGameTestCase, MpfTestCase):
         self.assertEqual(self._handlers_called.count(self.event_handler1), 1)
         self.assertEqual(self._handlers_called.count(self.queue_callback), 1)
 
+    def test_queue_event_runs_inline(self):
+        # tests that queue handlers run without a task unless one waits and
+        # that handlers after a wait run once it is cleared
+        self.machine.events.add_handler('test_event', self.event_handler1, priority=3)
+        self.machine.events.add_handler('test_event', self.event_handler_add_queue, priority=2)
+        self.machine.events.add_handler('test_event', self.event_handler2, priority=1)
+        self.machine.events.add_handler('test_event2', self.event_handler3)
+
+        with patch.object(EventManager, "_resume_queue_event") as resume_queue_event:
+            self.machine.events.post_queue('test_event2', callback=self.queue_callback)
+            self.advance_time_and_run()
+            self.assertFalse(resume_queue_event.called)
+        self.assertEqual([self.event_handler3, self.queue_callback], self._handlers_called)
+
+        self._handlers_called = []
+        self.machine.events.post_queue('test_event', callback=self.queue_callback)
+        self.advance_time_and_run()
+        self.assertEqual([self.event_handler1, self.event_handler_add_queue], self._handlers_called)
+        self.assertFalse(self._queue.is_empty())
+
+        self.event_handler_clear_queue()
+        self.advance_time_and_run()
+        self.assertEqual([self.event_handler1, self.event_handler_add_queue, self.event_handler_clear_queue,
+                          self.event_handler2, self.queue_callback], self._handlers_called)
+
+    def test_queue_event_handlers_get_own_queue(self):
+        # handlers may keep their queue and use it later. this must not affect the queues of other handlers
+        queues = []
+
+        def _keep_queue1(queue, **kwargs):
+            del kwargs
+            queues.append(queue)
+
+        def _keep_queue2(queue, **kwargs):
+            del kwargs
+            queues.append(queue)
+
+        self.machine.events.add_handler('test_event', _keep_queue1, priority=2)
+        self.machine.events.add_handler('test_event', _keep_queue2, priority=1)
+        self.machine.events.post_queue('test_event', callback=self.queue_callback)
+        self.advance_time_and_run()
+        self.assertEqual([self.queue_callback], self._handlers_called)
+        self.assertEqual(2, len(queues))
+        self.assertIsNot(queues[0], queues[1])
+
+        queues[0].wait()
+        self.assertTrue(queues[1].is_empty())
+        queues[1].wait()
+        queues[0].clear()
+        self.assertFalse(queues[1].is_empty())
+        queues[1].clear()
+
     def test_queue_event_with_quick_queue_clear(self):
         # tests that a queue event that quickly creates and clears a queue
 
@@ -54,7 +54,8 @@ class TestFadecandy(MpfTestCase):
         return bytes(out)
 
     def _send_mock(self, message):
-        self._messages.append(message)
+        # channel buffers are sent without copying and change later
+        self._messages.append(bytes(message))
         return len(message)
 
     def assertOpenPixelLedsSent(self, leds1, leds2):
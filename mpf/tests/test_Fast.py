@@ -1,5 +1,6 @@
 from mpf.core.platform import SwitchConfig
 from mpf.core.rgb_color import RGBColor
+from mpf.platforms.fast.fast_led import FASTDirectLED, FASTDirectLEDChannel, FASTLEDFrameBuilder
 from mpf.tests.MpfTestCase import MpfTestCase, MagicMock
 
 from mpf.tests.loop import MockSerial
@@ -11,6 +12,7 @@ class BaseMockFast(MockSerial):
         super().__init__()
         self.type = None
         self.queue = []
+        self.writes = []
         self.expected_commands = {}
         self.ignore_commands = {}
 
@@ -32,30 +34,36 @@ class BaseMockFast(MockSerial):
 
     def write(self, msg):
         msg_len = len(msg)
-        cmd = msg.decode()
+        self.writes.append(msg)
         # strip newline
-        cmd = cmd[:-1]
+        cmds = msg.decode()[:-1]
 
         # ignore init garbage
-        if cmd == (' ' * 256 * 4):
+        if cmds == (' ' * 256 * 4):
             return msg_len
 
+        # multiple commands may be written at once
+        for cmd in cmds.split('\r'):
+            self._process_cmd(cmd)
+
+        return msg_len
+
+    def _process_cmd(self, cmd):
         if cmd[:3] == "WD:":
             self.queue.append("WD:P")
-            return msg_len
+            return
 
         if cmd in self.ignore_commands:
             self.queue.append(cmd[:3] + "P")
-            return msg_len
+            return
 
         if self._parse(cmd):
-            return msg_len
+            return
 
         if cmd in self.expected_commands:
             if self.expected_commands[cmd]:
                 self.queue.append(self.expected_commands[cmd])
             del self.expected_commands[cmd]
-            return msg_len
         else:
             raise Exception(self.type + ": " + str(cmd))
 
@@ -272,6 +280,23 @@ Board 3 - Model: FP-I/O-1616-2    Firmware: 01.00 Switches: 16 Drivers: 16
         self.advance_time_and_run(.1)
         self.assertFalse(self.net_cpu.expected_commands)
 
+    def test_write_batching(self):
+        # light update is queued first but driver commands are written before it in a single write
+        self.net_cpu.expected_commands = {
+            "L1:23,FF": "L1:P",
+            "DN:04,81,00,10,17,FF,00,00,00": "DN:P",
+            "TN:04,01": "TN:P"
+        }
+        self.net_cpu.writes = []
+        self.machine.default_platform.net_connection.send("L1:23,FF")
+        self.machine.coils.c_test.pulse()
+        self.advance_time_and_run(.1)
+        self.assertFalse(self.net_cpu.expected_commands)
+        batch = [write for write in self.net_cpu.writes if b"TN:04,01\r" in write][0]
+        self.assertIn(b"DN:04,81,00,10,17,FF,00,00,00\rTN:04,01\r", batch)
+        self.assertIn(b"L1:23,FF\r", batch)
+        self.assertLess(batch.index(b"TN:04,01\r"), batch.index(b"L1:23,FF\r"))
+
     def _test_long_pulse(self):
         # enable command
         self.net_cpu.expected_commands = {
@@ -403,25 +428,24 @@ Board 3 - Model: FP-I/O-1616-2    Firmware: 01.00 Switches: 16 Drivers: 16
         self.assertFalse(self.net_cpu.expected_commands)
 
     def test_firmware_update(self):
-        commands = []
-
         def _catch_update(cmd):
-            commands.append(cmd)
+            del cmd
             return True
         parse_func = self.net_cpu._parse
         self.net_cpu._parse = _catch_update
         output = self.machine.default_platform.update_firmware()
         self.advance_time_and_run()
         self.net_cpu._parse = parse_func
-        # check if we send the dummy update
-        self.assertEqual(['BL:AA55\r>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>'
-                          '>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>'
-                          '>>>>>>>>>>>>>>>>>>>>>>>>>\rBL:AA55\r<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<'
-                          '<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<'
-                          '<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<\rBL:AA55\r>>>>>>>>>>>>>>>>>>>>>>>>>>>>>'
-                          '>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>'
-                          '>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>\rDUMMY UPDAT'
-                          'E'], commands)
+        # check if we send the dummy update as one raw write. the mock splits writes into commands but the update
+        # has to reach the bootloader unchanged
+        self.assertIn(b'BL:AA55\r>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>'
+                      b'>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>'
+                      b'>>>>>>>>>>>>>>>>>>>>>>>>>\rBL:AA55\r<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<'
+                      b'<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<'
+                      b'<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<\rBL:AA55\r>>>>>>>>>>>>>>>>>>>>>>>>>>>>>'
+                      b'>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>'
+                      b'>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>\rDUMMY UPDAT'
+                      b'E\r', self.net_cpu.writes)
         expected_output = """NET CPU is version 01.03
 Found an update to version 1.04 for the NET CPU. Will flash file firmware/FAST_NET_01_04_00.txt
 Update done.
@@ -685,6 +709,26 @@ Update done.
 
         self.assertFalse(self.dmd_cpu.expected_commands)
 
+    def test_led_frame_builder(self):
+        builder = FASTLEDFrameBuilder(2)
+        leds = [FASTDirectLED("0{}".format(number), 0) for number in range(3)]
+        for led in leds:
+            builder.add_led(led)
+
+        # all leds are sent initially and messages are split
+        self.assertEqual([b"RS:00000000,01000000\r", b"RS:02000000\r"], builder.build_messages())
+
+        # nothing changed
+        self.assertEqual([], builder.build_messages())
+
+        # only the changed led is sent
+        FASTDirectLEDChannel(leds[1], 0).set_fade(lambda fade_ms: (1.0, 0))
+        self.assertEqual([b"RS:0100ff00\r"], builder.build_messages())
+
+        # led is dirty but its color did not change
+        FASTDirectLEDChannel(leds[1], 2).set_fade(lambda fade_ms: (0.0, 0))
+        self.assertEqual([], builder.build_messages())
+
     def test_lights_and_leds(self):
         self._test_matrix_light()
         self._test_pdb_gi_light()
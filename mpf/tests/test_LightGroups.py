@@ -20,6 +20,38 @@ class TestLightGroups(MpfTestCase):
         self.assertLightColor("stripe1_light_3", "red")
         self.assertLightColor("stripe1_light_4", "red")
 
+    def test_fade(self):
+        stripe = self.machine.light_stripes['stripe1']
+        self.assertIs(stripe, self.machine.lights["stripe1_light_0"].light_group)
+        stripe.color(RGBColor("red"))
+        self.advance_time_and_run(1)
+
+        # all lights in the stripe are resolved in one batch and fade together
+        stripe.color(RGBColor("blue"), fade_ms=1000)
+        self.advance_time_and_run(.5)
+        for light in stripe.lights:
+            self.assertLightColor(light.name, [128, 0, 127])
+            self.assertAlmostEqual(128 / 255, light.hw_drivers["red"][0].current_brightness)
+            self.assertAlmostEqual(127 / 255, light.hw_drivers["blue"][0].current_brightness)
+            self.assertEqual(0, light.hw_drivers["green"][0].current_brightness)
+
+        self.advance_time_and_run(1)
+        for light in stripe.lights:
+            self.assertLightColor(light.name, "blue")
+            self.assertEqual(0, light.hw_drivers["red"][0].current_brightness)
+            self.assertEqual(1, light.hw_drivers["blue"][0].current_brightness)
+
+        # only lights which changed are resolved again
+        light0 = self.machine.lights["stripe1_light_0"]
+        light1 = self.machine.lights["stripe1_light_1"]
+        resolved_color = light1._resolved_color
+        light0.color(RGBColor([0, 255, 0]))
+        self.advance_time_and_run(.1)
+        self.assertEqual(1, light0.hw_drivers["green"][0].current_brightness)
+        self.assertEqual(0, light0.hw_drivers["blue"][0].current_brightness)
+        self.assertIs(resolved_color, light1._resolved_color)
+        self.assertEqual(1, light1.hw_drivers["blue"][0].current_brightness)
+
     def test_config(self):
         # stripe 1
         self.assertEqual("led-10-r", self.machine.lights["stripe1_light_0"].hw_drivers["red"][0].number)
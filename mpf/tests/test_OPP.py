@@ -25,23 +25,33 @@ class MockOppSocket(MockSerial):
         return True
 
     def write(self, msg):
-        if msg in self.permanent_commands:
-            self.queue.append(self.permanent_commands[msg])
-            return len(msg)
-
-        # print("Serial received: " + "".join("\\x%02x" % b for b in msg) + " len: " + str(len(msg)))
-        if msg not in self.expected_commands:
+        msg_len = len(msg)
+        # all pending commands of a chain are written in one frame
+        while msg:
+            cmd = self._find_command(msg)
+            if cmd in self.permanent_commands:
+                self.queue.append(self.permanent_commands[cmd])
+            else:
+                if self.expected_commands[cmd] is not False:
+                    self.queue.append(self.expected_commands[cmd])
+
+                del self.expected_commands[cmd]
+            msg = msg[len(cmd):]
+
+        return msg_len
+
+    def _find_command(self, msg):
+        """Return the longest known command at the start of msg."""
+        commands = [cmd for cmd in list(self.permanent_commands) + list(self.expected_commands)
+                    if isinstance(cmd, bytes) and msg.startswith(cmd)]
+        if not commands:
             self.crashed = True
             self.expected_commands = {"crashed"}
             print("Unexpected command: " + "".join("\\x%02x" % b for b in msg) + " len: " + str(len(msg)))
             raise AssertionError("Unexpected command: " + "".join("\\x%02x" % b for b in msg) +
                                  " len: " + str(len(msg)))
 
-        if self.expected_commands[msg] is not False:
-            self.queue.append(self.expected_commands[msg])
-
-        del self.expected_commands[msg]
-        return len(msg)
+        return max(commands, key=len)
 
     def __init__(self):
         super().__init__()
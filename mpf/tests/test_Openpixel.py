@@ -38,7 +38,8 @@ class TestOpenpixel(MpfTestCase):
         return bytes(out)
 
     def _send_mock(self, message):
-        self._messages.append(message)
+        # channel buffers are sent without copying and change later
+        self._messages.append(bytes(message))
         return len(message)
 
     def assertOpenPixelLedsSent(self, leds1, leds2):
@@ -81,3 +82,19 @@ class TestOpenpixel(MpfTestCase):
         self.machine.lights.test_led3.on()
         self.advance_time_and_run(1)
         self.assertOpenPixelLedsSent(None, {99: (255, 255, 255)})
+
+    def test_update_every_tick(self):
+        opc_client = self.machine.default_platform.opc_client
+        opc_client.update_every_tick = True
+        opc_client.last_sent = [self.machine.clock.get_time()] * 2
+
+        # unchanged channels are not sent
+        self.machine.lights.test_led.on()
+        self.advance_time_and_run(.1)
+        self.assertOpenPixelLedsSent({99: (255, 255, 255)}, None)
+
+        # but resent once per keepalive interval
+        self.advance_time_and_run(1)
+        self.assertEqual(2, len(self._messages))
+        self.assertIn(self._build_message(0, {99: (255, 255, 255)}), self._messages)
+        self.assertIn(self._build_message(1, {}), self._messages)
@@ -1,5 +1,5 @@
 from mpf.tests.MpfTestCase import MpfTestCase
-from unittest.mock import MagicMock, call
+from unittest.mock import MagicMock, call, patch
 from mpf.platforms import p_roc_common, p_roc
 
 
@@ -186,6 +186,8 @@ class TestPRoc(MpfTestCase):
         self._test_hw_rule_pulse()
         self._test_dmd_update()
         self._test_pdb_gi_light()
+        self._test_light_fades()
+        self._test_light_fade_exception()
         self._test_enable_exception()
 
         # test hardware scan
@@ -193,6 +195,36 @@ class TestPRoc(MpfTestCase):
 """
         self.assertEqual(info_str, self.machine.default_platform.get_info_string())
 
+    def test_thread_safe_proc(self):
+        proc = MagicMock()
+        loop = MagicMock()
+        wrapper = p_roc_common.PROCThreadSafeProc(proc, loop)
+
+        # reads do not need a flush
+        proc.read_data = MagicMock(return_value=5)
+        self.assertEqual(5, wrapper.read_data(0x00, 0x01))
+        self.assertFalse(loop.call_soon.called)
+
+        # writes are flushed once
+        wrapper.driver_pulse(23, 10)
+        wrapper.write_data(0x02, 0x01, 0)
+        proc.driver_pulse.assert_called_once_with(23, 10)
+        loop.call_soon.assert_called_once_with(wrapper._flush)
+        self.assertFalse(proc.flush.called)
+
+        wrapper._flush()
+        proc.flush.assert_called_once_with()
+
+        # events from the thread are passed to the loop
+        proc.get_events = MagicMock(return_value=[{'type': 1, 'value': 23}])
+        self.assertEqual([{'type': 1, 'value': 23}], wrapper.get_events_from_thread())
+
+        # events are processed in batches
+        self.assertFalse(self.machine.switch_controller.is_active("s_test"))
+        self.machine.default_platform._process_events([{'type': 1, 'value': 23}, {'type': 3, 'value': 24}])
+        self.assertTrue(self.machine.switch_controller.is_active("s_test"))
+        self.assertTrue(self.machine.switch_controller.is_active("s_test_no_debounce"))
+
     def _test_pulse_and_hold(self):
         self.assertEqual("PD-16 Board 1 Bank 1", self.machine.coils.c_test.hw_driver.get_board_name())
         # pulse coil A1-B1-2
@@ -424,6 +456,61 @@ class TestPRoc(MpfTestCase):
         device.hw_drivers["white"][0].driver.hw_driver.proc.driver_disable.assert_has_calls([
             call(num)])
 
+    def _test_light_fades(self):
+        matrix_light = self.machine.lights.test_pdb_light.hw_drivers["white"][0]
+        gi_light = self.machine.lights.test_gi.hw_drivers["white"][0]
+        self.machine.lights.test_pdb_light.clear_stack()
+        self.machine.lights.test_gi.clear_stack()
+        self.advance_time_and_run(.1)
+
+        # both lights share one fade scheduler and are advanced in the same tick
+        self.assertIs(matrix_light.fade_scheduler, gi_light.fade_scheduler)
+        scheduler = matrix_light.fade_scheduler
+        self.machine.lights.test_pdb_light.on(fade_ms=100)
+        self.advance_time_and_run(.005)
+        self.machine.lights.test_gi.on(fade_ms=100)
+        self.assertTrue(scheduler.is_fading(matrix_light))
+        self.assertTrue(scheduler.is_fading(gi_light))
+        self.assertEqual(1, len(scheduler._buckets))
+
+        self.advance_time_and_run(.05)
+        self.assertTrue(scheduler.is_fading(matrix_light))
+        self.assertTrue(scheduler.is_fading(gi_light))
+
+        # a new color without fade stops the fade
+        self.machine.lights.test_gi.off()
+        self.assertFalse(scheduler.is_fading(gi_light))
+        self.assertTrue(scheduler.is_fading(matrix_light))
+
+        self.advance_time_and_run(.1)
+        self.assertFalse(scheduler.is_fading(matrix_light))
+        self.assertFalse(scheduler._buckets)
+        self.assertLightColor("test_pdb_light", [255, 255, 255])
+        self.assertLightColor("test_gi", [0, 0, 0])
+
+    def _test_light_fade_exception(self):
+        matrix_light = self.machine.lights.test_pdb_light.hw_drivers["white"][0]
+        gi_light = self.machine.lights.test_gi.hw_drivers["white"][0]
+        scheduler = matrix_light.fade_scheduler
+        self.machine.lights.test_pdb_light.off()
+        self.machine.lights.test_gi.off()
+        self.advance_time_and_run(.1)
+
+        self.machine.lights.test_pdb_light.on(fade_ms=100)
+        self.machine.lights.test_gi.on(fade_ms=100)
+        with patch("mpf.devices.light.DriverLight.set_brightness", side_effect=AssertionError("Broken light")):
+            with self.assertRaises(AssertionError):
+                self.advance_time_and_run(.05)
+
+        # the failing channel is dropped and the other one keeps fading
+        self.assertFalse(scheduler.is_fading(gi_light))
+        self.assertTrue(scheduler.is_fading(matrix_light))
+
+        self.advance_time_and_run(.1)
+        self.assertFalse(scheduler.is_fading(matrix_light))
+        self.assertFalse(scheduler._buckets)
+        self.assertLightColor("test_pdb_light", [255, 255, 255])
+
     def test_load_wpc(self):
         # make sure p-roc properly initialises with WPC config
         pass
@@ -17,6 +17,23 @@ class TestPlaceholderManager(unittest.TestCase):
         template = p.build_int_template("a % 7", None)
         self.assertEqual(3, template.evaluate({"a": 10}))
 
+    def test_compiled_templates(self):
+        mock_machine = MagicMock()
+        p = PlaceholderManager(mock_machine)
+
+        # constant expressions are folded at build time
+        template = p.build_int_template("2 * 3 + 1", None)
+        self.assertEqual(7, template.template.constant)
+        self.assertEqual(7, template.evaluate({}))
+
+        # templates are only compiled once
+        self.assertIs(p.build_raw_template("a + 1").template, p.build_raw_template("a + 1").template)
+        self.assertEqual(3, p.build_raw_template("a + 1").evaluate({"a": 2}))
+
+        # errors in constant expressions still happen on evaluation
+        template = p.build_bool_template("1 + 'a' == 2", None)
+        self.assertIsNone(template.evaluate({}))
+
     def test_conditionals(self):
         mock_machine = MagicMock()
         p = PlaceholderManager(mock_machine)
@@ -1,8 +1,14 @@
 import unittest
+from unittest.mock import patch
 
 from mpf.core.rgba_color import RGBAColor
 
-from mpf.core.rgb_color import RGBColor, RGBColorCorrectionProfile
+from mpf.core.rgb_color import RGBColor, RGBColorCorrectionProfile, RGBColorBatch
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 
 class TestRGBColor(unittest.TestCase):
@@ -127,6 +133,51 @@ class TestRGBColor(unittest.TestCase):
         corrected_color = default_profile.apply(RGBColor((254, 254, 254)))
         self.assertEqual((252, 252, 252), corrected_color.rgb)
 
+    def _test_color_batch(self):
+        start_colors = RGBColorBatch([RGBColor((128, 64, 0)), (255, 255, 255), (169, 169, 169)])
+        end_colors = RGBColorBatch([(0, 32, 64), (0, 0, 0), (169, 169, 169)])
+        self.assertEqual(3, len(start_colors))
+
+        # blend works like RGBColor.blend
+        colors = RGBColorBatch.blend(start_colors, end_colors, [0.25, 0.5, 1.0])
+        self.assertEqual((96, 56, 16), colors.get_rgb(0))
+        self.assertEqual((128, 128, 128), colors.get_rgb(1))
+        self.assertEqual(RGBColor((169, 169, 169)), colors.get_color(2))
+        self.assertEqual(bytes([96, 56, 16, 128, 128, 128, 169, 169, 169]), colors.tobytes())
+
+        # brightness
+        self.assertEqual((48, 28, 8), colors.scale(0.5).get_rgb(0))
+        self.assertEqual((96, 56, 16), colors.scale(0).get_rgb(0))
+
+        # correction profiles work like RGBColorCorrectionProfile.apply
+        default_profile = RGBColorCorrectionProfile.default()
+        corrected_colors = default_profile.apply_batch(colors)
+        for index in range(3):
+            self.assertEqual(default_profile.apply(colors.get_color(index)).rgb, corrected_colors.get_rgb(index))
+        self.assertEqual((81, 81, 81), corrected_colors.get_rgb(2))
+
+        # all backends give the same results as the single color functions
+        start_rgbs = [(0, 0, 0), (255, 255, 255), (10, 200, 30), (255, 0, 127), (1, 2, 3)]
+        end_rgbs = [(255, 255, 255), (0, 0, 0), (200, 10, 30), (3, 255, 128), (254, 253, 252)]
+        fractions = [0.1, 0.33, 0.5, 0.77, 0.999]
+        colors = RGBColorBatch.blend(RGBColorBatch(start_rgbs), RGBColorBatch(end_rgbs), fractions)
+        scaled_colors = colors.scale(0.7)
+        corrected_colors = default_profile.apply_batch(scaled_colors)
+        for index, (start_rgb, end_rgb, fraction) in enumerate(zip(start_rgbs, end_rgbs, fractions)):
+            blended_color = RGBColor.blend(RGBColor(start_rgb), RGBColor(end_rgb), fraction)
+            self.assertEqual(blended_color.rgb, colors.get_rgb(index))
+            scaled_color = RGBColor([int(x * 0.7) for x in blended_color])
+            self.assertEqual(scaled_color.rgb, scaled_colors.get_rgb(index))
+            self.assertEqual(default_profile.apply(scaled_color).rgb, corrected_colors.get_rgb(index))
+
+    def test_color_batch(self):
+        with patch("mpf.core.rgb_color.numpy", None):
+            self._test_color_batch()
+
+    @unittest.skipUnless(numpy, "NumPy is not installed")
+    def test_color_batch_numpy(self):
+        self._test_color_batch()
+
     def test_init_and_equal(self):
         black = RGBColor("black")
         color = RGBColor([1, 2, 3])
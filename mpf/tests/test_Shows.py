@@ -534,6 +534,32 @@ class TestShows(MpfTestCase):
         self.assertEqual(copied_show[3]['lights'][self.machine.lights.led_01],
                          dict(color='midnightblue', fade=500, priority=0))
 
+    def test_shared_show_steps(self):
+        show = self.machine.shows['leds_color_token']
+
+        # steps without tokens are shared and not copied
+        self.assertIs(self.machine.shows['test_show1'].show_steps[0],
+                      self.machine.shows['test_show1'].get_show_step(0, dict(color1='blue')))
+
+        # steps with tokens are resolved once per set of tokens
+        step = show.get_show_step(0, dict(color1='blue', color2='green'))
+        self.assertEqual('blue', step['lights'][self.machine.lights.led_01]['color'])
+        self.assertEqual('(color1)', show.show_steps[0]['lights'][self.machine.lights.led_01]['color'])
+        self.assertIs(step, show.get_show_step(0, dict(color1='blue', color2='green')))
+        self.assertIsNot(step, show.get_show_step(0, dict(color1='red', color2='green')))
+        self.assertEqual('red', show.get_show_step(0, dict(color1='red', color2='green'))['lights'][
+            self.machine.lights.led_01]['color'])
+
+        # running shows share the steps of the show
+        running_show1 = show.play(show_tokens=dict(color1='blue', color2='green'))
+        running_show2 = show.play(show_tokens=dict(color1='red', color2='green'))
+        self.advance_time_and_run(.1)
+        self.assertIs(running_show1.show_steps, running_show2.show_steps)
+        running_show2.stop()
+        self.advance_time_and_run(.1)
+        self.assertLightColor("led_01", 'blue')
+        running_show1.stop()
+
     def test_show_player(self):
         # Basic show
         self.machine.events.post('play_test_show1')
@@ -644,6 +670,61 @@ class TestShows(MpfTestCase):
         self.advance_time_and_run(.5)
         self.assertLightColor("light", "off")
 
+    def test_synced_shows_share_step_timer(self):
+        self.advance_to_sync_ms(250)
+        self.advance_time_and_run(.01)
+        show1 = self.machine.shows['led_color'].play(show_tokens=dict(leds='led_01', color="red"), sync_ms=250)
+        self.advance_time_and_run(.01)
+        show2 = self.machine.shows['led_color'].play(show_tokens=dict(leds='led_02', color="blue"), sync_ms=250,
+                                                      priority=10)
+
+        # both shows start from the same loop callback
+        self.assertEqual(1, len(self.machine.show_controller._step_timers))
+        self.assertLightColor("led_01", "off")
+        self.assertLightColor("led_02", "off")
+
+        flush_light_sync = self.machine.light_controller.flush_light_sync
+        self.machine.light_controller.flush_light_sync = MagicMock(side_effect=flush_light_sync)
+        self.advance_to_sync_ms(250)
+        self.advance_time_and_run(.01)
+        self.assertLightColor("led_01", "red")
+        self.assertLightColor("led_02", "blue")
+        self.assertEqual(1, self.machine.light_controller.flush_light_sync.call_count)
+
+        # stopping one show keeps the other scheduled
+        show2.stop()
+        self.assertLightColor("led_02", "off")
+        show1.stop()
+        self.assertLightColor("led_01", "off")
+        self.assertFalse(self.machine.show_controller._step_timers)
+        self.assertFalse(self.machine.show_controller._scheduled_steps)
+        self.machine.light_controller.flush_light_sync = flush_light_sync
+
+    def test_show_step_exception(self):
+        controller = self.machine.show_controller
+        show1 = MagicMock()
+        show1.show_config.priority = 10
+        show2 = MagicMock()
+        show2.show_config.priority = 0
+        callback1 = MagicMock(side_effect=AssertionError("Step failed"))
+        callback2 = MagicMock()
+        step_time = self.machine.clock.get_time() + 1
+        step_key = controller.schedule_show_step(show1, callback1, step_time)
+        controller.schedule_show_step(show2, callback2, step_time)
+
+        # run the steps directly to catch the exception
+        controller._step_timers[step_key].cancel()
+        with self.assertRaises(AssertionError):
+            controller._run_show_steps(step_key)
+        self.assertTrue(callback1.called)
+        self.assertFalse(callback2.called)
+
+        # the step of the other show still runs
+        self.advance_time_and_run(.01)
+        callback2.assert_called_once_with()
+        self.assertFalse(controller._scheduled_steps)
+        self.assertFalse(controller._step_timers)
+
     def test_pause_resume_shows(self):
         self.machine.events.post('play_test_show1')
         # make sure show is advancing
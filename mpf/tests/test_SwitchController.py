@@ -1,5 +1,6 @@
 from unittest.mock import MagicMock
 
+from mpf.core.platform import SwitchChange
 from mpf.core.switch_controller import MonitoredSwitchChange
 
 from mpf.tests.MpfTestCase import MpfTestCase
@@ -50,6 +51,37 @@ class TestSwitchController(MpfTestCase):
         self.hit_switch_and_run("s_test", 1)
         monitor.assert_not_called()
 
+    def test_process_switch_changes(self):
+        monitor = MagicMock()
+        self.machine.switch_controller.add_monitor(monitor)
+        self.mock_event("test_active2")
+        platform = self.machine.default_platform
+
+        self.advance_time_and_run(1)
+        self.machine.switch_controller.process_switch_changes([
+            SwitchChange(num='1', state=1, platform=platform),
+            SwitchChange(num='2', state=1, platform=platform),
+            # NC switch without logical state
+            SwitchChange(num='4', state=1, platform=platform),
+            SwitchChange(num='123123123', state=1, platform=platform),
+        ])
+
+        # the event queue has been processed already
+        self.assertEventCalled("test_active2")
+        self.assertSwitchState("s_test", 1)
+        self.assertSwitchState("s_test_events", 1)
+        self.assertSwitchState("s_test_invert", 0)
+        self.assertEqual(self.machine.switches.s_test.last_change, self.machine.switches.s_test_events.last_change)
+
+        # the NC switch did not change
+        self.assertEqual(3, monitor.call_count)
+        monitor.assert_any_call(MonitoredSwitchChange(
+            name='s_test', label='%', platform=platform, num='1', state=1))
+        monitor.assert_any_call(MonitoredSwitchChange(
+            name='s_test_events', label='%', platform=platform, num='2', state=1))
+        monitor.assert_called_with(MonitoredSwitchChange(
+            name='123123123', label='<Platform.Virtual>-123123123', platform=platform, num='123123123', state=1))
+
     def test_wait_futures(self):
         self.hit_switch_and_run("s_test", 1)
         future = self.machine.switch_controller.wait_for_switch("s_test")
@@ -292,3 +324,34 @@ class TestSwitchController(MpfTestCase):
 
         self.advance_time_and_run(5)
         self.assertEqual(1, self.called2)
+
+    def test_timed_switch_handlers_with_chatter(self):
+        handler1 = MagicMock()
+        handler2 = MagicMock()
+        self.machine.switch_controller.add_switch_handler("s_test", handler1, ms=1000, state=1)
+        self.machine.switch_controller.add_switch_handler("s_test_events", handler2, ms=3000, state=1)
+
+        self.machine.switch_controller.process_switch("s_test_events", 1)
+        self.advance_time_and_run(.5)
+
+        # chatter on s_test only cancels handlers of s_test
+        for _ in range(100):
+            self.machine.switch_controller.process_switch("s_test", 1)
+            self.machine.switch_controller.process_switch("s_test", 0)
+        self.assertLess(len(self.machine.switch_controller._timed_switch_heap), 100)
+
+        self.machine.switch_controller.process_switch("s_test", 1)
+        self.advance_time_and_run(.9)
+        handler1.assert_not_called()
+        handler2.assert_not_called()
+
+        self.advance_time_and_run(.2)
+        handler1.assert_called_once_with()
+        handler2.assert_not_called()
+
+        # removing the handler cancels the pending entry
+        self.machine.switch_controller.remove_switch_handler("s_test_events", handler2, ms=3000, state=1)
+        self.advance_time_and_run(5)
+        handler1.assert_called_once_with()
+        handler2.assert_not_called()
+        self.assertFalse(self.machine.switch_controller._timed_switch_handlers)
@@ -16,6 +16,7 @@ class TestVirtualPinball(MpfTestCase):
         del self.machine_config_patches['bcp']
         self.machine_config_patches['bcp'] = dict()
         self.machine_config_patches['bcp']['connections'] = []
+        self._pending_lines = []
 
     def getConfigFile(self):
         return 'config.yaml'
@@ -32,8 +33,11 @@ class TestVirtualPinball(MpfTestCase):
 
     @asyncio.coroutine
     def _get_and_decode(self, client) -> Generator[int, None, Tuple[str, dict]]:
-        data = yield from client.send_queue.get()
-        return decode_command_string(data[0:-1].decode())
+        # one write may contain multiple messages
+        while not self._pending_lines:
+            data = yield from client.send_queue.get()
+            self._pending_lines.extend(data.split(b'\n')[:-1])
+        return decode_command_string(self._pending_lines.pop(0).decode())
 
     def _encode_and_send(self, client, cmd, **kwargs):
         client.recv_queue.append((encode_command_string(cmd, **kwargs) + '\n').encode())
@@ -53,6 +57,7 @@ class TestVirtualPinball(MpfTestCase):
 
         self.advance_time_and_run()
         client.send_queue = asyncio.Queue(loop=self.loop)
+        self._pending_lines = []
 
         self.machine.lights.test_light1.on()
 
@@ -62,6 +67,16 @@ class TestVirtualPinball(MpfTestCase):
         self.assertEqual("light", args['type'])
         self.assertEqual({'color': [255, 255, 255]}, args['state'])
 
+        # lights send their color while they fade
+        self.machine.lights.test_light1.off(fade_ms=200)
+        colors = []
+        while not colors or colors[-1] != [0, 0, 0]:
+            cmd, args = self.loop.run_until_complete(self._get_and_decode(client))
+            self.assertEqual("device", cmd)
+            self.assertEqual("test_light1", args['name'])
+            colors.append(args['state']['color'])
+        self.assertGreater(len(colors), 2)
+
         self.machine.coils.c_test.pulse()
         self.advance_time_and_run()
 
@@ -91,12 +106,7 @@ class TestVirtualPinball(MpfTestCase):
         self.assertEqual("0-1", args['number'])
 
         self.machine.flippers.f_test_single.enable()
-        cmd, args = self.loop.run_until_complete(self._get_and_decode(client))
-        self.assertEqual("device", cmd)
-        self.assertEqual("f_test_single", args['name'])
-        self.assertEqual("flipper", args['type'])
-        self.assertEqual({"enabled": True}, args['state'])
-
+        # driver events are sent right away. device updates follow once per device_monitor_update_ms
         cmd, args = self.loop.run_until_complete(self._get_and_decode(client))
         self.assertEqual("driver_event", cmd)
         self.assertEqual({'enable_switch_invert': False,
@@ -111,6 +121,12 @@ class TestVirtualPinball(MpfTestCase):
                           'coil_recycle': False,
                           'enable_switch_debounce': False}, args)
 
+        cmd, args = self.loop.run_until_complete(self._get_and_decode(client))
+        self.assertEqual("device", cmd)
+        self.assertEqual("f_test_single", args['name'])
+        self.assertEqual("flipper", args['type'])
+        self.assertEqual({"enabled": True}, args['state'])
+
         self.machine.flippers.f_test_single.disable()
         cmd, args = self.loop.run_until_complete(self._get_and_decode(client))
         self.assertEqual("driver_event", cmd)
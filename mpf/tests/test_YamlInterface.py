@@ -1,8 +1,12 @@
+import os
+import tempfile
 import unittest
 import ruamel.yaml as yaml
+
+from mpf.core.file_manager import FileManager
 from mpf.file_interfaces.yaml_roundtrip import YamlRoundtrip
 
-from mpf.file_interfaces.yaml_interface import MpfLoader
+from mpf.file_interfaces.yaml_interface import MpfLoader, YamlInterface
 
 
 class TestYamlInterface(unittest.TestCase):
@@ -118,3 +122,49 @@ float_1: 1.0
             if not type(v) is eval(k.split('_')[0]):
                 raise AssertionError('YAML value "{}" is {}, not {}'.format(v,
                     type(v), eval(k.split('_')[0])))
+
+    def test_default_loader(self):
+        # the (possibly libyaml based) default loader has to resolve values like the python loader
+        config = """
+str_1: +1
+str_2: 032
+str_3: on
+str_5: 123e45
+bool_1: yes
+bool_3: true
+int_1: 123
+float_1: 1.0
+null_1: ~
+list_1: [1, a, no]
+        """
+
+        self.assertEqual(yaml.load(config, Loader=MpfLoader), YamlInterface.process(config))
+
+        with self.assertRaises(KeyError):
+            YamlInterface.process("a: 1\na: 2\n")
+
+    def test_preload(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        files = []
+        for i in range(FileManager.min_files_for_preload):
+            filename = os.path.join(tmp_dir.name, "file{}.yaml".format(i))
+            with open(filename, "w") as f:
+                f.write("#show_version=5\n- time: 0\n  value: {}\n".format(i))
+            files.append(filename)
+
+        keys = [(filename, "#show_version=5") for filename in files]
+        for key in keys:
+            self.addCleanup(FileManager.preloaded_files.pop, key, None)
+
+        FileManager.preload(files, "#show_version=5")
+        for key in keys:
+            self.assertIn(key, FileManager.preloaded_files)
+
+        # the preloaded result is used once
+        with open(files[0], "w") as f:
+            f.write("#show_version=5\n- time: 0\n  value: changed\n")
+        self.assertEqual([{"time": 0, "value": 0}], FileManager.load(files[0], "#show_version=5"))
+        self.assertNotIn(keys[0], FileManager.preloaded_files)
+        self.assertEqual([{"time": 0, "value": "changed"}], FileManager.load(files[0], "#show_version=5"))
+        self.assertEqual([{"time": 0, "value": 1}], FileManager.load(files[1], "#show_version=5"))